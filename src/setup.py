@@ -56,6 +56,7 @@ setup(
         # crypto(jwt) packages
         "pycryptodome",
         "jwcrypto",
+        "cryptography",
         # utils packages
         "python-dateutil",
         "python-consul",
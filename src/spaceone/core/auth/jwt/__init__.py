@@ -4,8 +4,10 @@ from spaceone.core.error import *
 
 
 class JWTAuthenticator(Authenticator):
-    def __init__(self, key):
+    def __init__(self, key, backend=None):
         self._key = key
+        self._backend = backend
+        self._jwk = None
 
     def validate(self, token, options=None):
         if not self._key:
@@ -18,7 +20,13 @@ class JWTAuthenticator(Authenticator):
             options = {}
 
         try:
-            payload = JWTUtil.decode(token, self._key, options=options)
+            # The key is parsed once per authenticator
+            if self._jwk is None:
+                self._jwk = JWTUtil.load_jwk(self._key, self._backend)
+
+            payload = JWTUtil.decode(
+                token, self._jwk, options=options, backend=self._backend
+            )
         except Exception:
             raise ERROR_AUTHENTICATE_FAILURE(message="Token is invalid or expired.")
 
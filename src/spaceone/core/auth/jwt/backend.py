@@ -0,0 +1,209 @@
+import base64
+import json
+import time
+from typing import Any, Union
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from jwcrypto import jwk
+from jwcrypto import jwt as jwcrypto_jwt
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_CONFIGURATION
+
+__all__ = [
+    "BaseJWTBackend",
+    "JWCryptoBackend",
+    "CryptographyBackend",
+    "get_backend",
+    "register_backend",
+]
+
+_DEFAULT_BACKEND = "jwcrypto"
+
+# Same leeway of exp and nbf claims as jwcrypto
+_LEEWAY = 60
+
+
+class BaseJWTBackend(object):
+    def load_key(self, key: dict) -> Any:
+        """Returns the key object of a JWK dict, reused for encode and decode."""
+        raise NotImplementedError("load_key method not implemented!")
+
+    def encode(self, payload: dict, key: Any, algorithm: str) -> str:
+        raise NotImplementedError("encode method not implemented!")
+
+    def decode(self, token: str, key: Any, algorithm: str, options: dict) -> dict:
+        raise NotImplementedError("decode method not implemented!")
+
+
+class JWCryptoBackend(BaseJWTBackend):
+    def load_key(self, key: dict) -> jwk.JWK:
+        return jwk.JWK(**key)
+
+    def encode(self, payload: dict, key: jwk.JWK, algorithm: str) -> str:
+        # Create JWT object with claims and header
+        jwt_obj = jwcrypto_jwt.JWT(claims=payload, header={"alg": algorithm})
+
+        # Sign the token
+        jwt_obj.make_signed_token(key)
+
+        # Serialize to compact format
+        return jwt_obj.serialize()
+
+    def decode(self, token: str, key: jwk.JWK, algorithm: str, options: dict) -> dict:
+        # Create JWT object and deserialize
+        jwt_obj = jwcrypto_jwt.JWT(jwt=token, key=key, algs=[algorithm])
+
+        # Validate the token
+        verify_aud = options.get("verify_aud", False)
+        check_claims = None
+        if verify_aud and "aud" in options:
+            check_claims = {"aud": options["aud"]}
+
+        if check_claims:
+            jwt_obj._check_claims = check_claims
+
+        jwt_obj.validate(key)
+
+        # Parse claims from JSON string
+        return json.loads(jwt_obj.claims)
+
+
+class CryptographyBackend(BaseJWTBackend):
+    """RSA signatures verified directly with a preloaded key of cryptography."""
+
+    _HASH_ALGORITHMS = {
+        "RS256": hashes.SHA256,
+        "RS384": hashes.SHA384,
+        "RS512": hashes.SHA512,
+    }
+
+    def load_key(self, key: dict) -> Union[rsa.RSAPublicKey, rsa.RSAPrivateKey]:
+        if key.get("kty") != "RSA":
+            raise ValueError(f"Key type is not supported: {key.get('kty')}")
+
+        public_numbers = rsa.RSAPublicNumbers(
+            _b64_to_int(key["e"]), _b64_to_int(key["n"])
+        )
+
+        if "d" not in key:
+            return public_numbers.public_key()
+
+        return rsa.RSAPrivateNumbers(
+            p=_b64_to_int(key["p"]),
+            q=_b64_to_int(key["q"]),
+            d=_b64_to_int(key["d"]),
+            dmp1=_b64_to_int(key["dp"]),
+            dmq1=_b64_to_int(key["dq"]),
+            iqmp=_b64_to_int(key["qi"]),
+            public_numbers=public_numbers,
+        ).private_key()
+
+    def encode(self, payload: dict, key: rsa.RSAPrivateKey, algorithm: str) -> str:
+        header = _b64encode(_json_dumps({"alg": algorithm}))
+        claims = _b64encode(_json_dumps(payload))
+        signing_input = f"{header}.{claims}"
+
+        signature = key.sign(
+            signing_input.encode(), padding.PKCS1v15(), self._get_hash(algorithm)
+        )
+        return f"{signing_input}.{_b64encode(signature)}"
+
+    def decode(
+        self,
+        token: Union[str, bytes],
+        key: Union[rsa.RSAPublicKey, rsa.RSAPrivateKey],
+        algorithm: str,
+        options: dict,
+    ) -> dict:
+        if isinstance(token, bytes):
+            token = token.decode()
+
+        if isinstance(key, rsa.RSAPrivateKey):
+            key = key.public_key()
+
+        header_part, claims_part, signature_part = token.split(".")
+
+        header = json.loads(_b64decode(header_part))
+        if header.get("alg") != algorithm:
+            raise ValueError(f"Algorithm is not allowed: {header.get('alg')}")
+
+        # Raises InvalidSignature
+        key.verify(
+            _b64decode(signature_part),
+            f"{header_part}.{claims_part}".encode(),
+            padding.PKCS1v15(),
+            self._get_hash(algorithm),
+        )
+
+        claims = json.loads(_b64decode(claims_part))
+        if not isinstance(claims, dict):
+            raise ValueError("Claims is not a JSON object.")
+
+        self._check_claims(claims, options)
+        return claims
+
+    def _get_hash(self, algorithm: str) -> hashes.HashAlgorithm:
+        if algorithm not in self._HASH_ALGORITHMS:
+            raise ValueError(f"Algorithm is not supported: {algorithm}")
+
+        return self._HASH_ALGORITHMS[algorithm]()
+
+    @staticmethod
+    def _check_claims(claims: dict, options: dict) -> None:
+        now = time.time()
+
+        if claims.get("exp") is not None and int(claims["exp"]) < now - _LEEWAY:
+            raise ValueError(f"Token is expired at {claims['exp']}.")
+
+        if claims.get("nbf") is not None and int(claims["nbf"]) > now + _LEEWAY:
+            raise ValueError(f"Token is not valid before {claims['nbf']}.")
+
+        if options.get("verify_aud", False) and "aud" in options:
+            if "aud" not in claims:
+                raise ValueError("Claim aud is missing.")
+
+            token_audiences = _to_list(claims["aud"])
+            if not any(aud in token_audiences for aud in _to_list(options["aud"])):
+                raise ValueError(f"Invalid aud value: {claims['aud']}")
+
+
+_BACKENDS = {
+    "jwcrypto": JWCryptoBackend(),
+    "cryptography": CryptographyBackend(),
+}
+
+
+def register_backend(name: str, backend: BaseJWTBackend) -> None:
+    _BACKENDS[name] = backend
+
+
+def get_backend(name: str = None) -> BaseJWTBackend:
+    name = name or config.get_global("JWT_BACKEND") or _DEFAULT_BACKEND
+
+    if name not in _BACKENDS:
+        raise ERROR_CONFIGURATION(key=f"JWT_BACKEND ({name})")
+
+    return _BACKENDS[name]
+
+
+def _to_list(value) -> list:
+    return value if isinstance(value, list) else [value]
+
+
+def _json_dumps(data: dict) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    # Restore the padding of base64url
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _b64_to_int(data: str) -> int:
+    return int.from_bytes(_b64decode(data), "big")
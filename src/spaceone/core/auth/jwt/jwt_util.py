@@ -1,8 +1,10 @@
 import base64
 import json
+from typing import Any
 
 from jwcrypto import jwk
-from jwcrypto import jwt as jwcrypto_jwt
+
+from spaceone.core.auth.jwt.backend import get_backend
 
 
 class JWTUtil:
@@ -14,43 +16,40 @@ class JWTUtil:
         return private_jwk, public_jwk
 
     @staticmethod
-    def encode(payload: dict, private_jwk: dict, algorithm="RS256") -> str:
-        # Convert dict to JWK object
-        key = jwk.JWK(**private_jwk)
+    def load_jwk(key: dict, backend: str = None) -> Any:
+        # Parsing the key is expensive, reuse the returned key object of the backend
+        return get_backend(backend).load_key(key)
 
-        # Create JWT object with claims and header
-        jwt_obj = jwcrypto_jwt.JWT(claims=payload, header={"alg": algorithm})
+    @staticmethod
+    def encode(
+        payload: dict, private_jwk: Any, algorithm="RS256", backend: str = None
+    ) -> str:
+        jwt_backend = get_backend(backend)
 
-        # Sign the token
-        jwt_obj.make_signed_token(key)
+        # Convert dict to the key object of the backend
+        if isinstance(private_jwk, dict):
+            private_jwk = jwt_backend.load_key(private_jwk)
 
-        # Serialize to compact format
-        return jwt_obj.serialize()
+        return jwt_backend.encode(payload, private_jwk, algorithm)
 
     @staticmethod
-    def decode(token: str, public_jwk: dict, algorithm="RS256", options=None) -> dict:
+    def decode(
+        token: str,
+        public_jwk: Any,
+        algorithm="RS256",
+        options=None,
+        backend: str = None,
+    ) -> dict:
+        jwt_backend = get_backend(backend)
+
         if options is None:
             options = {}
 
-        # Convert dict to JWK object
-        key = jwk.JWK(**public_jwk)
-
-        # Create JWT object and deserialize
-        jwt_obj = jwcrypto_jwt.JWT(jwt=token, key=key, algs=[algorithm])
-
-        # Validate the token
-        verify_aud = options.get("verify_aud", False)
-        check_claims = None
-        if verify_aud and "aud" in options:
-            check_claims = {"aud": options["aud"]}
-
-        if check_claims:
-            jwt_obj._check_claims = check_claims
-
-        jwt_obj.validate(key)
+        # Convert dict to the key object of the backend
+        if isinstance(public_jwk, dict):
+            public_jwk = jwt_backend.load_key(public_jwk)
 
-        # Parse claims from JSON string
-        return json.loads(jwt_obj.claims)
+        return jwt_backend.decode(token, public_jwk, algorithm, options)
 
     @staticmethod
     def unverified_decode(token: str) -> dict:
@@ -7,6 +7,7 @@ from typing import List
 
 from spaceone.core import config, pygrpc, fastapi, utils, model
 from spaceone.core import plugin as plugin_srv
+from spaceone.core.model.mongo_model import MongoModel, index_advisor
 from spaceone.core import scheduler as scheduler_v1
 from spaceone.core.unittest.runner import RichTestRunner
 from spaceone.core.logger import set_logger
@@ -90,6 +91,25 @@ def run():
     multiple=True,
     help="Additional python path",
 )
+@click.option(
+    "--async",
+    "async_mode",
+    is_flag=True,
+    default=False,
+    help="Run gRPC server with asyncio (grpc.aio)",
+)
+@click.option(
+    "--prefork",
+    is_flag=True,
+    default=False,
+    help="Run gRPC server in multiple processes sharing the port",
+)
+@click.option(
+    "--prefork-workers",
+    type=int,
+    default=os.environ.get("SPACEONE_PREFORK_WORKERS"),
+    help="Number of worker processes in prefork mode [default: CPU count]",
+)
 def grpc_server(
     package,
     app_path=None,
@@ -98,6 +118,9 @@ def grpc_server(
     worker=None,
     config_file=None,
     module_path=None,
+    async_mode=False,
+    prefork=False,
+    prefork_workers=None,
 ):
     """Run a gRPC server"""
 
@@ -112,11 +135,17 @@ def grpc_server(
         worker=worker,
     )
 
-    # Initialize common modules
-    _init_common_modules()
+    if async_mode:
+        config.set_global(GRPC_ASYNC=True)
+
+    if prefork:
+        config.set_global(GRPC_PREFORK=True)
+
+    if prefork_workers:
+        config.set_global(GRPC_PREFORK_WORKERS=prefork_workers)
 
-    # Run gRPC server
-    pygrpc.serve()
+    # Run gRPC server (common modules are initialized in each worker process)
+    pygrpc.serve(initializer=_init_common_modules)
 
 
 @run.command()
@@ -326,6 +355,48 @@ def show_config(package, source_root=None, config_file=None, output=None):
     _print_config(output)
 
 
+@cli.command()
+@click.argument("package")
+@click.option(
+    "-f",
+    "--dump-file",
+    type=click.Path(exists=True),
+    multiple=True,
+    required=True,
+    help="Path of index advisor dump file (DATABASE_INDEX_ADVISOR.dump_path)",
+)
+@click.option(
+    "-c",
+    "--config-file",
+    type=click.Path(exists=True),
+    default=lambda: os.environ.get("SPACEONE_CONFIG_FILE"),
+    help="Path of config file",
+)
+@click.option(
+    "-s",
+    "--source-root",
+    type=click.Path(exists=True),
+    default=".",
+    help="Path of source root",
+    show_default=True,
+)
+@click.option(
+    "-o",
+    "--output",
+    default="yaml",
+    help="Output format",
+    type=click.Choice(["json", "yaml"]),
+    show_default=True,
+)
+def index_report(package, dump_file, source_root=None, config_file=None, output=None):
+    """Show recommended database indexes from observed queries"""
+    # Initialize config
+    _set_server_config(package, source_root, config_file=config_file)
+
+    # Print index report
+    _print_index_report(package, dump_file, output)
+
+
 @cli.command()
 @click.option("-c", "--config-file", type=str, help="Path of config file")
 @click.option(
@@ -465,12 +536,30 @@ def _print_config(output):
         print(utils.dump_yaml(data))
 
 
+def _print_index_report(package, dump_files, output):
+    model_path = config.get_global("DATABASE_MODEL_PATH", "model")
+    __import__(f"{package}.{model_path}", fromlist=["*"])
+
+    observations = index_advisor.load(*dump_files)
+    data = {
+        "INDEX_REPORT": index_advisor.make_report(
+            MongoModel.__subclasses__(), observations
+        )
+    }
+
+    if output == "json":
+        print(utils.dump_json(data, indent=4))
+    else:
+        print(utils.dump_yaml(data))
+
+
 def _init_common_modules() -> None:
     # Enable logging configuration
     set_logger()
 
     # Set OTel Tracer and Metric
     set_tracer()
+    set_metric()
 
     # Connect all databases
     model.init_all()
@@ -17,6 +17,74 @@ MOCK_MODE = False
 
 # gRPC Configuration
 GRPC_APP_PATH = '{package}.interface.grpc:app'
+GRPC_ASYNC = False  # Run gRPC server with grpc.aio (sync servicer methods run in MAX_WORKERS threads)
+GRPC_PREFORK = False  # Run gRPC server in multiple processes sharing the port (SO_REUSEPORT)
+GRPC_PREFORK_WORKERS = None  # Number of worker processes (default: CPU count)
+GRPC_ADMISSION_CONTROL = {
+    'enabled': False,
+    'max_concurrency': None,  # Global in-flight limit (default: MAX_WORKERS), set it lower to keep threads free
+    'queue_timeout': 1.0,  # Max seconds to wait for a worker thread (sync) or a slot (async, capped by the client deadline)
+    'low_priority_ratio': 0.8,  # Low priority methods may use up to this ratio of the global limit
+    'adaptive': {
+        'enabled': False,  # Adjust each method's limit by AIMD on observed latency
+        'min_limit': 1,
+        'tolerance': 2.0,  # Decrease when average latency > min latency * tolerance
+        'backoff_ratio': 0.9,
+        'smoothing': 0.2
+    },
+    'methods': {
+        # 'Cost.analyze': {'max_concurrency': 10, 'priority': 'low'}
+    }
+}
+GRPC_DRAIN_PERIOD = 5  # Seconds to report NOT_SERVING before stopping the server on SIGTERM
+GRPC_SHUTDOWN_GRACE = 30  # Seconds to wait for in-flight RPCs on shutdown
+GRPC_SERVER = {
+    'compression': None,  # Response compression for clients accepting it: 'gzip' | 'deflate'
+    'compression_threshold': 1024,  # Responses smaller than this (bytes) are not compressed
+    'max_message_length': None,  # Max send/receive message size (default: 4MB receive)
+    'keepalive_time_ms': None,
+    'keepalive_timeout_ms': None,
+    'keepalive_permit_without_calls': None,
+    'min_recv_ping_interval_without_data_ms': None,  # Must allow keepalive_time_ms of the clients
+    'max_pings_without_data': None,
+    'max_connection_idle_ms': None,
+    'max_connection_age_ms': None,  # Lets clients rebalance over new server instances
+    'max_connection_age_grace_ms': None,
+    'http2_lookahead_bytes': None,  # Initial HTTP/2 stream window size
+    'http2_bdp_probe': None,  # Window sizes are tuned by BDP probing unless it is 0
+    'http2_max_frame_size': None
+}
+
+# gRPC Client Configuration
+GRPC_CLIENT = {
+    'pool_size': 1,  # Channels (TCP connections) per endpoint, used in round-robin
+    'compression': None,  # Request compression: 'gzip' | 'deflate'
+    'compression_threshold': 1024,  # Requests smaller than this (bytes) are not compressed
+    'max_message_length': None,  # Overrides max_message_length of the caller
+    'lb_policy': None,  # 'round_robin': balance over all addresses resolved by DNS (default: pick_first)
+    'keepalive_time_ms': None,  # Server must allow it (grpc.http2.min_recv_ping_interval_without_data_ms)
+    'keepalive_timeout_ms': None,
+    'keepalive_permit_without_calls': None,
+    'max_reconnect_backoff_ms': 10000,  # Channels reconnect by themselves, they are not recreated on errors
+    'http2_lookahead_bytes': None,  # Initial HTTP/2 stream window size
+    'http2_bdp_probe': None,  # Window sizes are tuned by BDP probing unless it is 0
+    'http2_max_frame_size': None,
+    'descriptor_cache_path': None,  # Directory to persist reflection descriptors per endpoint and server version
+    'retry': {
+        'max_retries': 2,  # Only for connection errors and timeouts of idempotent methods
+        'initial_backoff': 0.1,  # Seconds, exponential backoff with full jitter
+        'max_backoff': 2.0,
+        'backoff_multiplier': 2.0,
+        'budget_ratio': 0.1,  # Retries per request allowed by the token bucket of each endpoint
+        'budget_max_tokens': 10,
+        'idempotent_verbs': ['get', 'list', 'stat', 'analyze', 'check', 'verify', 'get_versions']
+    },
+    'circuit_breaker': {
+        'enabled': True,  # Fail fast while the endpoint is down
+        'failure_threshold': 5,  # Consecutive connection errors (UNAVAILABLE) to open the circuit
+        'reset_timeout': 10  # Seconds before a probe request is let through
+    }
+}
 
 # gRPC Extension APIs
 GRPC_EXTENSION_SERVICERS = {
@@ -24,6 +92,9 @@ GRPC_EXTENSION_SERVICERS = {
     'spaceone.core.pygrpc.extension.server_info': ['ServerInfo']
 }
 
+# Scheduler Configuration
+SCHEDULER_SHUTDOWN_GRACE = 30  # Seconds to wait for running tasks on SIGTERM
+
 # REST Configuration
 REST_APP_PATH = '{package}.interface.rest:app'
 
@@ -51,6 +122,9 @@ UVICORN_OPTIONS = {
 # Plugin Configuration
 PLUGIN_APP_PATH = '{package}.main:app'
 
+# Authentication Configuration
+JWT_BACKEND = 'jwcrypto'  # jwcrypto | cryptography (verifies RS256 with a preloaded RSA key)
+
 # Handler Configuration
 HANDLERS = {
     'authentication': [],
@@ -61,16 +135,38 @@ HANDLERS = {
 
 # Logging Configuration
 LOG = {}
+LOG_ASYNC = {
+    'enabled': False,  # Log handlers run in a listener thread instead of the request thread
+    'queue_size': 10000  # Records are dropped while the queue is full, and reported as a warning
+}
+LOG_PAYLOAD_SAMPLE_RATE = 1.0  # Ratio of requests logged with parameters and JSON response size (cost grows with the payload)
 
 # OpenTelemetry Configuration
 OTEL = {
-    'endpoint': None
+    'endpoint': None,
+    'metric_enabled': False,
+    'handler_span_enabled': True  # Span per handler call in the service pipeline
 }
 
 # Database Configuration
 DATABASE_MODEL_PATH = 'model'
 DATABASE_AUTO_CREATE_INDEX = True
 DATABASE_NAME_PREFIX = ''
+DATABASE_INDEX_CREATION = {
+    'mode': 'sync',         # sync | parallel | background
+    'max_workers': 4,
+    'skip_existing': False  # compare with list_indexes() and skip existing indexes
+}
+DATABASE_READ_YOUR_WRITES = {
+    'enabled': False,   # route reads to the primary after writes in the same transaction or token
+    'window': 5,        # seconds
+    'max_size': 10000
+}
+DATABASE_INDEX_ADVISOR = {
+    'enabled': False,
+    # 'dump_path': '/tmp/index_advisor.{pid}.json',
+    # 'dump_interval': 60
+}
 DATABASES = {
     'default': {
         'engine': 'MongoModel',
@@ -79,9 +175,17 @@ DATABASES = {
         # 'port': 27017,
         # 'db': '<db>',
         # 'username': '<user>',
-        # 'password': '<password>'
+        # 'password': '<password>',
+        # Connection Pool (default: derived from MAX_WORKERS)
+        # 'max_pool_size': 100,
+        # 'min_pool_size': 10,
+        # 'max_idle_time_ms': 300000,
+        # 'wait_queue_timeout_ms': 10000
     }
 }
+DATABASE_MONITORING = {
+    'enabled': False    # export connection pool and command metrics to OpenTelemetry
+}
 
 # Cache Configuration
 CACHES = {
@@ -0,0 +1,103 @@
+import copy
+import threading
+from typing import Any, Callable, Hashable
+
+__all__ = ["BatchLoader"]
+
+
+class _Batch(object):
+    def __init__(self):
+        self.keys = {}
+        self.results = None
+        self.error = None
+        self.is_closed = False
+        self.is_full = threading.Event()
+        self.is_done = threading.Event()
+
+    def add(self, key: Any) -> None:
+        self.keys[key] = self.keys.get(key, 0) + 1
+
+
+class BatchLoader(object):
+    """Coalesces concurrent lookups into one batch call, like a DataLoader.
+
+    The first caller of a group becomes the leader of the batch. It waits for
+    `window` seconds (or until the batch is full) while the other callers add
+    their keys, then calls `batch_fn(keys)` once and hands out the results.
+    """
+
+    def __init__(self):
+        self._batches = {}
+        self._lock = threading.Lock()
+
+    def load(
+        self,
+        group_key: Hashable,
+        key: Any,
+        batch_fn: Callable[[list], dict],
+        window: float = 0.002,
+        max_batch_size: int = 100,
+        timeout: float = None,
+    ) -> Any:
+        """Returns the result of the key, or raises KeyError if it is not found.
+
+        batch_fn receives the unique keys of a batch and returns {key: result}.
+        """
+
+        with self._lock:
+            batch = self._batches.get(group_key)
+            is_leader = batch is None
+
+            if is_leader:
+                batch = _Batch()
+                self._batches[group_key] = batch
+
+            batch.add(key)
+
+            if len(batch.keys) >= max_batch_size:
+                self._close_batch(group_key, batch)
+
+        if is_leader:
+            # Woken up as soon as a caller fills the batch up to max_batch_size
+            batch.is_full.wait(window)
+
+            with self._lock:
+                self._close_batch(group_key, batch)
+
+            self._execute(batch, batch_fn)
+
+        elif not batch.is_done.wait(timeout):
+            raise TimeoutError(f"Batch call is not finished. (key = {key})")
+
+        return self._get_result(batch, key)
+
+    def _close_batch(self, group_key: Hashable, batch: _Batch) -> None:
+        # Callers after this point start a new batch
+        if not batch.is_closed:
+            batch.is_closed = True
+            batch.is_full.set()
+
+            if self._batches.get(group_key) is batch:
+                del self._batches[group_key]
+
+    @staticmethod
+    def _execute(batch: _Batch, batch_fn: Callable[[list], dict]) -> None:
+        try:
+            batch.results = batch_fn(list(batch.keys))
+        except Exception as e:
+            batch.error = e
+        finally:
+            batch.is_done.set()
+
+    @staticmethod
+    def _get_result(batch: _Batch, key: Any) -> Any:
+        if batch.error:
+            raise batch.error
+
+        result = batch.results[key]
+
+        # Callers of the same key must not share a mutable result
+        if batch.keys[key] > 1:
+            return copy.deepcopy(result)
+
+        return result
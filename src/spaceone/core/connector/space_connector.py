@@ -1,21 +1,39 @@
+import asyncio
+import contextvars
+import copy
+import json
 import types
 import logging
-from typing import Any, List, Tuple
-from google.protobuf.json_format import MessageToDict
+import grpc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Tuple, Union
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 
 from spaceone.core.connector import BaseConnector
+from spaceone.core.connector.batch_loader import BatchLoader
 from spaceone.core import pygrpc
 from spaceone.core.utils import parse_grpc_endpoint
-from spaceone.core.pygrpc.client import GRPCClient
+from spaceone.core.pygrpc.client import GRPCClient, aio_channel
+from spaceone.core.pygrpc.message_converter import message_to_dict, dict_to_message
+from spaceone.core import utils
+from spaceone.core.transaction import (
+    bind_transaction,
+    unbind_transaction,
+    get_time_remaining,
+)
 from spaceone.core.error import *
 
-__all__ = ["SpaceConnector"]
+__all__ = ["SpaceConnector", "AsyncSpaceConnector"]
 
 _LOGGER = logging.getLogger(__name__)
 _TRACER = trace.get_tracer(__name__)
+_DEFAULT_TIMEOUT = 180
+_DEFAULT_MAX_MESSAGE_LENGTH = 1024 * 1024 * 256
+_DEFAULT_MEMO_VERBS = ["get", "list", "stat"]
+_BATCH_LOADER = BatchLoader()
+
 
 class SpaceConnector(BaseConnector):
     name = "SpaceConnector"
@@ -40,6 +58,16 @@ class SpaceConnector(BaseConnector):
         self._client = None
         self._endpoints: dict = self.config.get("endpoints", {})
 
+        # e.g. {"window": 0.002, "methods": {"Project.get": {"key": "project_id"}}}
+        self._batch_conf: dict = self.config.get("batch", {})
+
+        # e.g. {"enabled": True, "verbs": ["get", "list", "stat"]}
+        self._memo_conf: dict = self.config.get("memo", {})
+
+        # e.g. {"compression": "gzip", "compression_threshold": 1024}
+        # overrides GRPC_CLIENT, "channels" overrides it per service
+        self._channel_conf: dict = self._get_channel_conf()
+
         self._verify()
         self._init_client()
 
@@ -51,6 +79,66 @@ class SpaceConnector(BaseConnector):
         with _TRACER.start_as_current_span(method, kind=SpanKind.CLIENT):
             return self._call_api(method, params, **kwargs)
 
+    def dispatch_many(
+        self,
+        requests: List[Tuple[str, dict]],
+        concurrency: int = 10,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> list:
+        """Dispatch [(method, params), ...] concurrently in a thread pool.
+
+        Results are returned in the order of the requests. If return_exceptions
+        is True, errors are returned in place of results instead of being raised.
+        """
+
+        if not requests:
+            return []
+
+        transaction = self.transaction
+        max_workers = min(concurrency, len(requests))
+        tasks = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for method, params in requests:
+                # Each task keeps the current span as the parent of its span
+                context = contextvars.copy_context()
+                tasks.append(
+                    executor.submit(
+                        context.run,
+                        self._dispatch_in_thread,
+                        transaction,
+                        method,
+                        params,
+                        kwargs,
+                    )
+                )
+
+            results = []
+            for task in tasks:
+                try:
+                    results.append(task.result())
+                except Exception as e:
+                    if not return_exceptions:
+                        # Do not start the requests which are still waiting
+                        for pending_task in tasks:
+                            pending_task.cancel()
+
+                        raise e
+
+                    results.append(e)
+
+            return results
+
+    def _dispatch_in_thread(self, transaction, method, params, kwargs):
+        # Token and deadline of the request are taken from the transaction
+        bind_transaction(transaction)
+
+        try:
+            return self.dispatch(method, params, **kwargs)
+        finally:
+            unbind_transaction()
+
     def _call_api(
         self,
         method: str,
@@ -65,17 +153,128 @@ class SpaceConnector(BaseConnector):
         params = params or {}
         metadata = self._get_connection_metadata(token, x_domain_id, x_workspace_id)
 
-        response_or_iterator = getattr(getattr(self._client, resource), verb)(
-            params, metadata=metadata
-        )
+        # Identical reads in the same transaction are answered from the memo
+        memo_key = self._make_memo_key(method, verb, params, metadata)
+        if memo_key:
+            response = self.transaction.get_memo(memo_key)
+            if response is not None:
+                return copy.deepcopy(response)
+        elif self._memo_conf.get("enabled", False) and not self._is_memo_verb(verb):
+            # Any other verb may change resources, reads are not answered from
+            # the memo of the service after that
+            self.transaction.clear_memo(self._get_memo_prefix())
 
-        if self._return_type == "dict":
-            if isinstance(response_or_iterator, types.GeneratorType):
-                return self._generate_response(response_or_iterator)
-            else:
-                return self._change_message(response_or_iterator)
+        if self._return_type == "bytes":
+            # Serialized responses are relayed without parsing (passthrough)
+            passthrough_method = self._client.get_passthrough_method(resource, verb)
+            return passthrough_method(params, metadata=metadata)
+
+        if batch_method_conf := self._get_batch_method_conf(method, params):
+            response = self._load_in_batch(method, params, metadata, batch_method_conf)
         else:
-            return response_or_iterator
+            response_or_iterator = getattr(getattr(self._client, resource), verb)(
+                params, metadata=metadata
+            )
+
+            if self._return_type != "dict":
+                return response_or_iterator
+            elif isinstance(response_or_iterator, types.GeneratorType):
+                return self._generate_response(response_or_iterator)
+
+            response = self._change_message(response_or_iterator)
+
+        if memo_key:
+            self.transaction.set_memo(memo_key, copy.deepcopy(response))
+
+        return response
+
+    def _make_memo_key(
+        self, method: str, verb: str, params: dict, metadata: list
+    ) -> Union[str, None]:
+        if not self._memo_conf.get("enabled", False) or self._return_type != "dict":
+            return None
+
+        if not self._is_memo_verb(verb):
+            return None
+
+        try:
+            # Credentials are a part of the key, since they may change the response
+            params_hash = utils.dict_to_hash(
+                {
+                    "params": params,
+                    "metadata": [item for item in metadata if item[0] != "traceparent"],
+                }
+            )
+        except TypeError:
+            return None
+
+        return f"{self._get_memo_prefix()}{method}:{params_hash}"
+
+    def _is_memo_verb(self, verb: str) -> bool:
+        return verb in self._memo_conf.get("verbs", _DEFAULT_MEMO_VERBS)
+
+    def _get_memo_prefix(self) -> str:
+        return f"space_connector:{self._get_endpoint()}:"
+
+    def _get_batch_method_conf(self, method: str, params: dict) -> Union[dict, None]:
+        if self._return_type != "dict":
+            return None
+
+        # The list call of a batch has its own query, "only" and filters of
+        # the caller can't be merged into it
+        if "query" in params:
+            return None
+
+        method_conf = self._batch_conf.get("methods", {}).get(method)
+        if method_conf and method_conf.get("key") in params:
+            return method_conf
+
+        return None
+
+    def _load_in_batch(
+        self, method: str, params: dict, metadata: list, method_conf: dict
+    ) -> dict:
+        """Coalesce concurrent lookups by key into one list call with $in filter."""
+
+        key = method_conf["key"]
+        resource, _ = self._parse_method(method)
+        list_resource, list_verb = self._parse_method(
+            method_conf.get("list_method", f"{resource}.list")
+        )
+        self._check_method(list_resource, list_verb)
+
+        # Only lookups with the same credentials and other parameters are merged
+        common_params = {k: v for k, v in params.items() if k != key}
+        group_key = (
+            self._get_endpoint(),
+            method,
+            tuple(item for item in metadata if item[0] != "traceparent"),
+            json.dumps(common_params, sort_keys=True, default=str),
+        )
+
+        def batch_fn(values: list) -> dict:
+            list_params = {
+                **common_params,
+                "query": {"filter": [{"k": key, "v": values, "o": "in"}]},
+            }
+            response = getattr(getattr(self._client, list_resource), list_verb)(
+                list_params, metadata=metadata
+            )
+
+            results = self._change_message(response).get("results", [])
+            return {result.get(key): result for result in results}
+
+        try:
+            return _BATCH_LOADER.load(
+                group_key,
+                params[key],
+                batch_fn,
+                window=self._batch_conf.get("window", 0.002),
+                max_batch_size=self._batch_conf.get("max_batch_size", 100),
+                timeout=self._timeout or _DEFAULT_TIMEOUT,
+            )
+        except KeyError:
+            raise ERROR_NOT_FOUND(key=key, value=params[key])
 
     def _verify(self) -> None:
         if self._service:
@@ -93,19 +292,25 @@ class SpaceConnector(BaseConnector):
                 connector="SpaceConnector", reason="service or endpoint is required."
             )
 
+    def _get_channel_conf(self) -> dict:
+        channel_conf = self.config.get("channel", {})
+        service_channel_conf = self.config.get("channels", {}).get(self._service, {})
+        return {**channel_conf, **service_channel_conf}
+
     def _init_client(self) -> None:
         endpoint = self._get_endpoint()
         e = parse_grpc_endpoint(endpoint)
         self._client: GRPCClient = pygrpc.client(
             endpoint=e["endpoint"],
             ssl_enabled=e["ssl_enabled"],
-            max_message_length=1024 * 1024 * 256,
+            max_message_length=_DEFAULT_MAX_MESSAGE_LENGTH,
             timeout=self._timeout,
+            channel_conf=self._channel_conf,
         )
 
     @staticmethod
     def _change_message(message) -> dict:
-        return MessageToDict(message, preserving_proto_field_name=True)
+        return message_to_dict(message)
 
     def _generate_response(self, response_iterator):
         for response in response_iterator:
@@ -160,3 +365,157 @@ class SpaceConnector(BaseConnector):
 
     def _get_endpoint(self) -> str:
         return self._endpoint or self._endpoints[self._service]
+
+
+class AsyncSpaceConnector(SpaceConnector):
+    """SpaceConnector which calls APIs with grpc.aio channels.
+
+    Descriptors are shared with the sync client of the endpoint. Creating it
+    waits for the channels and runs reflection, so it is created in a worker
+    thread on the first dispatch instead of blocking the event loop.
+    """
+
+    name = "SpaceConnector"
+
+    @property
+    def client(self) -> GRPCClient:
+        # Blocks on the first access, use it outside of the event loop
+        if self._client is None:
+            super()._init_client()
+
+        return self._client
+
+    async def dispatch(self, method: str, params: dict = None, **kwargs) -> Any:
+        if self._client is None:
+            await asyncio.to_thread(super()._init_client)
+
+        with _TRACER.start_as_current_span(method, kind=SpanKind.CLIENT):
+            return await self._call_api(method, params, **kwargs)
+
+    async def dispatch_many(
+        self,
+        requests: List[Tuple[str, dict]],
+        concurrency: int = 10,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> list:
+        """Dispatch [(method, params), ...] concurrently in the running event loop.
+
+        Results are returned in the order of the requests.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _dispatch(method, params):
+            async with semaphore:
+                return await self.dispatch(method, params, **kwargs)
+
+        return await asyncio.gather(
+            *[_dispatch(method, params) for method, params in requests],
+            return_exceptions=return_exceptions,
+        )
+
+    async def _call_api(
+        self,
+        method: str,
+        params: dict = None,
+        token: str = None,
+        x_domain_id: str = None,
+        x_workspace_id: str = None,
+    ) -> Any:
+        resource, verb = self._parse_method(method)
+        self._check_method(resource, verb)
+
+        method_key, method_desc = self._client.get_method(resource, verb)
+        if method_desc.client_streaming:
+            raise ERROR_CONNECTOR(
+                connector="AsyncSpaceConnector",
+                reason=f"Request streaming is not supported. (method = {method})",
+            )
+
+        request_class = self._client.get_message_class(method_desc.input_type.full_name)
+        response_class = self._client.get_message_class(
+            method_desc.output_type.full_name
+        )
+        request = dict_to_message(params or {}, request_class)
+
+        # Serialized responses are relayed without parsing (passthrough)
+        if self._return_type == "bytes":
+            response_deserializer = None
+        else:
+            response_deserializer = response_class.FromString
+
+        metadata = self._get_connection_metadata(token, x_domain_id, x_workspace_id)
+
+        endpoint_info = parse_grpc_endpoint(self._get_endpoint())
+        channel = aio_channel(
+            endpoint_info["endpoint"],
+            endpoint_info["ssl_enabled"],
+            max_message_length=_DEFAULT_MAX_MESSAGE_LENGTH,
+            channel_conf=self._channel_conf,
+        )
+        compression = self._client.get_compression(request)
+
+        if method_desc.server_streaming:
+            call = channel.unary_stream(
+                method_key,
+                request_serializer=request_class.SerializeToString,
+                response_deserializer=response_deserializer,
+            )
+            return self._generate_async_response(
+                call(
+                    request,
+                    metadata=metadata,
+                    timeout=self._get_timeout(),
+                    compression=compression,
+                )
+            )
+
+        call = channel.unary_unary(
+            method_key,
+            request_serializer=request_class.SerializeToString,
+            response_deserializer=response_deserializer,
+        )
+
+        try:
+            response = await call(
+                request,
+                metadata=metadata,
+                timeout=self._get_timeout(),
+                compression=compression,
+            )
+        except grpc.aio.AioRpcError as e:
+            self._client.check_error(e)
+            raise
+
+        if self._return_type == "dict":
+            return self._change_message(response)
+        else:
+            return response
+
+    def _init_client(self) -> None:
+        # Deferred to the first dispatch
+        pass
+
+    async def _generate_async_response(self, response_iterator):
+        try:
+            async for response in response_iterator:
+                if self._return_type == "dict":
+                    yield self._change_message(response)
+                else:
+                    yield response
+        except grpc.aio.AioRpcError as e:
+            self._client.check_error(e)
+            raise
+
+    def _get_timeout(self) -> float:
+        timeout = self._timeout or _DEFAULT_TIMEOUT
+
+        # Never wait longer than the caller of the current request
+        time_remaining = get_time_remaining()
+        if time_remaining is None:
+            return timeout
+        elif time_remaining == 0:
+            raise ERROR_REQUEST_TIMEOUT()
+
+        return min(timeout, time_remaining)
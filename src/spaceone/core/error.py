@@ -258,6 +258,11 @@ class ERROR_GRPC_TLS_HANDSHAKE(ERROR_GRPC_CONNECTION):
     _message = "TLS handshake failed. (reason = {reason})"
 
 
+class ERROR_RESOURCE_EXHAUSTED(ERROR_UNKNOWN):
+    _status_code = "RESOURCE_EXHAUSTED"
+    _message = "Server is overloaded. (method = {method}, reason = {reason})"
+
+
 class ERROR_HANDLER(ERROR_UNKNOWN):
     _message = "'{handler_type} handler' import failed. (reason = {reason})"
 
@@ -1,7 +1,12 @@
+import hashlib
 import json
 import logging
 import copy
-from typing import Tuple, List
+import threading
+import time
+from typing import Tuple, List, Union
+
+from cachetools import TLRUCache
 
 from spaceone.core import cache, config
 from spaceone.core.connector.space_connector import SpaceConnector
@@ -13,15 +18,63 @@ from spaceone.core.error import ERROR_AUTHENTICATE_FAILURE
 _LOGGER = logging.getLogger(__name__)
 
 
+class _VerifiedTokenCache(object):
+    """Payloads of verified tokens, keyed by the hash of the token.
+
+    An entry expires at the exp claim of the token, or after ttl seconds
+    at the latest, e.g. for tokens without exp.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 300):
+        self._ttl = ttl
+        self._cache = TLRUCache(
+            maxsize=max_size, ttu=self._get_expire_time, timer=time.time
+        )
+        self._lock = threading.Lock()
+
+    def _get_expire_time(self, key: str, token_info: dict, now: float) -> float:
+        expire_time = now + self._ttl
+
+        if isinstance(exp := token_info.get("exp"), (int, float)):
+            expire_time = min(expire_time, exp)
+
+        return expire_time
+
+    @staticmethod
+    def _make_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Union[dict, None]:
+        with self._lock:
+            token_info = self._cache.get(self._make_key(token))
+
+        # Callers add permissions and projects to the token info
+        return copy.deepcopy(token_info)
+
+    def set(self, token: str, token_info: dict) -> None:
+        with self._lock:
+            self._cache[self._make_key(token)] = copy.deepcopy(token_info)
+
+
 class SpaceONEAuthenticationHandler(BaseAuthenticationHandler):
     def __init__(self, handler_config):
         super().__init__(handler_config)
         self.identity_client = None
+        self._authenticators = {}
+        self._token_cache = None
         self._initialize()
 
     def _initialize(self) -> None:
         self.identity_conn: SpaceConnector = SpaceConnector(service="identity")
 
+        # e.g. {"enabled": True, "max_size": 10000, "ttl": 300}
+        token_cache_conf = self.config.get("verified_token_cache", {})
+        if token_cache_conf.get("enabled", False):
+            self._token_cache = _VerifiedTokenCache(
+                token_cache_conf.get("max_size", 10000),
+                token_cache_conf.get("ttl", 300),
+            )
+
     def verify(self, params: dict) -> None:
         token = self._get_token()
         domain_id = self._extract_domain_id(token)
@@ -75,8 +128,30 @@ class SpaceONEAuthenticationHandler(BaseAuthenticationHandler):
         return response.get("permissions", []), response.get("projects", [])
 
     def _authenticate(self, token: str, domain_id: str) -> dict:
+        # Skip the signature verification of a token which is already verified
+        if self._token_cache:
+            if token_info := self._token_cache.get(token):
+                return token_info
+
+        token_info = self._get_authenticator(domain_id).validate(token)
+
+        if self._token_cache:
+            self._token_cache.set(token, token_info)
+
+        return token_info
+
+    def _get_authenticator(self, domain_id: str) -> JWTAuthenticator:
         public_key = self._get_public_key(domain_id)
-        return JWTAuthenticator(json.loads(public_key)).validate(token)
+
+        # The parsed key is reused until the public key of the domain is changed
+        cached_public_key, authenticator = self._authenticators.get(
+            domain_id, (None, None)
+        )
+        if public_key != cached_public_key:
+            authenticator = JWTAuthenticator(json.loads(public_key))
+            self._authenticators[domain_id] = (public_key, authenticator)
+
+        return authenticator
 
     @staticmethod
     def _get_token() -> str:
@@ -1,20 +1,32 @@
 import logging
 import logging.config
+import logging.handlers
 import copy
+import json
+import queue
 
 from spaceone.core import config
 from spaceone.core.error import *
 from spaceone.core.utils import *
 from spaceone.core.logger.filters import *
+from spaceone.core.logger.formatter import JsonFormatter
 
-__all__ = ["set_logger"]
+__all__ = ["set_logger", "flush_logger"]
 
 DEFAULT_LOGGER = "spaceone"
 
 HANDLER_DEFAULT_CONSOLE = {
     "class": "logging.StreamHandler",
     "formatter": "standard",
-    "filters": ["transaction", "masking", "exclude", "parameter", "traceback"],
+    "filters": [
+        "transaction",
+        "sampling",
+        "rate_limit",
+        "masking",
+        "exclude",
+        "parameter",
+        "traceback",
+    ],
 }
 
 HANDLER_DEFAULT_FILE = {
@@ -22,6 +34,8 @@ HANDLER_DEFAULT_FILE = {
     "filename": "",
     "filters": [
         "transaction",
+        "sampling",
+        "rate_limit",
         "masking",
         "exclude",
         "error_message",
@@ -34,9 +48,16 @@ HANDLER_DEFAULT_FILE = {
     "backupCount": 10,
 }
 
+HANDLER_DEFAULT_JSON = {
+    "class": "logging.StreamHandler",
+    "formatter": "json",
+    "filters": ["transaction", "sampling", "rate_limit", "masking", "exclude"],
+}
+
 HANDLER_DEFAULT_TMPL = {
     "console": HANDLER_DEFAULT_CONSOLE,
     "file": HANDLER_DEFAULT_FILE,
+    "json": HANDLER_DEFAULT_JSON,
 }
 
 FORMATTER_DEFAULT_TMPL = {
@@ -48,11 +69,14 @@ FORMATTER_DEFAULT_TMPL = {
         "format": '{"time": "%(asctime)s.%(msecs)03dZ", "level": "%(levelname)s", "peer": "%(peer)s", "trace_id": "%(trace_id)s", "domain_id": "%(domain_id)s", "audience": "%(audience)s", "role_type": "%(role_type)s", "tnx_method": "%(tnx_method)s", "file_name": "%(filename)s", "line": %(lineno)d, "parameter": %(params_log)s, "message": %(msg_dump)s, "error": { "code": "%(error_code)s", "message": "%(error_message)s", "traceback": %(traceback_log)s }}',
         "datefmt": "%Y-%m-%dT%H:%M:%S",
     },
+    "json": {"()": JsonFormatter},
 }
 
 FILTER_DEFAULT_TMPL = {
     "masking": {"()": MaskingFilter, "rules": {}},
     "transaction": {"()": TransactionFilter},
+    "sampling": {"()": SamplingFilter, "rules": {}, "default_rate": 1.0},
+    "rate_limit": {"()": RateLimitFilter, "rate": None, "burst": 10},
     "traceback": {"()": TracebackFilter},
     "traceback_log": {"()": TracebackLogFilter},
     "parameter": {"()": ParameterFilter},
@@ -77,10 +101,143 @@ _LOGGER = {
 
 LOGGER_DEFAULT_TMPL = {"level": "DEBUG", "propagate": True, "handlers": ["console"]}
 
+_LISTENERS = []
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, log_queue, handlers):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._unreported_dropped = 0
+
+        # Transaction info is in the thread local storage of the request thread
+        self.addFilter(TransactionFilter())
+
+        # Sampling and rate limits are decided in the request thread, so that
+        # dropped records are never snapshotted. The listener handlers reuse
+        # the decisions cached on the record.
+        self._handler_filters = [
+            (
+                handler.level,
+                [
+                    _filter
+                    for _filter in handler.filters
+                    if isinstance(_filter, (SamplingFilter, RateLimitFilter))
+                ],
+            )
+            for handler in handlers
+        ]
+
+    def filter(self, record):
+        if not super().filter(record):
+            return False
+
+        return any(
+            record.levelno >= level and all(_f.filter(record) for _f in filters)
+            for level, filters in self._handler_filters
+        )
+
+    def prepare(self, record):
+        # Handlers of the listener format the record, only the message is merged
+        # so that the arguments are not changed before it is handled
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        # The request keeps changing its nested parameters while the record
+        # waits in the queue, so the listener gets a snapshot
+        if parameter := getattr(record, "parameter", None):
+            record.parameter = _snapshot_parameter(parameter)
+
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self._unreported_dropped:
+                self.queue.put_nowait(self._make_dropped_record(record.name))
+                self._unreported_dropped = 0
+
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Never block the request thread on a slow handler
+            self.dropped += 1
+            self._unreported_dropped += 1
+
+    def _make_dropped_record(self, name):
+        return logging.LogRecord(
+            name,
+            logging.WARNING,
+            __file__,
+            0,
+            f"[_QueueHandler] {self._unreported_dropped} log records are dropped "
+            f"while the log queue is full (total = {self.dropped})",
+            None,
+            None,
+        )
+
+
+def _snapshot_parameter(parameter):
+    try:
+        return copy.deepcopy(parameter)
+    except Exception:
+        return json.loads(json.dumps(parameter, default=str))
+
 
 def set_logger(transaction=None):
+    _stop_listeners()
     _set_config(transaction)
     logging.config.dictConfig(_LOGGER)
+    _set_async_handlers(config.get_global("LOG_ASYNC", {}))
+
+
+def _set_async_handlers(async_conf):
+    """Moves the handlers of each logger behind a queue handled by a listener thread."""
+
+    if not async_conf.get("enabled", False):
+        return
+
+    for logger_name in _LOGGER["loggers"]:
+        _logger = logging.getLogger(logger_name)
+        if not _logger.handlers:
+            continue
+
+        log_queue = queue.Queue(async_conf.get("queue_size", 10000))
+        listener = logging.handlers.QueueListener(
+            log_queue, *_logger.handlers, respect_handler_level=True
+        )
+        _logger.handlers = [_QueueHandler(log_queue, _logger.handlers)]
+
+        listener.start()
+        _LISTENERS.append(listener)
+
+
+def _stop_listeners():
+    while _LISTENERS:
+        _LISTENERS.pop().stop()
+
+
+def flush_logger():
+    handlers = []
+
+    # Wait for the queued records of async logging
+    for listener in _LISTENERS:
+        listener.queue.join()
+        handlers.extend(listener.handlers)
+
+    loggers = [logging.getLogger()] + [
+        _logger
+        for _logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(_logger, logging.Logger)
+    ]
+
+    for _logger in loggers:
+        handlers.extend(_logger.handlers)
+
+    for handler in handlers:
+        try:
+            handler.flush()
+        except Exception:
+            pass
 
 
 def _set_default_logger(default_logger):
@@ -3,5 +3,7 @@ from spaceone.core.logger.filters.exclude import ExcludeFilter
 from spaceone.core.logger.filters.masking import MaskingFilter
 from spaceone.core.logger.filters.message import MessageJsonFilter
 from spaceone.core.logger.filters.parameter import ParameterFilter, ParameterLogFilter
+from spaceone.core.logger.filters.rate_limit import RateLimitFilter
+from spaceone.core.logger.filters.sampling import SamplingFilter
 from spaceone.core.logger.filters.transaction import TransactionFilter
-from spaceone.core.logger.filters.traceback import TracebackFilter, TracebackLogFilter
\ No newline at end of file
+from spaceone.core.logger.filters.traceback import TracebackFilter, TracebackLogFilter
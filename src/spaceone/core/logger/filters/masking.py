@@ -1,7 +1,6 @@
 import logging
-import copy
-import json
-from fnmatch import fnmatch
+
+_MASK = "********"
 
 
 class MaskingFilter(logging.Filter):
@@ -17,24 +16,20 @@ class MaskingFilter(logging.Filter):
         return True
 
     def _check_masking(self, tnx_method, params):
-        masking_parameter = copy.deepcopy(params)
-
         if tnx_method in self.rules:
-            return self._masking(masking_parameter, self.rules[tnx_method])
+            return self._masking(params, self.rules[tnx_method])
 
-        """
-        masking_parameter = copy.deepcopy(params)
-        
-        for _rule in self.rules:
-            if fnmatch(tnx_method, _rule):
-                masking_parameter = self._masking(masking_parameter, self.rules[_rule])
-        """
-        return masking_parameter
+        return params
 
     @staticmethod
     def _masking(parameter, patterns):
-        for _p in parameter:
-            if _p in patterns:
-                parameter[_p] = "********"
+        # Copy on write, the parameter is shared with the other handlers
+        masking_parameter = None
+        for _p in patterns:
+            if _p in parameter:
+                if masking_parameter is None:
+                    masking_parameter = dict(parameter)
+
+                masking_parameter[_p] = _MASK
 
-        return parameter
+        return parameter if masking_parameter is None else masking_parameter
@@ -0,0 +1,20 @@
+import logging
+
+
+class OncePerRecordFilter(logging.Filter):
+    """Decides once per record, however many handlers share the filter.
+
+    dictConfig creates one instance per filter name, which every handler
+    listing the name calls with the same record. Stateful decisions (random
+    sampling, rate limit tokens) must not be made again for each handler.
+    """
+
+    def filter(self, record):
+        decisions = record.__dict__.setdefault("_filter_decisions", {})
+        if id(self) not in decisions:
+            decisions[id(self)] = self.decide(record)
+
+        return decisions[id(self)]
+
+    def decide(self, record):
+        raise NotImplementedError
@@ -0,0 +1,44 @@
+import logging
+import threading
+import time
+
+from spaceone.core.logger.filters.once import OncePerRecordFilter
+
+_MAX_BUCKETS = 10000
+
+
+class RateLimitFilter(OncePerRecordFilter):
+    """Token bucket per log call site for repeated error logs.
+
+    Each call site (logger, file and line) of ERROR or higher may log `burst`
+    times at once and `rate` times per second afterwards. Messages are not a
+    part of the key, since they usually contain IDs and error details. The
+    limit is disabled if rate is None.
+    """
+
+    def __init__(self, rate=None, burst=10):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def decide(self, record):
+        if self.rate is None or record.levelno < logging.ERROR:
+            return True
+
+        key = (record.name, record.pathname, record.lineno)
+        now = time.monotonic()
+
+        with self._lock:
+            if key not in self._buckets and len(self._buckets) >= _MAX_BUCKETS:
+                self._buckets.clear()
+
+            tokens, updated_at = self._buckets.get(key, (self.burst, now))
+            tokens = min(tokens + (now - updated_at) * self.rate, self.burst)
+
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return False
+
+            self._buckets[key] = (tokens - 1, now)
+            return True
@@ -0,0 +1,33 @@
+import logging
+import random
+import zlib
+
+from spaceone.core.logger.filters.once import OncePerRecordFilter
+
+
+class SamplingFilter(OncePerRecordFilter):
+    """Samples INFO and DEBUG logs per tnx_method, warnings and errors are kept.
+
+    The decision depends on the trace_id, so the logs of a sampled request
+    are kept together.
+    """
+
+    def __init__(self, rules=None, default_rate=1.0):
+        # e.g. {"Project.get": 0.01}
+        self.rules = rules or {}
+        self.default_rate = default_rate
+
+    def decide(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+
+        rate = self.rules.get(getattr(record, "tnx_method", None), self.default_rate)
+        if rate >= 1:
+            return True
+        elif rate <= 0:
+            return False
+
+        if trace_id := getattr(record, "trace_id", None):
+            return zlib.crc32(trace_id.encode()) / 0xFFFFFFFF < rate
+
+        return random.random() < rate
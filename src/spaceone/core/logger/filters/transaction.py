@@ -4,6 +4,12 @@ from spaceone.core.transaction import get_transaction
 
 class TransactionFilter(logging.Filter):
     def filter(self, record):
+        # Already filled in the request thread (async logging)
+        if getattr(record, "_transaction_filtered", False):
+            return True
+
+        record._transaction_filtered = True
+
         if transaction := get_transaction(is_create=False):
             record.service = transaction.service
             record.trace_id = transaction.id
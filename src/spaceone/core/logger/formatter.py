@@ -0,0 +1,53 @@
+import json
+import logging
+import time
+
+__all__ = ["JsonFormatter"]
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON object, serialized once.
+
+    It has the fields of the "file" formatter, without the per-field JSON
+    filters (parameter_log, message, traceback_log, error_message).
+    """
+
+    converter = time.gmtime
+
+    def __init__(self, datefmt="%Y-%m-%dT%H:%M:%S", **kwargs):
+        super().__init__(datefmt=datefmt)
+
+    def format(self, record):
+        log = {
+            "time": f"{self.formatTime(record, self.datefmt)}.{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "peer": getattr(record, "peer", ""),
+            "trace_id": getattr(record, "trace_id", ""),
+            "domain_id": getattr(record, "domain_id", ""),
+            "audience": getattr(record, "audience", ""),
+            "role_type": getattr(record, "role_type", ""),
+            "tnx_method": getattr(record, "tnx_method", ""),
+            "file_name": record.filename,
+            "line": record.lineno,
+            "parameter": getattr(record, "parameter", None) or {},
+            "message": record.getMessage(),
+            "error": {
+                "code": getattr(record, "error_code", None) or "",
+                "message": getattr(record, "error_message", None) or "",
+                "traceback": self._get_traceback(record),
+            },
+        }
+
+        return json.dumps(log, ensure_ascii=False, default=str)
+
+    def _get_traceback(self, record) -> str:
+        if traceback := getattr(record, "traceback", None):
+            return traceback
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+
+            return record.exc_text
+
+        return ""
@@ -3,9 +3,13 @@ import re
 import logging
 import certifi
 import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
 from functools import reduce, partial
+from typing import Union
 from mongoengine import (
     EmbeddedDocumentField,
     EmbeddedDocument,
@@ -15,11 +19,19 @@ from mongoengine import (
 )
 from mongoengine.fields import DateField, DateTimeField, ComplexDateTimeField
 from pymongo import ReadPreference
+from pymongo.errors import ExecutionTimeout
+from cachetools import TTLCache
 from mongoengine.errors import *
 from spaceone.core import config
 from spaceone.core import utils
 from spaceone.core.error import *
+from spaceone.core.transaction import get_transaction, get_time_remaining
 from spaceone.core.model.base_model import BaseModel
+from spaceone.core.model.mongo_model import index_advisor, monitoring
+from spaceone.core.model.mongo_model.projection import (
+    plan_only_keys,
+    make_pipeline_projection,
+)
 from spaceone.core.model.mongo_model.filter_operator import FILTER_OPERATORS
 from spaceone.core.model.mongo_model.stat_operator import (
     STAT_GROUP_OPERATORS,
@@ -28,6 +40,23 @@ from spaceone.core.model.mongo_model.stat_operator import (
 
 _REFERENCE_ERROR_FORMAT = r"Could not delete document \((\w+)\.\w+ refers to it\)"
 _MONGO_INIT_MODELS = []
+_READ_YOUR_WRITES = {
+    "enabled": False,
+    "window": 5,
+    "max_size": 10000,
+}
+_RECENT_WRITE_TOKENS = TTLCache(
+    maxsize=_READ_YOUR_WRITES["max_size"], ttl=_READ_YOUR_WRITES["window"]
+)
+_RECENT_WRITE_LOCK = threading.Lock()
+_POOL_OPTIONS = {
+    # DATABASES.<alias> key : pymongo option
+    "max_pool_size": "maxPoolSize",
+    "min_pool_size": "minPoolSize",
+    "max_idle_time_ms": "maxIdleTimeMS",
+    "wait_queue_timeout_ms": "waitQueueTimeoutMS",
+    "max_connecting": "maxConnecting",
+}
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,28 +71,37 @@ class MongoCustomQuerySet(QuerySet):
     def last(self):
         return self.order_by("-id").first()
 
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self._document._record_write()
+        return result
+
     def update(self, *args, **kwargs):
         if len(args) > 0 and isinstance(args[0], dict):
             kwargs.update(args[0])
         super().update(**kwargs)
+        self._document._record_write()
 
     def increment(self, key, amount=1):
         key = key.replace(".", "__")
         inc_data = {f"inc__{key}": amount}
 
         super().update(**inc_data)
+        self._document._record_write()
 
     def decrement(self, key, amount=1):
         key = key.replace(".", "__")
         dec_data = {f"dec__{key}": amount}
 
         super().update(**dec_data)
+        self._document._record_write()
 
     def set_data(self, key, data):
         key = key.replace(".", "__")
         set_data = {f"set__{key}": data}
 
         super().update(**set_data)
+        self._document._record_write()
 
     def unset_data(self, *keys):
         unset_data = {}
@@ -73,17 +111,20 @@ class MongoCustomQuerySet(QuerySet):
             unset_data[f"unset__{key}"] = 1
 
         super().update(**unset_data)
+        self._document._record_write()
 
     def append(self, key, data):
         key = key.replace(".", "__")
         append_data = {f"push__{key}": data}
 
         super().update(**append_data)
+        self._document._record_write()
 
     def remove(self, key, data):
         key = key.replace(".", "__")
         remove_data = {f"pull__{key}": data}
         super().update(**remove_data)
+        self._document._record_write()
 
 
 class MongoModel(Document, BaseModel):
@@ -100,6 +141,9 @@ class MongoModel(Document, BaseModel):
         databases = global_conf.get("DATABASES", {})
         db_name_prefix = global_conf.get("DATABASE_NAME_PREFIX", "")
 
+        index_advisor.init(global_conf.get("DATABASE_INDEX_ADVISOR", {}))
+        cls._init_read_your_writes(global_conf.get("DATABASE_READ_YOUR_WRITES", {}))
+
         if not global_conf.get("MOCK_MODE", False):
             for alias, db_conf in databases.items():
                 is_connect = cls._connect(alias, db_conf, db_name_prefix)
@@ -108,11 +152,26 @@ class MongoModel(Document, BaseModel):
                     model_path = config.get_global("DATABASE_MODEL_PATH", "model")
                     __import__(f"{package_path}.{model_path}", fromlist=["*"])
 
-                    for model in cls.__subclasses__():
-                        if create_index:
-                            model._create_index()
+                    models = cls.__subclasses__()
+                    for model in models:
                         model._load_default_meta()
 
+                    if create_index:
+                        cls._create_indexes(
+                            models, global_conf.get("DATABASE_INDEX_CREATION", {})
+                        )
+
+    @staticmethod
+    def _init_read_your_writes(read_your_writes_conf: dict) -> None:
+        global _RECENT_WRITE_TOKENS
+
+        _READ_YOUR_WRITES.update(read_your_writes_conf or {})
+        with _RECENT_WRITE_LOCK:
+            _RECENT_WRITE_TOKENS = TTLCache(
+                maxsize=_READ_YOUR_WRITES["max_size"],
+                ttl=_READ_YOUR_WRITES["window"],
+            )
+
     @classmethod
     def _connect(cls, alias: str, db_conf: dict, db_name_prefix: str) -> bool:
         is_connect = False
@@ -144,12 +203,45 @@ class MongoModel(Document, BaseModel):
                 if host.startswith("mongodb+srv://"):
                     db_conf["tlsCAFile"] = certifi.where()
 
+                cls._set_pool_options(alias, db_conf)
+
                 register_connection(alias, **db_conf)
                 is_connect = True
                 _LOGGER.debug(f"Create MongoDB Connection: {alias}")
 
         return is_connect
 
+    @staticmethod
+    def _set_pool_options(alias: str, db_conf: dict) -> None:
+        max_workers = config.get_global("MAX_WORKERS", 100)
+        pool_defaults = {
+            "maxPoolSize": max_workers,
+            "minPoolSize": max(1, max_workers // 10),
+            "maxIdleTimeMS": 300000,
+            "waitQueueTimeoutMS": 10000,
+        }
+
+        for key, option_name in _POOL_OPTIONS.items():
+            if key in db_conf:
+                db_conf[option_name] = db_conf.pop(key)
+
+        for option_name, value in pool_defaults.items():
+            db_conf.setdefault(option_name, value)
+
+        _LOGGER.debug(
+            f"MongoDB Connection Pool: {alias} "
+            f"(max_pool_size={db_conf['maxPoolSize']}, min_pool_size={db_conf['minPoolSize']}, "
+            f"wait_queue_timeout_ms={db_conf['waitQueueTimeoutMS']})"
+        )
+
+        if config.get_global("DATABASE_MONITORING", {}).get("enabled", False):
+            event_listeners = list(db_conf.get("event_listeners", []))
+            event_listeners.append(
+                monitoring.PoolMetricListener(alias, db_conf["maxPoolSize"])
+            )
+            event_listeners.append(monitoring.CommandMetricListener(alias))
+            db_conf["event_listeners"] = event_listeners
+
     @classmethod
     def _load_default_meta(cls):
         cls._meta["datetime_fields"] = []
@@ -162,7 +254,61 @@ class MongoModel(Document, BaseModel):
                 cls._meta["datetime_fields"].append(name)
 
     @classmethod
-    def _create_index(cls) -> None:
+    def _create_indexes(cls, models: list, index_conf: dict) -> None:
+        mode = index_conf.get("mode", "sync")
+        max_workers = index_conf.get("max_workers", 4)
+        skip_existing = index_conf.get("skip_existing", False)
+
+        if mode == "background":
+            threading.Thread(
+                target=cls._create_indexes_in_parallel,
+                args=(models, max_workers, skip_existing, True),
+                name="MongoIndexCreation",
+                daemon=True,
+            ).start()
+        elif mode == "parallel":
+            cls._create_indexes_in_parallel(models, max_workers, skip_existing)
+        else:
+            for model in models:
+                model._create_index(skip_existing)
+
+    @classmethod
+    def _create_indexes_in_parallel(
+        cls,
+        models: list,
+        max_workers: int,
+        skip_existing: bool = False,
+        background: bool = False,
+    ) -> None:
+        start_time = time.time()
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="MongoIndexCreation"
+        ) as executor:
+            futures = {
+                executor.submit(model._create_index, skip_existing, background): model
+                for model in models
+            }
+
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    _LOGGER.error(
+                        f"Index Creation Failure ({futures[future].__name__}): {e}"
+                    )
+
+                    # Background creation has no caller to raise to
+                    if not background:
+                        raise
+
+        _LOGGER.debug(
+            f"Create MongoDB Indexes ({len(models)} Models, "
+            f"Time = {time.time() - start_time:.2f}s)"
+        )
+
+    @classmethod
+    def _create_index(cls, skip_existing: bool = False, background: bool = False):
         if cls.auto_create_index:
             indexes = cls._meta.get("indexes", [])
             unique_fields = cls._get_unique_fields()
@@ -174,21 +320,55 @@ class MongoModel(Document, BaseModel):
                     f"Create MongoDB Indexes ({cls.__name__} Model: {total_index_count} Indexes)"
                 )
 
+                existing_index_keys = []
+                if skip_existing:
+                    existing_index_keys = cls._get_existing_index_keys()
+
                 for unique_field in unique_fields:
+                    index = {"fields": unique_field, "unique": True}
+                    if cls._check_existing_index(index, existing_index_keys):
+                        continue
+
                     try:
-                        cls.create_index({"fields": unique_field, "unique": True})
+                        cls.create_index(index, background=background)
 
                     except Exception as e:
                         _LOGGER.error(f"Unique Index Creation Failure: {e}")
 
                 for index in indexes:
+                    if cls._check_existing_index(index, existing_index_keys):
+                        continue
+
                     try:
-                        cls.create_index(index)
+                        cls.create_index(index, background=background)
 
                     except Exception as e:
-                        if e.code != 85:  # 85: IndexOptionsConflict
+                        if getattr(e, "code", None) != 85:  # 85: IndexOptionsConflict
                             _LOGGER.error(f"Index Creation Failure: {e}")
 
+    @classmethod
+    def _get_existing_index_keys(cls) -> list:
+        try:
+            return [
+                list(index["key"].items())
+                for index in cls._get_collection().list_indexes()
+            ]
+        except Exception as e:
+            _LOGGER.error(f"Failed to list MongoDB Indexes ({cls.__name__}): {e}")
+            return []
+
+    @classmethod
+    def _check_existing_index(cls, index, existing_index_keys: list) -> bool:
+        if len(existing_index_keys) == 0:
+            return False
+
+        try:
+            index_keys = [tuple(key) for key in cls._build_index_spec(index)["fields"]]
+        except Exception:
+            return False
+
+        return index_keys in existing_index_keys
+
     @classmethod
     def _get_unique_fields(cls):
         unique_fields = []
@@ -250,6 +430,7 @@ class MongoModel(Document, BaseModel):
 
         try:
             new_vo = cls(**create_data).save()
+            cls._record_write()
         except Exception as e:
             raise ERROR_DB_QUERY(reason=e)
 
@@ -289,6 +470,7 @@ class MongoModel(Document, BaseModel):
 
             try:
                 super().update(**data)
+                self._record_write()
                 self.reload()
             except Exception as e:
                 raise ERROR_DB_QUERY(reason=e)
@@ -298,6 +480,7 @@ class MongoModel(Document, BaseModel):
     def delete(self, *args):
         try:
             super().delete(*args)
+            self._record_write()
         except OperationError as e:
             _raise_reference_error(self.__class__.__name__, str(e))
             raise ERROR_DB_QUERY(reason=e)
@@ -306,12 +489,14 @@ class MongoModel(Document, BaseModel):
 
     def terminate(self):
         super().delete()
+        self._record_write()
 
     def increment(self, key, amount=1):
         key = key.replace(".", "__")
         inc_data = {f"inc__{key}": amount}
 
         super().update(**inc_data)
+        self._record_write()
         self.reload()
         return self
 
@@ -320,6 +505,7 @@ class MongoModel(Document, BaseModel):
         dec_data = {f"dec__{key}": amount}
 
         super().update(**dec_data)
+        self._record_write()
         self.reload()
         return self
 
@@ -328,6 +514,7 @@ class MongoModel(Document, BaseModel):
         set_data = {f"set__{key}": data}
 
         super().update(**set_data)
+        self._record_write()
         self.reload()
         return self
 
@@ -339,6 +526,7 @@ class MongoModel(Document, BaseModel):
             unset_data[f"unset__{key}"] = 1
 
         super().update(**unset_data)
+        self._record_write()
         self.reload()
         return self
 
@@ -354,6 +542,7 @@ class MongoModel(Document, BaseModel):
             append_data[f"push__{key}"] = data
 
         super().update(**append_data)
+        self._record_write()
         self.reload()
         return self
 
@@ -361,6 +550,7 @@ class MongoModel(Document, BaseModel):
         key = key.replace(".", "__")
         remove_data = {f"pull__{key}": data}
         super().update(**remove_data)
+        self._record_write()
         self.reload()
         return self
 
@@ -378,8 +568,7 @@ class MongoModel(Document, BaseModel):
                 raise ERROR_NOT_FOUND(key=keys, value=values)
 
         if only:
-            only = cls._remove_duplicate_only_keys(only)
-            vos = vos.only(*only)
+            vos = vos.only(*plan_only_keys(only))
 
         return vos.first()
 
@@ -392,19 +581,61 @@ class MongoModel(Document, BaseModel):
             else:
                 change_conditions[key] = value
 
-        return cls.objects.filter(**change_conditions)
+        return cls._get_target_objects(None).filter(**change_conditions)
 
     def to_dict(self) -> dict:
         return dict(self.to_mongo())
 
+    @classmethod
+    def _record_write(cls) -> None:
+        if _READ_YOUR_WRITES["enabled"]:
+            if transaction := get_transaction(is_create=False):
+                transaction.set_last_write_time()
+
+                if token := transaction.meta.get("token"):
+                    with _RECENT_WRITE_LOCK:
+                        _RECENT_WRITE_TOKENS[utils.string_to_hash(token)] = True
+
+    @classmethod
+    def _check_recent_write(cls) -> bool:
+        if _READ_YOUR_WRITES["enabled"]:
+            if transaction := get_transaction(is_create=False):
+                if transaction.last_write_time:
+                    return True
+
+                if token := transaction.meta.get("token"):
+                    with _RECENT_WRITE_LOCK:
+                        return utils.string_to_hash(token) in _RECENT_WRITE_TOKENS
+
+        return False
+
+    @staticmethod
+    def _get_max_time_ms() -> Union[int, None]:
+        """Time limit of a query from the caller's deadline of the current request."""
+
+        time_remaining = get_time_remaining()
+        if time_remaining is None:
+            return None
+        elif time_remaining == 0:
+            raise ERROR_REQUEST_TIMEOUT()
+
+        return max(int(time_remaining * 1000), 1)
+
     @classmethod
     def _get_target_objects(cls, target):
+        objects = cls.objects
+        if max_time_ms := cls._get_max_time_ms():
+            objects = objects.max_time_ms(max_time_ms)
+
+        if cls._check_recent_write():
+            return objects.read_preference(ReadPreference.PRIMARY)
+
         if target:
             read_preference = getattr(ReadPreference, target, None)
             if read_preference:
-                return cls.objects.read_preference(read_preference)
+                return objects.read_preference(read_preference)
 
-        return cls.objects
+        return objects
 
     @staticmethod
     def _check_operator_value(is_multiple, operator, value, condition):
@@ -550,44 +781,46 @@ class MongoModel(Document, BaseModel):
         return _filter
 
     @classmethod
-    def _remove_duplicate_only_keys(cls, only):
-        changed_only = []
-        duplicated_only = []
-        for key in only:
-            exists = False
+    def _observe_query(cls, filter, filter_or, sort=None):
+        if index_advisor.is_enabled():
+            try:
+                index_advisor.observe(
+                    cls.__name__,
+                    cls._get_query_shape(filter),
+                    cls._get_query_shape(filter_or),
+                    [
+                        (sort_option["key"], sort_option.get("desc", False))
+                        for sort_option in sort or []
+                    ],
+                )
+            except Exception as e:
+                _LOGGER.debug(f"[_observe_query] Failed to observe query: {e}")
 
-            for changed_key in changed_only:
-                if key == changed_key or key.startswith(f"{changed_key}."):
-                    exists = True
-                elif changed_key.startswith(f"{key}."):
-                    duplicated_only.append(changed_key)
+    @classmethod
+    def _get_query_shape(cls, conditions):
+        change_query_keys = cls._meta.get("change_query_keys", {})
+        shape = []
 
-            if exists is False:
-                changed_only.append(key)
+        for condition in conditions:
+            key = condition.get("key", condition.get("k"))
+            operator = condition.get("operator", condition.get("o"))
 
-        if len(duplicated_only) > 0:
-            changed_only = list(set(changed_only) - set(duplicated_only))
+            if key in change_query_keys:
+                key = change_query_keys[key]
 
-        return changed_only
+            if operator not in ["regex", "regex_in"] and cls._check_reference_field(
+                key
+            ):
+                ref_model, ref_key, ref_query_key, foreign_key = (
+                    cls._get_reference_model(key)
+                )
+                if ref_model:
+                    key = ref_key
+                    operator = "not_in" if operator in ["not", "not_in"] else "in"
 
-    @staticmethod
-    def _make_unwind_project_stage(only: list):
-        project_fields = []
-        for key in only:
-            project_fields.append(
-                {
-                    "key": key,
-                    "name": key,
-                }
-            )
+            shape.append((key, operator))
 
-        return {
-            "project": {
-                "exclude_keys": False,
-                "only_keys": False,
-                "fields": project_fields,
-            }
-        }
+        return shape
 
     @classmethod
     def _stat_with_pipeline(
@@ -614,6 +847,10 @@ class MongoModel(Document, BaseModel):
 
         aggregate = []
 
+        if only and (lookup or unwind) and not add_fields:
+            if projection := make_pipeline_projection(only, lookup, unwind, sort):
+                aggregate.append(projection)
+
         if lookup:
             for lu in lookup:
                 aggregate.append({"lookup": lu})
@@ -721,6 +958,7 @@ class MongoModel(Document, BaseModel):
             minimal_fields = cls._meta.get("minimal_fields")
 
             _filter = cls._make_filter(filter, filter_or, reference_filter)
+            cls._observe_query(filter, filter_or, sort)
 
             for sort_option in sort:
                 if sort_option.get("desc", False):
@@ -746,20 +984,13 @@ class MongoModel(Document, BaseModel):
                     else:
                         ordering = cls._meta.get("ordering")
 
-                    for key in ordering:
-                        if key.startswith("+") or key.startswith("-"):
-                            key = key[1:]
-                        if key not in only:
-                            only.append(key)
-
-                    only = cls._remove_duplicate_only_keys(only)
-                    vos = vos.only(*only)
+                    vos = vos.only(*plan_only_keys(only, ordering))
 
                 if exclude:
                     vos = vos.exclude(*exclude)
 
                 if minimal and minimal_fields:
-                    vos = vos.only(*minimal_fields)
+                    vos = vos.only(*plan_only_keys(minimal_fields))
 
                 if include_count:
                     total_count = vos.count()
@@ -779,6 +1010,10 @@ class MongoModel(Document, BaseModel):
 
                 return vos, total_count
 
+            except ERROR_REQUEST_TIMEOUT as e:
+                raise e
+            except ExecutionTimeout:
+                raise ERROR_REQUEST_TIMEOUT()
             except Exception as e:
                 raise ERROR_DB_QUERY(reason=e)
 
@@ -1216,7 +1451,9 @@ class MongoModel(Document, BaseModel):
             start = 1 if start < 1 else start
 
             result["total_count"] = 0
-            cursor = vos.aggregate(pipeline + [{"$count": "total_count"}])
+            cursor = vos.aggregate(
+                pipeline + [{"$count": "total_count"}], **cls._get_time_limit_options()
+            )
             for c in cursor:
                 result["total_count"] = c["total_count"]
                 break
@@ -1234,6 +1471,7 @@ class MongoModel(Document, BaseModel):
         if hint:
             options["hint"] = hint
 
+        options.update(cls._get_time_limit_options())
         cursor = vos.aggregate(pipeline, **options)
 
         if return_type == "cursor":
@@ -1242,6 +1480,14 @@ class MongoModel(Document, BaseModel):
             result["results"] = cls._make_aggregate_values(cursor)
             return result
 
+    @classmethod
+    def _get_time_limit_options(cls) -> dict:
+        # max_time_ms of a queryset is not applied to aggregate()
+        if max_time_ms := cls._get_max_time_ms():
+            return {"maxTimeMS": max_time_ms}
+
+        return {}
+
     @classmethod
     def _stat_distinct(cls, vos, distinct, page):
         result = {}
@@ -1288,6 +1534,7 @@ class MongoModel(Document, BaseModel):
             raise ERROR_REQUIRED_PARAMETER(key="aggregate")
 
         _filter = cls._make_filter(filter, filter_or, reference_filter)
+        cls._observe_query(filter, filter_or)
 
         try:
             vos = cls._get_target_objects(target).filter(_filter)
@@ -1300,6 +1547,10 @@ class MongoModel(Document, BaseModel):
             elif distinct:
                 return cls._stat_distinct(vos, distinct, page)
 
+        except ERROR_REQUEST_TIMEOUT as e:
+            raise e
+        except ExecutionTimeout:
+            raise ERROR_REQUEST_TIMEOUT()
         except Exception as e:
             if not isinstance(e, ERROR_BASE):
                 e = ERROR_UNKNOWN(message=str(e))
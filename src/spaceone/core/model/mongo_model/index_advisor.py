@@ -0,0 +1,328 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from typing import List, Tuple
+
+from spaceone.core import utils
+
+__all__ = [
+    "init",
+    "is_enabled",
+    "observe",
+    "get_observations",
+    "reset",
+    "dump",
+    "load",
+    "make_report",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+_EQUALITY_OPERATORS = ["eq", "in"]
+_ADVISOR_CONF = {
+    "enabled": False,
+    "dump_path": None,
+    "dump_interval": 60,
+}
+
+# model name -> {(filter, filter_or, sort): count}
+_OBSERVATIONS = {}
+_OBSERVATION_LOCK = threading.Lock()
+_DUMP_THREAD = None
+
+
+def init(advisor_conf: dict = None) -> None:
+    global _DUMP_THREAD
+
+    _ADVISOR_CONF.update(advisor_conf or {})
+
+    if is_enabled() and _ADVISOR_CONF.get("dump_path") and _DUMP_THREAD is None:
+        _DUMP_THREAD = threading.Thread(
+            target=_dump_periodically, name="IndexAdvisorDump", daemon=True
+        )
+        _DUMP_THREAD.start()
+        atexit.register(_dump_to_conf_path)
+
+
+def is_enabled() -> bool:
+    return _ADVISOR_CONF["enabled"] is True
+
+
+def observe(
+    model_name: str,
+    filter: List[Tuple[str, str]],
+    filter_or: List[Tuple[str, str]],
+    sort: List[Tuple[str, bool]],
+) -> None:
+    shape = (tuple(filter), tuple(filter_or), tuple(sort))
+
+    with _OBSERVATION_LOCK:
+        model_observations = _OBSERVATIONS.setdefault(model_name, {})
+        model_observations[shape] = model_observations.get(shape, 0) + 1
+
+
+def get_observations() -> dict:
+    observations = {}
+
+    with _OBSERVATION_LOCK:
+        for model_name, model_observations in _OBSERVATIONS.items():
+            observations[model_name] = []
+            for shape, count in model_observations.items():
+                filter, filter_or, sort = shape
+                observations[model_name].append(
+                    {
+                        "filter": [list(condition) for condition in filter],
+                        "filter_or": [list(condition) for condition in filter_or],
+                        "sort": [list(sort_option) for sort_option in sort],
+                        "count": count,
+                    }
+                )
+
+    return observations
+
+
+def reset() -> None:
+    with _OBSERVATION_LOCK:
+        _OBSERVATIONS.clear()
+
+
+def dump(path: str) -> None:
+    utils.save_json_to_file({"models": get_observations()}, path, indent=2)
+
+
+def load(*paths: str) -> dict:
+    merged = {}
+
+    for path in paths:
+        data = utils.load_json_from_file(path)
+        for model_name, model_observations in data.get("models", {}).items():
+            merged_model = merged.setdefault(model_name, {})
+            for observation in model_observations:
+                shape = (
+                    tuple(tuple(condition) for condition in observation["filter"]),
+                    tuple(tuple(condition) for condition in observation["filter_or"]),
+                    tuple(tuple(sort_option) for sort_option in observation["sort"]),
+                )
+                merged_model[shape] = (
+                    merged_model.get(shape, 0) + observation["count"]
+                )
+
+    observations = {}
+    for model_name, model_observations in merged.items():
+        observations[model_name] = [
+            {
+                "filter": [list(condition) for condition in filter],
+                "filter_or": [list(condition) for condition in filter_or],
+                "sort": [list(sort_option) for sort_option in sort],
+                "count": count,
+            }
+            for (filter, filter_or, sort), count in model_observations.items()
+        ]
+
+    return observations
+
+
+def make_report(models: list, observations: dict) -> list:
+    """Compare observed query shapes with the indexes declared by each model.
+
+    A query shape is treated as indexed when a prefix of an existing index
+    covers all of its keys in ESR order (Equality, Sort, Range): the equality
+    keys in any order, then the sort keys in order, then the range keys in
+    any order. Recommendations are built in the same order for the shapes
+    that are not indexed.
+    """
+
+    report = []
+    model_map = {model.__name__: model for model in models}
+
+    for model_name in sorted(observations.keys()):
+        model = model_map.get(model_name)
+        if model is None:
+            _LOGGER.debug(f"[make_report] model is not loaded: {model_name}")
+            continue
+
+        existing_indexes = _get_existing_indexes(model)
+        recommendations = {}
+        total_count = 0
+        unindexed_count = 0
+
+        for observation in observations[model_name]:
+            count = observation["count"]
+            total_count += count
+
+            equality_keys, sort_keys, range_keys = _split_esr_keys(observation)
+
+            if _is_indexed(existing_indexes, equality_keys, sort_keys, range_keys):
+                continue
+
+            unindexed_count += count
+            fields = _make_esr_index(equality_keys, sort_keys, range_keys)
+
+            if len(fields) == 0 or _is_prefix_of_existing_index(
+                existing_indexes, fields
+            ):
+                continue
+
+            index_key = tuple(fields)
+            if index_key not in recommendations:
+                recommendations[index_key] = {"fields": fields, "count": 0}
+
+            recommendations[index_key]["count"] += count
+
+        report.append(
+            {
+                "model": model_name,
+                "total_queries": total_count,
+                "unindexed_queries": unindexed_count,
+                "unindexed_ratio": round(unindexed_count / total_count, 4)
+                if total_count > 0
+                else 0,
+                "indexes": existing_indexes,
+                "recommended_indexes": sorted(
+                    recommendations.values(), key=lambda x: x["count"], reverse=True
+                ),
+            }
+        )
+
+    return report
+
+
+def _split_esr_keys(observation: dict) -> Tuple[list, list, list]:
+    equality_keys = []
+    sort_keys = []
+    range_keys = []
+
+    for key, operator in observation["filter"]:
+        if operator in _EQUALITY_OPERATORS:
+            _append_unique(equality_keys, key)
+        else:
+            _append_unique(range_keys, key)
+
+    for key, operator in observation["filter_or"]:
+        _append_unique(range_keys, key)
+
+    for key, desc in observation["sort"]:
+        if key not in equality_keys:
+            _append_unique(sort_keys, f"-{key}" if desc else key)
+
+    sort_names = [_strip_direction(key) for key in sort_keys]
+    range_keys = [
+        key for key in range_keys if key not in equality_keys and key not in sort_names
+    ]
+
+    return equality_keys, sort_keys, range_keys
+
+
+def _is_indexed(
+    existing_indexes: list, equality_keys: list, sort_keys: list, range_keys: list
+) -> bool:
+    if len(equality_keys) + len(sort_keys) + len(range_keys) == 0:
+        return True
+
+    if "id" in equality_keys or "_id" in equality_keys:
+        return True
+
+    for index in existing_indexes:
+        if _is_esr_prefix(index, equality_keys, sort_keys, range_keys):
+            return True
+
+    return False
+
+
+def _is_esr_prefix(
+    index: list, equality_keys: list, sort_keys: list, range_keys: list
+) -> bool:
+    sort_start = len(equality_keys)
+    range_start = sort_start + len(sort_keys)
+    range_end = range_start + len(range_keys)
+
+    if len(index) < range_end:
+        return False
+
+    index_names = [_strip_direction(field) for field in index]
+
+    if set(index_names[:sort_start]) != set(equality_keys):
+        return False
+
+    # An index can be scanned backwards, so every sort direction may be reversed
+    index_sort_keys = index[sort_start:range_start]
+    if index_sort_keys != sort_keys and index_sort_keys != [
+        _reverse_direction(key) for key in sort_keys
+    ]:
+        return False
+
+    return set(index_names[range_start:range_end]) == set(range_keys)
+
+
+def _make_esr_index(equality_keys: list, sort_keys: list, range_keys: list) -> list:
+    return equality_keys + sort_keys + range_keys
+
+
+def _is_prefix_of_existing_index(existing_indexes: list, fields: list) -> bool:
+    for index in existing_indexes:
+        if index[: len(fields)] == fields:
+            return True
+
+    return False
+
+
+def _get_existing_indexes(model) -> list:
+    existing_indexes = []
+
+    for index in model._meta.get("indexes", []):
+        if isinstance(index, dict):
+            index = index.get("fields", [])
+
+        if isinstance(index, str):
+            index = [index]
+
+        fields = [_normalize_index_field(field) for field in index]
+        if len(fields) > 0:
+            existing_indexes.append(fields)
+
+    for unique_field in model._get_unique_fields():
+        existing_indexes.append(list(unique_field))
+
+    return existing_indexes
+
+
+def _normalize_index_field(field: str) -> str:
+    if field.startswith(("+", "$", "#")):
+        return field[1:]
+
+    return field
+
+
+def _strip_direction(field: str) -> str:
+    if field.startswith(("+", "-")):
+        return field[1:]
+
+    return field
+
+
+def _reverse_direction(field: str) -> str:
+    if field.startswith("-"):
+        return field[1:]
+
+    return f"-{field}"
+
+
+def _append_unique(values: list, value: str) -> None:
+    if value not in values:
+        values.append(value)
+
+
+def _dump_periodically() -> None:
+    while True:
+        time.sleep(_ADVISOR_CONF.get("dump_interval", 60))
+        _dump_to_conf_path()
+
+
+def _dump_to_conf_path() -> None:
+    try:
+        path = _ADVISOR_CONF["dump_path"].format(pid=os.getpid())
+        dump(path)
+    except Exception as e:
+        _LOGGER.error(f"[_dump_to_conf_path] Failed to dump index advisor: {e}")
@@ -0,0 +1,194 @@
+import logging
+import threading
+
+from opentelemetry import metrics
+from opentelemetry.metrics import Observation
+from pymongo import monitoring
+
+__all__ = ["PoolMetricListener", "CommandMetricListener", "get_pool_stats"]
+
+_LOGGER = logging.getLogger(__name__)
+_METER = metrics.get_meter(__name__)
+
+_POOL_LISTENERS = []
+
+_CHECKOUT_WAIT_TIME = _METER.create_histogram(
+    "mongodb.pool.checkout.wait_time",
+    unit="ms",
+    description="Time spent waiting for a connection from the pool",
+)
+_CHECKOUT_FAILURES = _METER.create_counter(
+    "mongodb.pool.checkout.failures",
+    description="Number of failed connection checkouts",
+)
+_COMMAND_DURATION = _METER.create_histogram(
+    "mongodb.command.duration",
+    unit="ms",
+    description="Latency of MongoDB commands",
+)
+
+
+def _observe_pool_connections(options):
+    observations = []
+    for listener in list(_POOL_LISTENERS):
+        for address, stats in listener.get_stats().items():
+            attributes = {"alias": listener.alias, "address": address}
+            observations.append(
+                Observation(stats["in_use"], {**attributes, "state": "used"})
+            )
+            observations.append(
+                Observation(stats["idle"], {**attributes, "state": "idle"})
+            )
+
+    return observations
+
+
+def _observe_pool_saturation(options):
+    observations = []
+    for listener in list(_POOL_LISTENERS):
+        for address, stats in listener.get_stats().items():
+            observations.append(
+                Observation(
+                    stats["saturation"],
+                    {"alias": listener.alias, "address": address},
+                )
+            )
+
+    return observations
+
+
+_METER.create_observable_gauge(
+    "mongodb.pool.connections",
+    callbacks=[_observe_pool_connections],
+    description="Number of used and idle connections in the pool",
+)
+_METER.create_observable_gauge(
+    "mongodb.pool.saturation",
+    callbacks=[_observe_pool_saturation],
+    description="Ratio of used connections to maxPoolSize",
+)
+
+
+def _format_address(address) -> str:
+    if isinstance(address, tuple):
+        return ":".join(str(value) for value in address)
+
+    return str(address)
+
+
+class PoolMetricListener(monitoring.ConnectionPoolListener):
+    def __init__(self, alias: str, max_pool_size: int):
+        self.alias = alias
+        self.max_pool_size = max_pool_size
+        self._stats = {}
+        self._lock = threading.Lock()
+        _POOL_LISTENERS.append(self)
+
+    def get_stats(self) -> dict:
+        stats = {}
+        with self._lock:
+            for address, (total, in_use) in self._stats.items():
+                stats[address] = {
+                    "total": total,
+                    "in_use": in_use,
+                    "idle": max(total - in_use, 0),
+                    "saturation": in_use / self.max_pool_size
+                    if self.max_pool_size
+                    else 0,
+                }
+
+        return stats
+
+    def _update_stats(self, address, total: int = 0, in_use: int = 0) -> None:
+        address = _format_address(address)
+        with self._lock:
+            current_total, current_in_use = self._stats.get(address, (0, 0))
+            self._stats[address] = (current_total + total, current_in_use + in_use)
+
+    def pool_created(self, event):
+        _LOGGER.debug(
+            f"MongoDB Connection Pool Created: {self.alias} ({_format_address(event.address)})"
+        )
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        _LOGGER.debug(
+            f"MongoDB Connection Pool Cleared: {self.alias} ({_format_address(event.address)})"
+        )
+
+    def pool_closed(self, event):
+        with self._lock:
+            self._stats.pop(_format_address(event.address), None)
+
+    def connection_created(self, event):
+        self._update_stats(event.address, total=1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._update_stats(event.address, total=-1)
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        attributes = {
+            "alias": self.alias,
+            "address": _format_address(event.address),
+            "reason": str(event.reason),
+        }
+        _CHECKOUT_FAILURES.add(1, attributes)
+
+        if duration := getattr(event, "duration", None):
+            _CHECKOUT_WAIT_TIME.record(duration * 1000, attributes)
+
+    def connection_checked_out(self, event):
+        self._update_stats(event.address, in_use=1)
+
+        if duration := getattr(event, "duration", None):
+            _CHECKOUT_WAIT_TIME.record(
+                duration * 1000,
+                {"alias": self.alias, "address": _format_address(event.address)},
+            )
+
+    def connection_checked_in(self, event):
+        self._update_stats(event.address, in_use=-1)
+
+
+class CommandMetricListener(monitoring.CommandListener):
+    def __init__(self, alias: str):
+        self.alias = alias
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        _COMMAND_DURATION.record(
+            event.duration_micros / 1000,
+            {
+                "alias": self.alias,
+                "command": event.command_name,
+                "status": "SUCCESS",
+            },
+        )
+
+    def failed(self, event):
+        _COMMAND_DURATION.record(
+            event.duration_micros / 1000,
+            {
+                "alias": self.alias,
+                "command": event.command_name,
+                "status": "FAILURE",
+            },
+        )
+
+
+def get_pool_stats() -> dict:
+    pool_stats = {}
+    for listener in _POOL_LISTENERS:
+        pool_stats[listener.alias] = listener.get_stats()
+
+    return pool_stats
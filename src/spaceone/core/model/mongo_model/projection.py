@@ -0,0 +1,111 @@
+from functools import lru_cache
+from typing import Tuple, Union
+
+__all__ = [
+    "plan_only_keys",
+    "remove_duplicate_only_keys",
+    "make_pipeline_projection",
+]
+
+_MAX_PLAN_CACHE_SIZE = 4096
+
+
+def plan_only_keys(only: list, ordering: list = None) -> Tuple[str, ...]:
+    """Return the minimal projection for an only-spec and its ordering keys.
+
+    Ordering keys are added because mongoengine needs them to sort the results.
+    The plan is computed once per (only, ordering) and cached.
+    """
+
+    return _plan_only_keys(tuple(only), tuple(ordering or ()))
+
+
+@lru_cache(maxsize=_MAX_PLAN_CACHE_SIZE)
+def _plan_only_keys(only: tuple, ordering: tuple) -> Tuple[str, ...]:
+    only_keys = list(only)
+
+    for key in ordering:
+        if key.startswith("+") or key.startswith("-"):
+            key = key[1:]
+        if key not in only_keys:
+            only_keys.append(key)
+
+    return tuple(remove_duplicate_only_keys(only_keys))
+
+
+def remove_duplicate_only_keys(only: list) -> list:
+    """Remove keys that are already covered by their parent key.
+
+    e.g. ['data', 'data.size', 'name'] -> ['data', 'name']
+    """
+
+    unique_keys = set(only)
+    changed_only = []
+
+    for key in only:
+        if key in changed_only or _has_parent_key(key, unique_keys):
+            continue
+
+        changed_only.append(key)
+
+    return changed_only
+
+
+def _has_parent_key(key: str, keys: set) -> bool:
+    index = key.find(".")
+    while index != -1:
+        if key[:index] in keys:
+            return True
+
+        index = key.find(".", index + 1)
+
+    return False
+
+
+def make_pipeline_projection(
+    only: list, lookup: list = None, unwind: dict = None, sort: list = None
+) -> Union[dict, None]:
+    """Make a project stage to be placed before $lookup and $unwind stages.
+
+    Only root fields required by the only-spec, lookups, unwind path and filter
+    and sort keys are kept, so joined and unwound documents are built from trimmed
+    documents. Returns None when the required fields cannot be determined.
+    """
+
+    if not only:
+        return None
+
+    root_keys = [key.split(".", 1)[0] for key in only]
+
+    for lu in lookup or []:
+        local_field = lu.get("localField")
+        if local_field is None:
+            return None
+
+        root_keys.append(local_field.split(".", 1)[0])
+
+    if unwind:
+        root_keys.append(unwind["path"].split(".", 1)[0])
+
+        # The unwind filter is matched after the project stage
+        for condition in unwind.get("filter", []):
+            key = condition.get("key", condition.get("k"))
+            if key is None:
+                return None
+
+            root_keys.append(key.split(".", 1)[0])
+
+    for sort_option in sort or []:
+        root_keys.append(sort_option["key"].split(".", 1)[0])
+
+    project_fields = []
+    for key in dict.fromkeys(root_keys):
+        project_fields.append({"key": key, "name": key})
+
+    return {
+        "project": {
+            "exclude_keys": False,
+            "only_keys": True,
+            "fields": project_fields,
+        }
+    }
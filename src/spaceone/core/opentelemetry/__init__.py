@@ -1,2 +1,2 @@
-from spaceone.core.opentelemetry.tracer import set_tracer
-from spaceone.core.opentelemetry.metrics import set_metric
+from spaceone.core.opentelemetry.tracer import set_tracer, flush_tracer
+from spaceone.core.opentelemetry.metrics import set_metric, flush_metric
@@ -1,3 +1,5 @@
+import logging
+
 from opentelemetry import metrics
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
@@ -6,15 +8,18 @@ from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 
 from spaceone.core import config
 
-__all__ = ['set_metric']
+__all__ = ['set_metric', 'flush_metric']
+
+_LOGGER = logging.getLogger(__name__)
 
 
 def set_metric():
-    # Not Implemented
-    # service = config.get_service()
-    # endpoint = config.get_global('OTEL.endpoint')
-    # _init_metric(service, endpoint)
-    pass
+    otel_conf = config.get_global('OTEL', {})
+    endpoint = otel_conf.get('endpoint')
+
+    if otel_conf.get('metric_enabled', False) and endpoint:
+        service = config.get_service()
+        _init_metric(service, endpoint)
 
 
 def _init_metric(service, endpoint):
@@ -26,3 +31,12 @@ def _init_metric(service, endpoint):
     reader = PeriodicExportingMetricReader(exporter)
     provider = MeterProvider(resource=resource, metric_readers=[reader])
     metrics.set_meter_provider(provider)
+
+
+def flush_metric(timeout_millis: int = 30000):
+    provider = metrics.get_meter_provider()
+    if hasattr(provider, 'force_flush'):
+        try:
+            provider.force_flush(timeout_millis)
+        except Exception as e:
+            _LOGGER.error(f'[flush_metric] Failed to flush metrics: {e}')
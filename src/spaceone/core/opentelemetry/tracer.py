@@ -7,7 +7,7 @@ from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExport
 
 from spaceone.core import config
 
-__all__ = ['set_tracer']
+__all__ = ['set_tracer', 'flush_tracer']
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,3 +28,12 @@ def set_tracer():
 
     provider.add_span_processor(processor)
     trace.set_tracer_provider(provider)
+
+
+def flush_tracer(timeout_millis: int = 30000):
+    provider = trace.get_tracer_provider()
+    if hasattr(provider, 'force_flush'):
+        try:
+            provider.force_flush(timeout_millis)
+        except Exception as e:
+            _LOGGER.error(f'[flush_tracer] Failed to flush spans: {e}')
@@ -0,0 +1,351 @@
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from typing import Union
+
+import grpc
+
+from spaceone.core.error import ERROR_RESOURCE_EXHAUSTED
+
+__all__ = ["AdmissionController"]
+
+_LOGGER = logging.getLogger(__name__)
+
+CRITICAL = "critical"
+NORMAL = "normal"
+LOW = "low"
+
+# Health checks and reflection are never shed
+_CRITICAL_SERVICES = [
+    "grpc.health.v1.Health",
+    "grpc.reflection.v1alpha.ServerReflection",
+    "grpc.reflection.v1.ServerReflection",
+]
+
+_MIN_POLL_INTERVAL = 0.001
+_MAX_POLL_INTERVAL = 0.02
+
+
+class _Limiter(object):
+    """Concurrency limit with optional AIMD adaptation on observed latency.
+
+    The limit is decreased multiplicatively when the smoothed latency grows
+    beyond `tolerance` times the lowest observed latency, and increased
+    additively (about one per window of requests) otherwise.
+    """
+
+    def __init__(self, name: str, limit: int, adaptive_conf: dict = None):
+        adaptive_conf = adaptive_conf or {}
+
+        self.name = name
+        self.limit = float(limit)
+        self.in_flight = 0
+
+        self._is_adaptive = adaptive_conf.get("enabled", False)
+        self._min_limit = adaptive_conf.get("min_limit", 1)
+        self._max_limit = adaptive_conf.get("max_limit") or limit
+        self._tolerance = adaptive_conf.get("tolerance", 2.0)
+        self._backoff_ratio = adaptive_conf.get("backoff_ratio", 0.9)
+        self._smoothing = adaptive_conf.get("smoothing", 0.2)
+
+        self._min_latency = None
+        self._avg_latency = None
+        self._last_decreased_at = 0
+        self._lock = threading.Lock()
+
+    def _available(self, reserve: int) -> bool:
+        return self.in_flight < max(int(self.limit) - reserve, 1)
+
+    def try_acquire(self, reserve: int = 0) -> bool:
+        with self._lock:
+            if self._available(reserve):
+                self.in_flight += 1
+                return True
+
+        return False
+
+    async def acquire_async(self, timeout: float, reserve: int = 0) -> bool:
+        deadline = time.monotonic() + timeout
+        interval = _MIN_POLL_INTERVAL
+
+        while not self.try_acquire(reserve):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, _MAX_POLL_INTERVAL)
+
+        return True
+
+    def release(self, latency: float = None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+            if self._is_adaptive and latency is not None:
+                self._update_limit(latency)
+
+    def _update_limit(self, latency: float) -> None:
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+
+        if self._avg_latency is None:
+            self._avg_latency = latency
+        else:
+            self._avg_latency += (latency - self._avg_latency) * self._smoothing
+
+        now = time.monotonic()
+        if self._avg_latency > self._min_latency * self._tolerance:
+            # Decrease at most once per average latency
+            if now - self._last_decreased_at > self._avg_latency:
+                self.limit = max(self._min_limit, self.limit * self._backoff_ratio)
+                self._last_decreased_at = now
+
+                # Let the baseline follow a persistent latency shift
+                self._min_latency += (self._avg_latency - self._min_latency) * 0.1
+
+        elif self.in_flight + 1 >= self.limit / 2:
+            self.limit = min(self._max_limit, self.limit + 1 / self.limit)
+
+
+class AdmissionController(object):
+    def __init__(self, conf: dict, max_workers: int):
+        self._queue_timeout = conf.get("queue_timeout", 1.0)
+        self._low_priority_ratio = conf.get("low_priority_ratio", 0.8)
+        self._adaptive_conf = conf.get("adaptive", {})
+        self._method_conf = conf.get("methods", {})
+
+        global_limit = conf.get("max_concurrency") or max_workers
+        self._global_limit = global_limit
+        self._global_limiter = _Limiter("global", global_limit)
+        self._low_priority_reserve = int(
+            global_limit * (1 - self._low_priority_ratio)
+        )
+
+        # method -> (priority, limiter)
+        self._methods = {}
+        self._lock = threading.Lock()
+
+    def get_priority(self, method: str) -> str:
+        return self._get_method_policy(method)[0]
+
+    def wrap_handler(self, method: str, handler):
+        """Wraps the handler of a request, before it is dispatched to the thread pool.
+
+        The sync server calls interceptors in its polling thread, so the time of
+        wrapping is the time the request starts to wait for a worker thread.
+        """
+
+        priority, limiter = self._get_method_policy(method)
+        if priority == CRITICAL:
+            return handler
+
+        received_at = time.monotonic()
+
+        if handler.request_streaming and handler.response_streaming:
+            return handler._replace(
+                stream_stream=self._wrap_stream(
+                    method, handler.stream_stream, received_at
+                )
+            )
+        elif handler.request_streaming:
+            return handler._replace(
+                stream_unary=self._wrap_unary(method, handler.stream_unary, received_at)
+            )
+        elif handler.response_streaming:
+            return handler._replace(
+                unary_stream=self._wrap_stream(
+                    method, handler.unary_stream, received_at
+                )
+            )
+        else:
+            return handler._replace(
+                unary_unary=self._wrap_unary(method, handler.unary_unary, received_at)
+            )
+
+    def _get_method_policy(self, method: str):
+        if method not in self._methods:
+            with self._lock:
+                if method not in self._methods:
+                    self._methods[method] = self._make_method_policy(method)
+
+        return self._methods[method]
+
+    def _make_method_policy(self, method: str):
+        method_keys = _get_method_keys(method)
+
+        for service in _CRITICAL_SERVICES:
+            if service in method_keys:
+                return CRITICAL, None
+
+        method_conf = {}
+        for key in method_keys:
+            if key in self._method_conf:
+                method_conf = self._method_conf[key]
+                break
+
+        # Each method learns its own limit, so a slow method is throttled
+        # without affecting the others
+        limiter = None
+        if max_concurrency := method_conf.get("max_concurrency"):
+            limiter = _Limiter(method, max_concurrency, self._adaptive_conf)
+        elif self._adaptive_conf.get("enabled", False):
+            limiter = _Limiter(method, self._global_limit, self._adaptive_conf)
+
+        return method_conf.get("priority", NORMAL), limiter
+
+    def _get_queue_timeout(self, context) -> float:
+        time_remaining = context.time_remaining()
+        if time_remaining is None:
+            return self._queue_timeout
+
+        return max(min(self._queue_timeout, time_remaining), 0)
+
+    def _get_reserve(self, priority: str) -> int:
+        return self._low_priority_reserve if priority == LOW else 0
+
+    def _admit(self, method: str, context, received_at: float) -> Union[str, None]:
+        """Returns a reject reason, or None when the request is admitted.
+
+        It runs in a worker thread and never waits for a slot, a waiting request
+        would hold the thread that the other methods need. The time spent in the
+        queue of the thread pool is limited by the queue timeout instead.
+        """
+
+        queue_time = time.monotonic() - received_at
+        time_remaining = context.time_remaining()
+        if queue_time > self._queue_timeout or (
+            time_remaining is not None and time_remaining <= 0
+        ):
+            return f"queue timeout ({queue_time:.3f}s in the thread pool)"
+
+        priority, limiter = self._get_method_policy(method)
+
+        if limiter and not limiter.try_acquire():
+            return f"method concurrency limit ({int(limiter.limit)})"
+
+        if not self._global_limiter.try_acquire(self._get_reserve(priority)):
+            if limiter:
+                limiter.release()
+            return f"global concurrency limit ({int(self._global_limiter.limit)})"
+
+        return None
+
+    async def _admit_async(self, method: str, context) -> Union[str, None]:
+        priority, limiter = self._get_method_policy(method)
+        deadline = time.monotonic() + self._get_queue_timeout(context)
+
+        if limiter and not await limiter.acquire_async(deadline - time.monotonic()):
+            return f"method concurrency limit ({int(limiter.limit)})"
+
+        if not await self._global_limiter.acquire_async(
+            max(deadline - time.monotonic(), 0), self._get_reserve(priority)
+        ):
+            if limiter:
+                limiter.release()
+            return f"global concurrency limit ({int(self._global_limiter.limit)})"
+
+        return None
+
+    def _release(self, method: str, latency: float = None) -> None:
+        priority, limiter = self._get_method_policy(method)
+        self._global_limiter.release()
+
+        if limiter:
+            limiter.release(latency)
+
+    @staticmethod
+    def _make_reject_details(method: str, reason: str) -> str:
+        _LOGGER.debug(f"[AdmissionController] reject request: {method} ({reason})")
+        error = ERROR_RESOURCE_EXHAUSTED(method=method, reason=reason)
+        return f"{error.error_code}: {error.message}"
+
+    def _wrap_unary(self, method: str, behavior, received_at: float):
+        if inspect.iscoroutinefunction(behavior):
+            return self._wrap_async_unary(method, behavior)
+
+        def wrapper(request_or_iterator, context):
+            if reason := self._admit(method, context, received_at):
+                context.abort(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                    self._make_reject_details(method, reason),
+                )
+
+            started_at = time.monotonic()
+            try:
+                return behavior(request_or_iterator, context)
+            finally:
+                self._release(method, time.monotonic() - started_at)
+
+        return wrapper
+
+    def _wrap_stream(self, method: str, behavior, received_at: float):
+        if inspect.isasyncgenfunction(behavior):
+            return self._wrap_async_stream(method, behavior)
+
+        def wrapper(request_or_iterator, context):
+            if reason := self._admit(method, context, received_at):
+                context.abort(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                    self._make_reject_details(method, reason),
+                )
+
+            try:
+                response_iterator = behavior(request_or_iterator, context)
+            except Exception:
+                self._release(method)
+                raise
+
+            return self._generate_response(method, response_iterator)
+
+        return wrapper
+
+    def _generate_response(self, method: str, response_iterator):
+        # Streaming latency is not used for the adaptive limit
+        try:
+            yield from response_iterator
+        finally:
+            self._release(method)
+
+    def _wrap_async_unary(self, method: str, behavior):
+        async def wrapper(request_or_iterator, context):
+            if reason := await self._admit_async(method, context):
+                await context.abort(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                    self._make_reject_details(method, reason),
+                )
+
+            started_at = time.monotonic()
+            try:
+                return await behavior(request_or_iterator, context)
+            finally:
+                self._release(method, time.monotonic() - started_at)
+
+        return wrapper
+
+    def _wrap_async_stream(self, method: str, behavior):
+        async def wrapper(request_or_iterator, context):
+            if reason := await self._admit_async(method, context):
+                await context.abort(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                    self._make_reject_details(method, reason),
+                )
+
+            try:
+                async for response in behavior(request_or_iterator, context):
+                    yield response
+            finally:
+                self._release(method)
+
+        return wrapper
+
+
+def _get_method_keys(method: str) -> list:
+    # e.g. /spaceone.api.cost_analysis.v1.Cost/analyze
+    #   -> [/spaceone.api.cost_analysis.v1.Cost/analyze,
+    #       spaceone.api.cost_analysis.v1.Cost, Cost.analyze, analyze]
+    service, _, method_name = method.lstrip("/").rpartition("/")
+    short_service = service.rsplit(".", 1)[-1]
+    return [method, service, f"{short_service}.{method_name}", method_name]
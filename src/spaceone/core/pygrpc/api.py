@@ -1,19 +1,26 @@
 import grpc
 import inspect
 import logging
+import sys
+import time
 import types
-from collections.abc import Iterable
+from collections.abc import AsyncIterable, Iterable
+from contextvars import ContextVar
 
 from google.protobuf.descriptor import ServiceDescriptor
-from google.protobuf.json_format import MessageToDict, ParseDict
 from google.protobuf.empty_pb2 import Empty
 from google.protobuf.struct_pb2 import Struct
 
 from spaceone.core import config
 from spaceone.core.error import *
 from spaceone.core.locator import Locator
+from spaceone.core.pygrpc import message_converter
 
 _LOGGER = logging.getLogger(__name__)
+_GRPC_METHOD_NAME = ContextVar("grpc_method_name", default=None)
+
+# gRPC reports about 9.2e18 seconds remaining when the client set no deadline
+_MAX_TIME_REMAINING = 1e9
 
 
 class BaseAPI(object):
@@ -25,6 +32,7 @@ class BaseAPI(object):
     def __init__(self):
         self._desc_pool = self.pb2.DESCRIPTOR.pool
         self._grpc_messages = {}
+        self._response_messages = {}
         self._load_grpc_messages()
         self._check_variables()
         self._set_grpc_method()
@@ -50,6 +58,17 @@ class BaseAPI(object):
                 "request": method_desc.input_type.name,
                 "response": method_desc.output_type.name,
             }
+            self._response_messages[method_desc.name] = self._get_message_class(
+                method_desc.output_type.name
+            )
+
+    def _get_message_class(self, message_name):
+        if hasattr(self.pb2, message_name):
+            return getattr(self.pb2, message_name)
+        elif message_name == "Struct":
+            return Struct
+        else:
+            return None
 
     def _check_variables(self):
         if not hasattr(self, "pb2"):
@@ -85,7 +104,7 @@ class BaseAPI(object):
                 setattr(self, f_name, self._grpc_method(f_object))
 
     @staticmethod
-    def _error_method(error, context):
+    def _make_error_status(error):
         if not isinstance(error, ERROR_BASE):
             error = ERROR_UNKNOWN(message=error)
 
@@ -93,34 +112,99 @@ class BaseAPI(object):
             _LOGGER.error(f"(Error) => {error.message} {error}", exc_info=True)
 
         details = f"{error.error_code}: {error.message}"
-        context.abort(grpc.StatusCode[error.status_code], details)
+        return grpc.StatusCode[error.status_code], details
 
-    def _generate_response(self, response_iterator, context):
+    def _error_method(self, error, context):
+        context.abort(*self._make_error_status(error))
+
+    async def _async_error_method(self, error, context):
+        await context.abort(*self._make_error_status(error))
+
+    def _generate_response(self, method_name, response_iterator, context):
+        # Set only while the iterator runs, the consumer of each response may
+        # be other work on the same thread
         try:
-            for response in response_iterator:
+            while True:
+                token = _GRPC_METHOD_NAME.set(method_name)
+                try:
+                    response = next(response_iterator)
+                except StopIteration:
+                    return
+                finally:
+                    _GRPC_METHOD_NAME.reset(token)
+
                 yield response
 
         except Exception as e:
             self._error_method(e, context)
 
     def _grpc_method(self, func):
+        if inspect.isasyncgenfunction(func):
+            return self._async_generator_grpc_method(func)
+        elif inspect.iscoroutinefunction(func):
+            return self._async_grpc_method(func)
+
+        method_name = func.__name__
+
         def wrapper(request_or_iterator, context):
+            token = _GRPC_METHOD_NAME.set(method_name)
             try:
                 response_or_iterator = func(self, request_or_iterator, context)
 
                 if isinstance(response_or_iterator, types.GeneratorType):
-                    return self._generate_response(response_or_iterator, context)
+                    return self._generate_response(
+                        method_name, response_or_iterator, context
+                    )
                 else:
                     return response_or_iterator
 
             except Exception as e:
                 self._error_method(e, context)
+            finally:
+                _GRPC_METHOD_NAME.reset(token)
+
+        return wrapper
+
+    def _async_grpc_method(self, func):
+        method_name = func.__name__
+
+        async def wrapper(request_or_iterator, context):
+            token = _GRPC_METHOD_NAME.set(method_name)
+            try:
+                return await func(self, request_or_iterator, context)
+
+            except Exception as e:
+                await self._async_error_method(e, context)
+            finally:
+                _GRPC_METHOD_NAME.reset(token)
+
+        return wrapper
+
+    def _async_generator_grpc_method(self, func):
+        method_name = func.__name__
+
+        async def wrapper(request_or_iterator, context):
+            response_iterator = func(self, request_or_iterator, context)
+            try:
+                while True:
+                    token = _GRPC_METHOD_NAME.set(method_name)
+                    try:
+                        response = await response_iterator.__anext__()
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        _GRPC_METHOD_NAME.reset(token)
+
+                    yield response
+
+            except Exception as e:
+                await self._async_error_method(e, context)
 
         return wrapper
 
     @staticmethod
     def _convert_message(request):
-        return MessageToDict(request, preserving_proto_field_name=True)
+        return message_converter.message_to_dict(request)
 
     @staticmethod
     def _get_metadata(context):
@@ -129,14 +213,29 @@ class BaseAPI(object):
             metadata[key.strip()] = value.strip()
 
         metadata.update({"peer": context.peer()})
+
+        # Absolute deadline of the caller, propagated to downstream calls
+        metadata.pop("deadline", None)
+        time_remaining = context.time_remaining()
+        if time_remaining is not None and time_remaining < _MAX_TIME_REMAINING:
+            metadata["deadline"] = time.time() + time_remaining
+
         return metadata
 
     def _generate_message(self, request_iterator):
         for request in request_iterator:
             yield self._convert_message(request)
 
+    async def _async_generate_message(self, request_iterator):
+        async for request in request_iterator:
+            yield self._convert_message(request)
+
     def parse_request(self, request_or_iterator, context):
-        if isinstance(request_or_iterator, Iterable):
+        if isinstance(request_or_iterator, AsyncIterable):
+            return self._async_generate_message(
+                request_or_iterator
+            ), self._get_metadata(context)
+        elif isinstance(request_or_iterator, Iterable):
             return self._generate_message(request_or_iterator), self._get_metadata(
                 context
             )
@@ -149,21 +248,19 @@ class BaseAPI(object):
         return Empty()
 
     def dict_to_message(self, response: dict):
-        # Get grpc method name from call stack
-        method_name = inspect.stack()[1][3]
+        # Get grpc method name from the current call, or the caller's frame
+        # when invoked outside a gRPC call
+        method_name = _GRPC_METHOD_NAME.get() or sys._getframe(1).f_code.co_name
 
-        response_message_name = self._grpc_messages[method_name]["response"]
+        response_message_class = self._response_messages.get(method_name)
 
-        if hasattr(self.pb2, response_message_name):
-            response_message = getattr(self.pb2, response_message_name)()
-        elif response_message_name == "Struct":
-            response_message = Struct()
-        else:
+        if response_message_class is None:
+            response_message_name = self._grpc_messages[method_name]["response"]
             raise Exception(
                 f"Not found response message in pb2. (message={response_message_name})"
             )
 
-        return ParseDict(response, response_message)
+        return message_converter.dict_to_message(response, response_message_class)
 
     @staticmethod
     def get_minimal(params: dict):
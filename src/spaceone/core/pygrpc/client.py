@@ -1,28 +1,50 @@
+import asyncio
+import itertools
 import logging
+import threading
+import time
 import types
+import weakref
 import grpc
 from grpc import ClientCallDetails
-from google.protobuf.json_format import ParseDict
 from google.protobuf.message_factory import MessageFactory  # , GetMessageClass
-from google.protobuf.descriptor_pool import DescriptorPool
 from google.protobuf.descriptor import ServiceDescriptor, MethodDescriptor
-from grpc_reflection.v1alpha.proto_reflection_descriptor_database import (
-    ProtoReflectionDescriptorDatabase,
-)
+from spaceone.core import config
+from spaceone.core import utils
 from spaceone.core.error import *
+from spaceone.core.pygrpc import compression, descriptor_cache
+from spaceone.core.pygrpc.message_converter import dict_to_message
+from spaceone.core.pygrpc.retry import RetryPolicy, RetryBudget, CircuitBreaker
+from spaceone.core.transaction import get_time_remaining
 
-_MAX_RETRIES = 2
+_CHANNEL_READY_TIMEOUT = 3
+_REFLECTION_TIMEOUT = 10
 _GRPC_CHANNEL = {}
+_GRPC_CHANNEL_LOCKS = {}
+_GRPC_AIO_CHANNEL = weakref.WeakKeyDictionary()
+_CHANNEL_OPTIONS = {
+    # GRPC_CLIENT key : channel argument
+    "keepalive_time_ms": "grpc.keepalive_time_ms",
+    "keepalive_timeout_ms": "grpc.keepalive_timeout_ms",
+    "keepalive_permit_without_calls": "grpc.keepalive_permit_without_calls",
+    "max_reconnect_backoff_ms": "grpc.max_reconnect_backoff_ms",
+    "http2_lookahead_bytes": "grpc.http2.lookahead_bytes",
+    "http2_bdp_probe": "grpc.http2.bdp_probe",
+    "http2_max_frame_size": "grpc.http2.max_frame_size",
+}
 _LOGGER = logging.getLogger(__name__)
 
 
 class _ClientCallDetails(ClientCallDetails):
-    def __init__(self, method, timeout, metadata, credentials, wait_for_ready):
+    def __init__(
+        self, method, timeout, metadata, credentials, wait_for_ready, compression=None
+    ):
         self.method = method
         self.timeout = timeout
         self.metadata = metadata
         self.credentials = credentials
         self.wait_for_ready = wait_for_ready
+        self.compression = compression
 
 
 class _ClientInterceptor(
@@ -32,13 +54,44 @@ class _ClientInterceptor(
     grpc.StreamStreamClientInterceptor,
 ):
     def __init__(
-        self, options: dict, channel_key: str, request_map: dict, timeout: int = None
+        self,
+        options: dict,
+        channel_key: str,
+        request_map: dict,
+        timeout: int = None,
+        client_conf: dict = None,
     ):
+        client_conf = client_conf or {}
+        retry_conf = client_conf.get("retry", {})
+
         self._request_map = request_map
         self._channel_key = channel_key
         self.metadata = options.get("metadata", {})
         self.timeout = timeout or 180
 
+        # Shared by all calls of the endpoint
+        self._retry_policy = RetryPolicy(retry_conf)
+        self._retry_budget = RetryBudget(
+            retry_conf.get("budget_ratio", 0.1), retry_conf.get("budget_max_tokens", 10)
+        )
+        self._circuit_breaker = CircuitBreaker(client_conf.get("circuit_breaker", {}))
+
+        self._compression = compression.get_compression(client_conf.get("compression"))
+        self._compression_threshold = client_conf.get("compression_threshold") or 0
+
+    def get_compression(self, request_or_iterator):
+        if self._compression is None:
+            return None
+
+        if isinstance(request_or_iterator, types.GeneratorType):
+            return self._compression
+
+        threshold = self._compression_threshold
+        if compression.is_compressible(request_or_iterator, threshold):
+            return self._compression
+
+        return grpc.Compression.NoCompression
+
     def _check_message(self, client_call_details, request_or_iterator, is_stream):
         if client_call_details.method in self._request_map:
             if is_stream:
@@ -60,7 +113,7 @@ class _ClientInterceptor(
 
     def _make_message(self, request, method_key):
         if isinstance(request, dict):
-            return ParseDict(request, self._request_map[method_key]())
+            return dict_to_message(request, self._request_map[method_key])
 
         else:
             return request
@@ -111,27 +164,105 @@ class _ClientInterceptor(
         return response
 
     def _generate_response(self, response_iterator):
+        is_recorded = False
         try:
             for response in response_iterator:
+                if not is_recorded:
+                    # A response has arrived, even if the stream is closed early
+                    self._record_result()
+                    is_recorded = True
+
                 yield self._check_error(response)
         except Exception as e:
-            self._check_error(e)
+            try:
+                self._check_error(e)
+            except ERROR_BASE as error:
+                if not is_recorded:
+                    self._record_result(error)
+                raise
+
+        if not is_recorded:
+            self._record_result()
+
+    @staticmethod
+    def _is_transient_error(error):
+        return (
+            error.error_code == "ERROR_GRPC_CONNECTION"
+            or error.status_code == "DEADLINE_EXCEEDED"
+        )
+
+    def _record_result(self, error=None):
+        # Only connection failures open the circuit. A timeout can be caused by
+        # the caller's deadline or a slow method of a healthy endpoint.
+        if error is None:
+            self._circuit_breaker.record_success()
+        elif error.error_code == "ERROR_GRPC_CONNECTION":
+            if self._circuit_breaker.record_failure():
+                _LOGGER.error(
+                    f"[_ClientInterceptor] circuit breaker is open: {self._channel_key}"
+                )
+        elif error.status_code != "DEADLINE_EXCEEDED":
+            # The endpoint has responded, so it is available
+            self._circuit_breaker.record_success()
+
+    def _check_circuit_breaker(self, method):
+        if not self._circuit_breaker.allow_request():
+            raise ERROR_GRPC_CONNECTION(
+                channel=self._channel_key,
+                message=f"Circuit breaker is open. (method = {method})",
+            )
+
+    def _get_retry_backoff(self, attempt):
+        if attempt >= self._retry_policy.max_retries:
+            return None
+
+        backoff = self._retry_policy.get_backoff(attempt)
+
+        # Do not retry if the caller would give up during the backoff
+        time_remaining = get_time_remaining()
+        if time_remaining is not None and time_remaining <= backoff:
+            return None
+
+        if not self._retry_budget.withdraw():
+            _LOGGER.debug(
+                f"[_ClientInterceptor] retry budget is exhausted: {self._channel_key}"
+            )
+            return None
+
+        return backoff
 
     def _retry_call(
-        self, continuation, client_call_details, request_or_iterator, is_stream
+        self,
+        continuation,
+        client_call_details,
+        request_or_iterator,
+        is_stream,
+        timeout=None,
+        is_retryable=False,
+        compression=None,
     ):
-        retries = 0
+        method = client_call_details.method
+        attempt = 0
+        self._retry_budget.deposit()
 
         while True:
+            # Recalculated on each retry, since the caller's deadline is shared
+            new_call_details = self._create_new_call_details(
+                client_call_details, timeout, compression
+            )
+            self._check_circuit_breaker(method)
+
             try:
                 response_or_iterator = continuation(
-                    client_call_details, request_or_iterator
+                    new_call_details, request_or_iterator
                 )
 
                 if is_stream:
+                    # The result is recorded while the responses are consumed
                     response_or_iterator = self._generate_response(response_or_iterator)
                 else:
                     self._check_error(response_or_iterator)
+                    self._record_result()
 
                 return response_or_iterator
 
@@ -139,29 +270,27 @@ class _ClientInterceptor(
                 if not isinstance(e, ERROR_BASE):
                     e = ERROR_UNKNOWN(message=str(e))
 
-                if (
-                    e.error_code == "ERROR_GRPC_CONNECTION"
-                    or e.status_code == "DEADLINE_EXCEEDED"
-                ):
-                    if retries >= _MAX_RETRIES:
-                        channel = e.meta.get("channel")
-                        if channel in _GRPC_CHANNEL:
-                            _LOGGER.error(
-                                f"Disconnect gRPC Endpoint. (channel = {channel})"
-                            )
-                            del _GRPC_CHANNEL[channel]
-
-                        if e.status_code == "DEADLINE_EXCEEDED":
-                            raise ERROR_GRPC_TIMEOUT()
-                        raise e
-                    else:
-                        _LOGGER.debug(
-                            f"Retry gRPC Call: method = {client_call_details.method}, reason = {e.message}, retry = {retries + 1}"
-                        )
-                else:
+                self._record_result(e)
+
+                if not self._is_transient_error(e):
                     raise e
 
-            retries += 1
+                backoff = None
+                if is_retryable:
+                    backoff = self._get_retry_backoff(attempt)
+
+                if backoff is None:
+                    if e.status_code == "DEADLINE_EXCEEDED":
+                        raise ERROR_GRPC_TIMEOUT()
+                    raise e
+
+                _LOGGER.debug(
+                    f"Retry gRPC Call: method = {method}, reason = {e.message}, "
+                    f"retry = {attempt + 1}, backoff = {backoff:.3f}s"
+                )
+                time.sleep(backoff)
+
+            attempt += 1
 
     def _intercept_call(
         self,
@@ -170,32 +299,55 @@ class _ClientInterceptor(
         request_or_iterator,
         is_request_stream,
         is_response_stream,
+        timeout=None,
     ):
         new_request_or_iterator = self._check_message(
             client_call_details, request_or_iterator, is_request_stream
         )
 
+        # Request streams cannot be replayed
+        is_retryable = not is_request_stream and self._retry_policy.is_idempotent(
+            client_call_details.method
+        )
+
         return self._retry_call(
             continuation,
             client_call_details,
             new_request_or_iterator,
             is_response_stream,
+            timeout,
+            is_retryable,
+            self.get_compression(new_request_or_iterator),
         )
 
-    def _create_new_call_details(self, client_call_details):
+    @staticmethod
+    def _get_timeout(timeout):
+        # Never wait longer than the caller of the current request
+        time_remaining = get_time_remaining()
+        if time_remaining is None:
+            return timeout
+        elif time_remaining == 0:
+            raise ERROR_REQUEST_TIMEOUT()
+        elif timeout is None:
+            return time_remaining
+        else:
+            return min(timeout, time_remaining)
+
+    def _create_new_call_details(
+        self, client_call_details, timeout=None, compression=None
+    ):
         return _ClientCallDetails(
             method=client_call_details.method,
-            timeout=self.timeout,
+            timeout=self._get_timeout(timeout or client_call_details.timeout),
             metadata=client_call_details.metadata,
             credentials=client_call_details.credentials,
             wait_for_ready=client_call_details.wait_for_ready,
+            compression=compression or client_call_details.compression,
         )
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
-        new_call_details = self._create_new_call_details(client_call_details)
-
         return self._intercept_call(
-            continuation, new_call_details, request, False, False
+            continuation, client_call_details, request, False, False, self.timeout
         )
 
     def intercept_unary_stream(self, continuation, client_call_details, request):
@@ -218,40 +370,31 @@ class _ClientInterceptor(
         )
 
 
+def _serialize_message(message):
+    # Independent of the message class, which is replaced on descriptor refresh
+    return message.SerializeToString()
+
+
 class _GRPCStub(object):
     def __init__(
         self,
-        desc_pool: DescriptorPool,
         service_desc: ServiceDescriptor,
         channel: grpc.Channel,
+        message_classes: dict,
     ):
-        self._desc_pool = desc_pool
         for method_desc in service_desc.methods:
-            self._bind_grpc_method(service_desc, method_desc, channel)
+            self._bind_grpc_method(service_desc, method_desc, channel, message_classes)
 
     def _bind_grpc_method(
         self,
         service_desc: ServiceDescriptor,
         method_desc: MethodDescriptor,
         channel: grpc.Channel,
+        message_classes: dict,
     ):
         method_name = method_desc.name
         method_key = f"/{service_desc.full_name}/{method_name}"
-        request_desc = self._desc_pool.FindMessageTypeByName(
-            method_desc.input_type.full_name
-        )
-        request_message_desc = MessageFactory(self._desc_pool).GetPrototype(
-            request_desc
-        )
-        # request_message_desc = GetMessageClass(request_desc)
-
-        response_desc = self._desc_pool.FindMessageTypeByName(
-            method_desc.output_type.full_name
-        )
-        response_message_desc = MessageFactory(self._desc_pool).GetPrototype(
-            response_desc
-        )
-        # response_message_desc = GetMessageClass(response_desc)
+        response_message_desc = message_classes[method_desc.output_type.full_name]
 
         if method_desc.client_streaming and method_desc.server_streaming:
             setattr(
@@ -259,7 +402,7 @@ class _GRPCStub(object):
                 method_name,
                 channel.stream_stream(
                     method_key,
-                    request_serializer=request_message_desc.SerializeToString,
+                    request_serializer=_serialize_message,
                     response_deserializer=response_message_desc.FromString,
                 ),
             )
@@ -269,7 +412,7 @@ class _GRPCStub(object):
                 method_name,
                 channel.stream_unary(
                     method_key,
-                    request_serializer=request_message_desc.SerializeToString,
+                    request_serializer=_serialize_message,
                     response_deserializer=response_message_desc.FromString,
                 ),
             )
@@ -279,7 +422,7 @@ class _GRPCStub(object):
                 method_name,
                 channel.unary_stream(
                     method_key,
-                    request_serializer=request_message_desc.SerializeToString,
+                    request_serializer=_serialize_message,
                     response_deserializer=response_message_desc.FromString,
                 ),
             )
@@ -289,59 +432,211 @@ class _GRPCStub(object):
                 method_name,
                 channel.unary_unary(
                     method_key,
-                    request_serializer=request_message_desc.SerializeToString,
+                    request_serializer=_serialize_message,
                     response_deserializer=response_message_desc.FromString,
                 ),
             )
 
 
+class _GRPCStubPool(object):
+    """Stubs of one service bound to each channel of the pool.
+
+    Each attribute access picks the stub of the next channel in round-robin.
+    """
+
+    def __init__(self, stubs: list):
+        self._stubs = itertools.cycle(stubs)
+
+    def __getattr__(self, method_name):
+        return getattr(next(self._stubs), method_name)
+
+
 class GRPCClient(object):
-    def __init__(self, channel, options, channel_key, timeout=None):
+    def __init__(self, channel, options, channel_key, timeout=None, client_conf=None):
+        client_conf = client_conf or {}
+
+        self._channel_key = channel_key
         self._request_map = {}
         self._api_resources = {}
+        self._methods = {}
+        self._message_classes = {}
+        self._passthrough_methods = {}
+        self._channel_index = itertools.count()
+        self._channels = channel if isinstance(channel, list) else [channel]
+        self._cache_path = client_conf.get("descriptor_cache_path")
+
+        self._client_interceptor = _ClientInterceptor(
+            options, channel_key, self._request_map, timeout, client_conf
+        )
+        self._intercept_channels = [
+            grpc.intercept_channel(channel, self._client_interceptor)
+            for channel in self._channels
+        ]
 
-        self._reflection_db = ProtoReflectionDescriptorDatabase(channel)
-        self._desc_pool = DescriptorPool(self._reflection_db)
         self._init_grpc_reflection()
 
-        _client_interceptor = _ClientInterceptor(
-            options, channel_key, self._request_map, timeout
-        )
-        _intercept_channel = grpc.intercept_channel(channel, _client_interceptor)
-        self._bind_grpc_stub(_intercept_channel)
-
     @property
     def api_resources(self):
         return self._api_resources
 
+    @property
+    def pool_size(self):
+        return len(self._channels)
+
+    def get_method(self, resource, verb):
+        """Returns (method key, method descriptor) of the resource, e.g. Domain.get"""
+
+        return self._methods[f"{resource}.{verb}"]
+
+    def get_message_class(self, full_name):
+        return self._message_classes[full_name]
+
+    def get_compression(self, request):
+        """Returns the call compression of the request for the endpoint."""
+
+        return self._client_interceptor.get_compression(request)
+
+    def get_passthrough_method(self, resource, verb):
+        """Returns a multicallable which returns responses as serialized bytes.
+
+        The responses can be relayed by a servicer without parsing them again.
+        """
+
+        method_key, method_desc = self.get_method(resource, verb)
+        if method_desc.client_streaming:
+            raise KeyError(f"{resource}.{verb} (request streaming)")
+
+        # Pick a channel of the pool in round-robin
+        index = next(self._channel_index) % len(self._intercept_channels)
+        cache_key = (method_key, index)
+
+        if cache_key not in self._passthrough_methods:
+            channel = self._intercept_channels[index]
+            if method_desc.server_streaming:
+                make_method = channel.unary_stream
+            else:
+                make_method = channel.unary_unary
+
+            self._passthrough_methods[cache_key] = make_method(
+                method_key,
+                request_serializer=_serialize_message,
+                response_deserializer=None,
+            )
+
+        return self._passthrough_methods[cache_key]
+
+    def check_error(self, response):
+        return self._client_interceptor._check_error(response)
+
     def _init_grpc_reflection(self):
-        for service in self._reflection_db.get_services():
-            service_desc: ServiceDescriptor = self._desc_pool.FindServiceByName(service)
-            service_name = service_desc.name
+        descriptor_set = None
+        version = None
+
+        if self._cache_path:
+            version = descriptor_cache.get_server_version(
+                self._channels[0], _REFLECTION_TIMEOUT
+            )
+            descriptor_set = descriptor_cache.load_descriptor_set(
+                self._cache_path, self._channel_key, version
+            )
+
+        if descriptor_set:
+            self._bind_descriptor_set(descriptor_set)
+
+            # The cache may be stale if the server has been changed without a new version
+            threading.Thread(
+                target=self._refresh_descriptor_set,
+                args=(version, descriptor_set),
+                daemon=True,
+            ).start()
+
+        else:
+            descriptor_set = descriptor_cache.fetch_descriptor_set(
+                self._channels[0], _REFLECTION_TIMEOUT
+            )
+            self._bind_descriptor_set(descriptor_set)
+
+            if self._cache_path:
+                descriptor_cache.save_descriptor_set(
+                    self._cache_path, self._channel_key, version, descriptor_set
+                )
+
+    def _refresh_descriptor_set(self, version, cached_descriptor_set):
+        try:
+            descriptor_set = descriptor_cache.fetch_descriptor_set(
+                self._channels[0], _REFLECTION_TIMEOUT
+            )
+        except Exception as e:
+            _LOGGER.debug(
+                f"[GRPCClient] failed to refresh descriptors: {self._channel_key} ({e})"
+            )
+            return
+
+        serialized = descriptor_set.SerializeToString(deterministic=True)
+        cached = cached_descriptor_set.SerializeToString(deterministic=True)
+
+        if serialized != cached:
+            _LOGGER.debug(f"[GRPCClient] descriptors are changed: {self._channel_key}")
+            self._bind_descriptor_set(descriptor_set)
+            descriptor_cache.save_descriptor_set(
+                self._cache_path, self._channel_key, version, descriptor_set
+            )
+
+    def _bind_descriptor_set(self, descriptor_set):
+        desc_pool = descriptor_cache.make_descriptor_pool(descriptor_set)
+        service_names = descriptor_cache.get_services(descriptor_set)
+
+        # Each message class is built once and shared by all stubs
+        message_factory = MessageFactory(desc_pool)
+        message_classes = {}
+        service_descs = []
+        request_map = {}
+        api_resources = {}
+        methods = {}
+
+        for service in service_names:
+            service_desc: ServiceDescriptor = desc_pool.FindServiceByName(service)
+            service_descs.append(service_desc)
+            api_resources[service_desc.name] = []
+
             for method_desc in service_desc.methods:
+                for message_desc in [method_desc.input_type, method_desc.output_type]:
+                    full_name = message_desc.full_name
+                    if full_name not in message_classes:
+                        message_classes[full_name] = message_factory.GetPrototype(
+                            message_desc
+                        )
+
                 method_key = f"/{service}/{method_desc.name}"
-                request_desc = self._desc_pool.FindMessageTypeByName(
+                request_map[method_key] = message_classes[
                     method_desc.input_type.full_name
+                ]
+                api_resources[service_desc.name].append(method_desc.name)
+                methods[f"{service_desc.name}.{method_desc.name}"] = (
+                    method_key,
+                    method_desc,
                 )
-                self._request_map[method_key] = MessageFactory(
-                    self._desc_pool
-                ).GetPrototype(request_desc)
-                # self._request_map[method_key] = GetMessageClass(request_desc)
 
-                if service_desc.name not in self._api_resources:
-                    self._api_resources[service_name] = []
+        # The request map is shared with the interceptor
+        self._request_map.update(request_map)
+        self._api_resources = api_resources
+        self._message_classes = message_classes
+        self._methods = methods
 
-                self._api_resources[service_desc.name].append(method_desc.name)
+        for service_desc in service_descs:
+            stubs = [
+                _GRPCStub(service_desc, intercept_channel, message_classes)
+                for intercept_channel in self._intercept_channels
+            ]
 
-    def _bind_grpc_stub(self, intercept_channel: grpc.Channel):
-        for service in self._reflection_db.get_services():
-            service_desc: ServiceDescriptor = self._desc_pool.FindServiceByName(service)
+            if len(stubs) == 1:
+                setattr(self, service_desc.name, stubs[0])
+            else:
+                setattr(self, service_desc.name, _GRPCStubPool(stubs))
 
-            setattr(
-                self,
-                service_desc.name,
-                _GRPCStub(self._desc_pool, service_desc, intercept_channel),
-            )
+    def close(self):
+        for channel in self._channels:
+            channel.close()
 
 
 def _create_secure_channel(endpoint, options):
@@ -359,46 +654,137 @@ def _create_insecure_channel(endpoint, options):
     return grpc.insecure_channel(endpoint, options=options)
 
 
+def _get_channel_options(client_conf, max_message_length=None, pool_size=1):
+    options = []
+    max_message_length = client_conf.get("max_message_length") or max_message_length
+
+    if max_message_length:
+        options.append(("grpc.max_send_message_length", max_message_length))
+        options.append(("grpc.max_receive_message_length", max_message_length))
+
+    if lb_policy := client_conf.get("lb_policy"):
+        # Balances calls over all addresses resolved by DNS (e.g. headless service)
+        options.append(("grpc.lb_policy_name", lb_policy))
+
+    for key, option_name in _CHANNEL_OPTIONS.items():
+        value = client_conf.get(key)
+        if value is not None:
+            options.append((option_name, int(value)))
+
+    if pool_size > 1:
+        # Otherwise all channels of the pool share the same connections
+        options.append(("grpc.use_local_subchannel_pool", 1))
+
+    return options
+
+
+def _get_client_conf(channel_conf=None):
+    client_conf = config.get_global("GRPC_CLIENT", {})
+
+    if channel_conf:
+        client_conf = utils.deep_merge(channel_conf, client_conf)
+
+    return client_conf
+
+
+def _create_channels(endpoint, ssl_enabled, options, pool_size):
+    channels = []
+    for _ in range(pool_size):
+        if ssl_enabled:
+            channels.append(_create_secure_channel(endpoint, options))
+        else:
+            channels.append(_create_insecure_channel(endpoint, options))
+
+    deadline = time.monotonic() + _CHANNEL_READY_TIMEOUT
+    ready_futures = [grpc.channel_ready_future(channel) for channel in channels]
+
+    try:
+        for ready_future in ready_futures:
+            ready_future.result(timeout=max(deadline - time.monotonic(), 0))
+    except Exception:
+        for channel in channels:
+            channel.close()
+
+        raise ERROR_GRPC_CONNECTION(channel=endpoint, message="Channel is not ready.")
+
+    return channels
+
+
+def _get_channel_lock(endpoint):
+    # dict.setdefault is atomic, so only one lock is used per endpoint
+    return _GRPC_CHANNEL_LOCKS.setdefault(endpoint, threading.Lock())
+
+
 def client(
     endpoint=None,
     ssl_enabled=False,
     max_message_length=None,
     timeout=None,
+    channel_conf=None,
     **client_opts,
 ):
+    """Returns the gRPC client of the endpoint.
+
+    channel_conf overrides GRPC_CLIENT for the endpoint. Clients are cached
+    per endpoint, so the channel_conf of the first call is used.
+    """
+
     if endpoint is None:
         raise Exception("Client's endpoint is undefined.")
 
-    if endpoint not in _GRPC_CHANNEL:
-        options = []
+    if grpc_client := _GRPC_CHANNEL.get(endpoint):
+        return grpc_client
 
-        if max_message_length:
-            options.append(("grpc.max_send_message_length", max_message_length))
-            options.append(("grpc.max_receive_message_length", max_message_length))
+    # Concurrent first calls wait for one client instead of creating duplicates
+    with _get_channel_lock(endpoint):
+        if grpc_client := _GRPC_CHANNEL.get(endpoint):
+            return grpc_client
 
-        if ssl_enabled:
-            channel = _create_secure_channel(endpoint, options)
-        else:
-            channel = _create_insecure_channel(endpoint, options)
+        client_conf = _get_client_conf(channel_conf)
+        pool_size = max(client_conf.get("pool_size") or 1, 1)
+        options = _get_channel_options(client_conf, max_message_length, pool_size)
+        channels = _create_channels(endpoint, ssl_enabled, options, pool_size)
 
         try:
-            grpc.channel_ready_future(channel).result(timeout=3)
-        except Exception as e:
-            raise ERROR_GRPC_CONNECTION(
-                channel=endpoint, message="Channel is not ready."
-            )
-
-        try:
-            _GRPC_CHANNEL[endpoint] = GRPCClient(
-                channel, client_opts, endpoint, timeout
+            grpc_client = GRPCClient(
+                channels, client_opts, endpoint, timeout, client_conf
             )
         except Exception as e:
+            for channel in channels:
+                channel.close()
+
             if hasattr(e, "details"):
                 raise ERROR_GRPC_CONNECTION(channel=endpoint, message=e.details())
             else:
                 raise ERROR_GRPC_CONNECTION(channel=endpoint, message=str(e))
 
-    return _GRPC_CHANNEL[endpoint]
+        _GRPC_CHANNEL[endpoint] = grpc_client
+        return grpc_client
+
+
+def aio_channel(
+    endpoint, ssl_enabled=False, max_message_length=None, channel_conf=None
+):
+    """Returns a grpc.aio channel of the endpoint for the running event loop.
+
+    grpc.aio channels are bound to the event loop, so they are cached per loop.
+    """
+
+    loop = asyncio.get_running_loop()
+    channels = _GRPC_AIO_CHANNEL.setdefault(loop, {})
+
+    if endpoint not in channels:
+        client_conf = _get_client_conf(channel_conf)
+        options = _get_channel_options(client_conf, max_message_length)
+
+        if ssl_enabled:
+            channels[endpoint] = grpc.aio.secure_channel(
+                endpoint, grpc.ssl_channel_credentials(), options=options
+            )
+        else:
+            channels[endpoint] = grpc.aio.insecure_channel(endpoint, options=options)
+
+    return channels[endpoint]
 
 
 def get_grpc_method(uri_info):
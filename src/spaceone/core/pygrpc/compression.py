@@ -0,0 +1,91 @@
+import inspect
+from typing import Union
+
+import grpc
+
+from spaceone.core.error import ERROR_CONFIGURATION
+
+__all__ = ["get_compression", "is_compressible", "wrap_handler"]
+
+_COMPRESSIONS = {
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+
+def get_compression(name: Union[str, None]) -> Union[grpc.Compression, None]:
+    if not name or name == "none":
+        return None
+
+    if name not in _COMPRESSIONS:
+        raise ERROR_CONFIGURATION(key=f"compression ({name})")
+
+    return _COMPRESSIONS[name]
+
+
+def is_compressible(message, threshold: int) -> bool:
+    # Small messages do not pay off the CPU cost and the compression header
+    if isinstance(message, bytes):
+        return len(message) >= threshold
+    elif hasattr(message, "ByteSize"):
+        return message.ByteSize() >= threshold
+
+    return True
+
+
+def wrap_handler(handler, threshold: int):
+    """Disables the server compression for responses smaller than threshold."""
+
+    if handler.request_streaming and handler.response_streaming:
+        return handler._replace(
+            stream_stream=_wrap_stream(handler.stream_stream, threshold)
+        )
+    elif handler.request_streaming:
+        return handler._replace(
+            stream_unary=_wrap_unary(handler.stream_unary, threshold)
+        )
+    elif handler.response_streaming:
+        return handler._replace(
+            unary_stream=_wrap_stream(handler.unary_stream, threshold)
+        )
+    else:
+        return handler._replace(unary_unary=_wrap_unary(handler.unary_unary, threshold))
+
+
+def _check_response(response, context, threshold: int):
+    if not is_compressible(response, threshold):
+        context.disable_next_message_compression()
+
+    return response
+
+
+def _wrap_unary(behavior, threshold: int):
+    if inspect.iscoroutinefunction(behavior):
+
+        async def async_wrapper(request_or_iterator, context):
+            response = await behavior(request_or_iterator, context)
+            return _check_response(response, context, threshold)
+
+        return async_wrapper
+
+    def wrapper(request_or_iterator, context):
+        response = behavior(request_or_iterator, context)
+        return _check_response(response, context, threshold)
+
+    return wrapper
+
+
+def _wrap_stream(behavior, threshold: int):
+    if inspect.isasyncgenfunction(behavior):
+
+        async def async_wrapper(request_or_iterator, context):
+            async for response in behavior(request_or_iterator, context):
+                yield _check_response(response, context, threshold)
+
+        return async_wrapper
+
+    def wrapper(request_or_iterator, context):
+        for response in behavior(request_or_iterator, context):
+            yield _check_response(response, context, threshold)
+
+    return wrapper
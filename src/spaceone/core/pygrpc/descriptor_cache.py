@@ -0,0 +1,165 @@
+import logging
+import os
+import re
+import tempfile
+from typing import List, Union
+
+import grpc
+from google.protobuf.descriptor_database import DescriptorDatabase
+from google.protobuf.descriptor_pb2 import FileDescriptorSet, FileDescriptorProto
+from google.protobuf.descriptor_pool import DescriptorPool
+from google.protobuf.wrappers_pb2 import StringValue
+from grpc_reflection.v1alpha.reflection_pb2 import ServerReflectionRequest
+from grpc_reflection.v1alpha.reflection_pb2_grpc import ServerReflectionStub
+
+__all__ = [
+    "fetch_descriptor_set",
+    "get_server_version",
+    "get_services",
+    "make_descriptor_pool",
+    "load_descriptor_set",
+    "save_descriptor_set",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+# Names of the services served by the endpoint are kept in a pseudo file of
+# the descriptor set, since a proto file may define services which are not served
+_SERVICES_FILE_NAME = "spaceone/core/pygrpc/served_services"
+_GET_VERSION_METHOD = "/spaceone.api.core.v1.ServerInfo/get_version"
+_UNKNOWN_VERSION = "UNKNOWN"
+
+
+def fetch_descriptor_set(channel: grpc.Channel, timeout: float = None):
+    """Fetch descriptors of all services from the server reflection.
+
+    All files are requested in a single reflection stream instead of one
+    stream per symbol.
+    """
+
+    stub = ServerReflectionStub(channel)
+    services = []
+    files = {}
+
+    (response,) = _request(stub, [ServerReflectionRequest(list_services="")], timeout)
+    for service in response.list_services_response.service:
+        services.append(service.name)
+
+    requests = [
+        ServerReflectionRequest(file_containing_symbol=service) for service in services
+    ]
+    for response in _request(stub, requests, timeout):
+        if response.HasField("error_response"):
+            raise KeyError(response.error_response.error_message)
+
+        _add_files(files, response)
+
+    # Servers usually send transitive dependencies, but it is not required
+    while missing_files := _get_missing_files(files):
+        requests = [
+            ServerReflectionRequest(file_by_filename=name) for name in missing_files
+        ]
+        for response in _request(stub, requests, timeout):
+            if response.HasField("error_response"):
+                raise KeyError(response.error_response.error_message)
+
+            _add_files(files, response)
+
+    descriptor_set = FileDescriptorSet()
+    for name in sorted(files):
+        descriptor_set.file.append(files[name])
+
+    services_file = descriptor_set.file.add(name=_SERVICES_FILE_NAME)
+    for service in services:
+        services_file.service.add(name=service)
+
+    return descriptor_set
+
+
+def _request(stub: ServerReflectionStub, requests: list, timeout: float = None):
+    return list(stub.ServerReflectionInfo(iter(requests), timeout=timeout))
+
+
+def _add_files(files: dict, response) -> None:
+    for serialized_file in response.file_descriptor_response.file_descriptor_proto:
+        file_desc = FileDescriptorProto.FromString(serialized_file)
+        files[file_desc.name] = file_desc
+
+
+def _get_missing_files(files: dict) -> List[str]:
+    missing_files = set()
+    for file_desc in files.values():
+        for dependency in file_desc.dependency:
+            if dependency not in files:
+                missing_files.add(dependency)
+
+    return sorted(missing_files)
+
+
+def get_server_version(channel: grpc.Channel, timeout: float = None) -> str:
+    # VersionInfo has the same wire format as StringValue
+    try:
+        get_version = channel.unary_unary(_GET_VERSION_METHOD)
+        return StringValue.FromString(get_version(b"", timeout=timeout)).value
+    except Exception as e:
+        _LOGGER.debug(f"[get_server_version] failed to get server version: {e}")
+        return _UNKNOWN_VERSION
+
+
+def get_services(descriptor_set: FileDescriptorSet) -> List[str]:
+    for file_desc in descriptor_set.file:
+        if file_desc.name == _SERVICES_FILE_NAME:
+            return [service.name for service in file_desc.service]
+
+    return []
+
+
+def make_descriptor_pool(descriptor_set: FileDescriptorSet) -> DescriptorPool:
+    descriptor_db = DescriptorDatabase()
+    for file_desc in descriptor_set.file:
+        if file_desc.name != _SERVICES_FILE_NAME:
+            descriptor_db.Add(file_desc)
+
+    return DescriptorPool(descriptor_db)
+
+
+def _get_cache_file_path(cache_path: str, endpoint: str, version: str) -> str:
+    file_name = re.sub(r"[^\w.-]", "_", f"{endpoint}-{version}")
+    return os.path.join(cache_path, f"{file_name}.pb")
+
+
+def load_descriptor_set(
+    cache_path: str, endpoint: str, version: str
+) -> Union[FileDescriptorSet, None]:
+    file_path = _get_cache_file_path(cache_path, endpoint, version)
+
+    try:
+        with open(file_path, "rb") as f:
+            return FileDescriptorSet.FromString(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        _LOGGER.warning(f"[load_descriptor_set] failed to load cache: {file_path} ({e})")
+        return None
+
+
+def save_descriptor_set(
+    cache_path: str, endpoint: str, version: str, descriptor_set: FileDescriptorSet
+) -> None:
+    file_path = _get_cache_file_path(cache_path, endpoint, version)
+    temp_path = None
+
+    try:
+        os.makedirs(cache_path, exist_ok=True)
+
+        # Replace atomically, other processes may be reading the cache
+        fd, temp_path = tempfile.mkstemp(dir=cache_path, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(descriptor_set.SerializeToString(deterministic=True))
+
+        os.replace(temp_path, file_path)
+    except Exception as e:
+        _LOGGER.warning(f"[save_descriptor_set] failed to save cache: {file_path} ({e})")
+
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
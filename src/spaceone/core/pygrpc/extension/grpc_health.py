@@ -48,6 +48,7 @@ class GRPCHealth(HealthServicer):
 
 class HealthManager(object):
     _checkers = []
+    _is_serving = True
 
     class Status(Enum):
         UNKNOWN = 'UNKNOWN'
@@ -60,9 +61,16 @@ class HealthManager(object):
         """When your application is not ready."""
 
     def check(self):
+        if not HealthManager._is_serving:
+            return self.Status.NOT_SERVING
+
         status = self.Status.SERVING
         return status
 
+    def set_serving(self, is_serving: bool):
+        HealthManager._is_serving = is_serving
+        self.update_status(self.check())
+
     def add_health_update(self, obj):
         self._checkers.append(obj)
 
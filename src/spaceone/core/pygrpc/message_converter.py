@@ -0,0 +1,577 @@
+import base64
+import logging
+import math
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.internal import type_checkers
+from google.protobuf.json_format import MessageToDict, ParseDict
+
+__all__ = ["message_to_dict", "dict_to_message"]
+
+_LOGGER = logging.getLogger(__name__)
+
+_INT64_TYPES = [FieldDescriptor.CPPTYPE_INT64, FieldDescriptor.CPPTYPE_UINT64]
+_INT_TYPES = [
+    FieldDescriptor.CPPTYPE_INT32,
+    FieldDescriptor.CPPTYPE_UINT32,
+    FieldDescriptor.CPPTYPE_INT64,
+    FieldDescriptor.CPPTYPE_UINT64,
+]
+_FLOAT_MAX = 3.4028234663852886e38
+
+# Well known types which are converted by json_format as they are
+_GENERIC_WKT_TYPES = [
+    "google.protobuf.Any",
+    "google.protobuf.Duration",
+    "google.protobuf.FieldMask",
+    "google.protobuf.DoubleValue",
+    "google.protobuf.FloatValue",
+    "google.protobuf.Int64Value",
+    "google.protobuf.UInt64Value",
+    "google.protobuf.Int32Value",
+    "google.protobuf.UInt32Value",
+    "google.protobuf.BoolValue",
+    "google.protobuf.StringValue",
+    "google.protobuf.BytesValue",
+]
+
+# message descriptor -> compiled encoder / decoder
+_ENCODERS = {}
+_DECODERS = {}
+
+
+def message_to_dict(message) -> dict:
+    """Same as MessageToDict(message, preserving_proto_field_name=True)."""
+
+    try:
+        return _get_encoder(message.DESCRIPTOR)(message)
+    except Exception as e:
+        _LOGGER.debug(f"[message_to_dict] fallback to json_format: {e}")
+        return MessageToDict(message, preserving_proto_field_name=True)
+
+
+def dict_to_message(data: dict, message_class):
+    """Same as ParseDict(data, message_class())."""
+
+    message = message_class()
+
+    try:
+        _get_decoder(message.DESCRIPTOR)(data, message)
+        return message
+    except Exception as e:
+        _LOGGER.debug(f"[dict_to_message] fallback to json_format: {e}")
+        return ParseDict(data, message_class())
+
+
+class _FallbackError(Exception):
+    pass
+
+
+def _get_encoder(message_desc):
+    encoder = _ENCODERS.get(message_desc)
+    if encoder is None:
+        encoder = _ENCODERS[message_desc] = _compile_encoder(message_desc)
+
+    return encoder
+
+
+def _get_decoder(message_desc):
+    decoder = _DECODERS.get(message_desc)
+    if decoder is None:
+        decoder = _DECODERS[message_desc] = _compile_decoder(message_desc)
+
+    return decoder
+
+
+def _is_map_entry(field) -> bool:
+    return (
+        field.type == FieldDescriptor.TYPE_MESSAGE
+        and field.message_type.has_options
+        and field.message_type.GetOptions().map_entry
+    )
+
+
+#######################################################################
+# Encoder (message -> dict)
+#######################################################################
+
+
+def _compile_encoder(message_desc):
+    full_name = message_desc.full_name
+
+    if full_name == "google.protobuf.Struct":
+        return _encode_struct
+    elif full_name == "google.protobuf.ListValue":
+        return _encode_list_value
+    elif full_name == "google.protobuf.Value":
+        return _encode_value
+    elif full_name == "google.protobuf.Timestamp":
+        return _encode_timestamp
+    elif full_name in _GENERIC_WKT_TYPES:
+        return _encode_generic
+
+    converters = {}
+    for field in message_desc.fields:
+        converters[field.number] = (field.name, _make_field_encoder(field))
+
+    def encode(message):
+        js = {}
+        for field, value in message.ListFields():
+            name, convert = converters[field.number]
+            js[name] = convert(value)
+
+        return js
+
+    return encode
+
+
+def _make_field_encoder(field):
+    if _is_map_entry(field):
+        value_convert = _make_value_encoder(
+            field.message_type.fields_by_name["value"]
+        )
+
+        def convert_map(value):
+            js_map = {}
+            for key in value:
+                if isinstance(key, bool):
+                    js_map["true" if key else "false"] = value_convert(value[key])
+                else:
+                    js_map[str(key)] = value_convert(value[key])
+
+            return js_map
+
+        return convert_map
+
+    value_convert = _make_value_encoder(field)
+
+    if field.label == FieldDescriptor.LABEL_REPEATED:
+        if value_convert is _identity:
+            return list
+
+        def convert_repeated(value):
+            return [value_convert(v) for v in value]
+
+        return convert_repeated
+
+    return value_convert
+
+
+def _make_value_encoder(field):
+    cpp_type = field.cpp_type
+
+    if cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
+        message_desc = field.message_type
+
+        def convert_message(value):
+            return _get_encoder(message_desc)(value)
+
+        return convert_message
+
+    elif cpp_type == FieldDescriptor.CPPTYPE_ENUM:
+        if field.enum_type.full_name == "google.protobuf.NullValue":
+            return _encode_null
+
+        enum_names = {v.number: v.name for v in field.enum_type.values}
+        is_proto3 = field.file.syntax == "proto3"
+
+        def convert_enum(value):
+            if value in enum_names:
+                return enum_names[value]
+            elif is_proto3:
+                return value
+            else:
+                raise _FallbackError(f"unknown enum value: {value}")
+
+        return convert_enum
+
+    elif cpp_type == FieldDescriptor.CPPTYPE_STRING:
+        if field.type == FieldDescriptor.TYPE_BYTES:
+            return _encode_bytes
+        return _identity
+
+    elif cpp_type == FieldDescriptor.CPPTYPE_BOOL:
+        return bool
+
+    elif cpp_type in _INT64_TYPES:
+        return str
+
+    elif cpp_type == FieldDescriptor.CPPTYPE_DOUBLE:
+        return _encode_double
+
+    elif cpp_type == FieldDescriptor.CPPTYPE_FLOAT:
+        return _encode_float
+
+    return _identity
+
+
+def _identity(value):
+    return value
+
+
+def _encode_null(value):
+    return None
+
+
+def _encode_bytes(value):
+    return base64.b64encode(value).decode("utf-8")
+
+
+def _encode_double(value):
+    if math.isinf(value):
+        return "-Infinity" if value < 0.0 else "Infinity"
+    elif math.isnan(value):
+        return "NaN"
+
+    return value
+
+
+def _encode_float(value):
+    if math.isinf(value) or math.isnan(value):
+        return _encode_double(value)
+
+    return type_checkers.ToShortestFloat(value)
+
+
+def _encode_struct(message):
+    return {key: _encode_value(value) for key, value in message.fields.items()}
+
+
+def _encode_list_value(message):
+    return [_encode_value(value) for value in message.values]
+
+
+def _encode_value(message):
+    kind = message.WhichOneof("kind")
+
+    if kind is None or kind == "null_value":
+        return None
+    elif kind == "struct_value":
+        return _encode_struct(message.struct_value)
+    elif kind == "list_value":
+        return _encode_list_value(message.list_value)
+    elif kind == "number_value":
+        return _encode_double(message.number_value)
+    else:
+        return getattr(message, kind)
+
+
+def _encode_timestamp(message):
+    return message.ToJsonString()
+
+
+def _encode_generic(message):
+    return MessageToDict(message, preserving_proto_field_name=True)
+
+
+#######################################################################
+# Decoder (dict -> message)
+#######################################################################
+
+
+def _compile_decoder(message_desc):
+    full_name = message_desc.full_name
+
+    if full_name == "google.protobuf.Struct":
+        return _decode_struct
+    elif full_name == "google.protobuf.ListValue":
+        return _decode_list_value
+    elif full_name == "google.protobuf.Value":
+        return _decode_value
+    elif full_name == "google.protobuf.Timestamp":
+        return _decode_timestamp
+    elif full_name in _GENERIC_WKT_TYPES:
+        return _decode_generic
+
+    setters = {}
+    for field in message_desc.fields:
+        setters[field.json_name] = _make_field_decoder(field)
+
+    for field in message_desc.fields:
+        setters.setdefault(field.name, setters[field.json_name])
+
+    def decode(data, message):
+        if not isinstance(data, dict):
+            raise _FallbackError(f"{full_name} must be a dict")
+
+        oneofs = None
+        for name, value in data.items():
+            field, setter = setters[name]
+
+            if field.containing_oneof is not None and value is not None:
+                oneofs = oneofs or set()
+                if field.containing_oneof.name in oneofs:
+                    raise _FallbackError(f"multiple oneof fields: {name}")
+                oneofs.add(field.containing_oneof.name)
+
+            setter(message, value)
+
+    return decode
+
+
+def _make_field_decoder(field):
+    name = field.name
+
+    if _is_map_entry(field):
+        key_convert = _make_scalar_decoder(
+            field.message_type.fields_by_name["key"], is_map_key=True
+        )
+        value_field = field.message_type.fields_by_name["value"]
+
+        if value_field.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
+            message_desc = value_field.message_type
+
+            def set_map(message, value):
+                message.ClearField(name)
+                if value is None:
+                    return
+
+                _check_type(value, dict)
+                decoder = _get_decoder(message_desc)
+                container = getattr(message, name)
+                for k, v in value.items():
+                    decoder(v, container[key_convert(k)])
+
+        else:
+            value_convert = _make_scalar_decoder(value_field)
+
+            def set_map(message, value):
+                message.ClearField(name)
+                if value is None:
+                    return
+
+                _check_type(value, dict)
+                container = getattr(message, name)
+                for k, v in value.items():
+                    container[key_convert(k)] = value_convert(v)
+
+        return field, set_map
+
+    elif field.label == FieldDescriptor.LABEL_REPEATED:
+        if field.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
+            message_desc = field.message_type
+            is_value = message_desc.full_name == "google.protobuf.Value"
+
+            def set_repeated(message, value):
+                message.ClearField(name)
+                if value is None:
+                    return
+
+                _check_type(value, list)
+                decoder = _get_decoder(message_desc)
+                container = getattr(message, name)
+                for item in value:
+                    if item is None and not is_value:
+                        raise _FallbackError(f"null element in {name}")
+                    decoder(item, container.add())
+
+        else:
+            item_convert = _make_scalar_decoder(field)
+
+            def set_repeated(message, value):
+                message.ClearField(name)
+                if value is None:
+                    return
+
+                _check_type(value, list)
+                getattr(message, name).extend([item_convert(v) for v in value])
+
+        return field, set_repeated
+
+    elif field.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
+        message_desc = field.message_type
+        is_value = message_desc.full_name == "google.protobuf.Value"
+
+        def set_message(message, value):
+            if value is None:
+                if is_value:
+                    getattr(message, name).null_value = 0
+                else:
+                    message.ClearField(name)
+                return
+
+            sub_message = getattr(message, name)
+            sub_message.SetInParent()
+            _get_decoder(message_desc)(value, sub_message)
+
+        return field, set_message
+
+    else:
+        convert = _make_scalar_decoder(field)
+        is_null_value = (
+            field.cpp_type == FieldDescriptor.CPPTYPE_ENUM
+            and field.enum_type.full_name == "google.protobuf.NullValue"
+        )
+
+        def set_scalar(message, value):
+            if value is None:
+                if is_null_value:
+                    setattr(message, name, 0)
+                else:
+                    message.ClearField(name)
+                return
+
+            setattr(message, name, convert(value))
+
+        return field, set_scalar
+
+
+def _make_scalar_decoder(field, is_map_key=False):
+    cpp_type = field.cpp_type
+
+    if cpp_type in _INT_TYPES:
+        return _decode_map_key_int if is_map_key else _decode_int
+
+    elif cpp_type == FieldDescriptor.CPPTYPE_DOUBLE:
+        return _decode_double
+
+    elif cpp_type == FieldDescriptor.CPPTYPE_FLOAT:
+        return _decode_float
+
+    elif cpp_type == FieldDescriptor.CPPTYPE_BOOL:
+        return _decode_map_key_bool if is_map_key else _decode_bool
+
+    elif cpp_type == FieldDescriptor.CPPTYPE_STRING:
+        if field.type == FieldDescriptor.TYPE_BYTES:
+            return _decode_bytes
+        return _decode_string
+
+    elif cpp_type == FieldDescriptor.CPPTYPE_ENUM:
+        enum_numbers = {v.name: v.number for v in field.enum_type.values}
+
+        def convert_enum(value):
+            if isinstance(value, str) and value in enum_numbers:
+                return enum_numbers[value]
+
+            raise _FallbackError(f"enum value: {value}")
+
+        return convert_enum
+
+    raise _FallbackError(f"unsupported field type: {field.full_name}")
+
+
+def _check_type(value, value_type):
+    if not isinstance(value, value_type):
+        raise _FallbackError(f"{value} is not {value_type.__name__}")
+
+
+def _decode_int(value):
+    if type(value) is int:
+        return value
+
+    return _decode_map_key_int(value)
+
+
+def _decode_map_key_int(value):
+    if isinstance(value, str) and value.lstrip("-").isdigit():
+        return int(value)
+
+    raise _FallbackError(f"integer value: {value}")
+
+
+def _decode_double(value):
+    if type(value) is float:
+        if math.isnan(value) or math.isinf(value):
+            raise _FallbackError(f"float value: {value}")
+        return value
+    elif type(value) is int:
+        return float(value)
+
+    raise _FallbackError(f"float value: {value}")
+
+
+def _decode_float(value):
+    value = _decode_double(value)
+    if abs(value) > _FLOAT_MAX:
+        raise _FallbackError(f"float value: {value}")
+
+    return value
+
+
+def _decode_bool(value):
+    if isinstance(value, bool):
+        return value
+
+    raise _FallbackError(f"bool value: {value}")
+
+
+def _decode_map_key_bool(value):
+    if value == "true":
+        return True
+    elif value == "false":
+        return False
+
+    raise _FallbackError(f"bool map key: {value}")
+
+
+def _decode_string(value):
+    if type(value) is str:
+        return value
+
+    raise _FallbackError(f"string value: {value}")
+
+
+def _decode_bytes(value):
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+
+    return base64.urlsafe_b64decode(value + b"=" * (4 - len(value) % 4))
+
+
+def _decode_struct(data, message):
+    _check_type(data, dict)
+
+    fields = message.fields
+    if len(data) == 0 or len(fields) > 0:
+        # Clear will mark the struct as modified even if there are no values
+        message.Clear()
+
+    for key, value in data.items():
+        _decode_value(value, fields[key])
+
+
+def _decode_list_value(data, message):
+    _check_type(data, list)
+    message.ClearField("values")
+
+    values = message.values
+    for value in data:
+        _decode_value(value, values.add())
+
+
+def _decode_value(data, message):
+    value_type = type(data)
+
+    if value_type is str:
+        message.string_value = data
+    elif value_type is bool:
+        message.bool_value = data
+    elif value_type is int or value_type is float:
+        message.number_value = data
+    elif value_type is dict:
+        _decode_struct(data, message.struct_value)
+    elif value_type is list:
+        _decode_list_value(data, message.list_value)
+    elif data is None:
+        message.null_value = 0
+    elif isinstance(data, dict):
+        _decode_struct(data, message.struct_value)
+    elif isinstance(data, list):
+        _decode_list_value(data, message.list_value)
+    elif isinstance(data, bool):
+        message.bool_value = data
+    elif isinstance(data, str):
+        message.string_value = data
+    elif isinstance(data, (int, float)):
+        message.number_value = data
+    else:
+        raise _FallbackError(f"unexpected value type: {type(data)}")
+
+
+def _decode_timestamp(data, message):
+    _check_type(data, str)
+    message.FromJsonString(data)
+
+
+def _decode_generic(data, message):
+    ParseDict(data, message)
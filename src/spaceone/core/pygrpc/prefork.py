@@ -0,0 +1,120 @@
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.connection import wait
+from typing import Callable, Dict
+
+__all__ = ["PreforkSupervisor"]
+
+_LOGGER = logging.getLogger(__name__)
+
+# Children which exit earlier than this are restarted after a backoff
+_MIN_UPTIME = 5
+_RESTART_BACKOFF = 1
+
+
+class PreforkSupervisor(object):
+    def __init__(
+        self,
+        target: Callable,
+        workers: int = None,
+        shutdown_grace: int = 30,
+    ):
+        self._target = target
+        self._workers = workers or os.cpu_count() or 1
+        self._shutdown_grace = shutdown_grace
+        self._context = multiprocessing.get_context("fork")
+        self._processes: Dict[int, multiprocessing.Process] = {}
+        self._started_at: Dict[int, float] = {}
+        self._is_stopping = False
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+
+        _LOGGER.info(f"[PreforkSupervisor] start {self._workers} worker processes")
+
+        for index in range(self._workers):
+            self._start_process(index)
+
+        while not self._is_stopping:
+            self._wait_and_restart()
+
+        self._stop_processes()
+
+    def _start_process(self, index: int):
+        process = self._context.Process(
+            target=_run_child,
+            args=(self._target,),
+            name=f"GRPCWorker-{index}",
+        )
+        process.start()
+        self._processes[index] = process
+        self._started_at[index] = time.monotonic()
+        _LOGGER.info(
+            f"[PreforkSupervisor] started worker: {process.name} ({process.pid})"
+        )
+
+    def _wait_and_restart(self):
+        sentinels = [process.sentinel for process in self._processes.values()]
+        wait(sentinels, timeout=1)
+
+        for index, process in list(self._processes.items()):
+            if process.is_alive() or self._is_stopping:
+                continue
+
+            _LOGGER.error(
+                f"[PreforkSupervisor] worker exited: {process.name} "
+                f"(pid={process.pid}, exitcode={process.exitcode})"
+            )
+            process.close()
+            del self._processes[index]
+
+            if time.monotonic() - self._started_at[index] < _MIN_UPTIME:
+                time.sleep(_RESTART_BACKOFF)
+
+            if not self._is_stopping:
+                self._start_process(index)
+
+    def _handle_signal(self, signum, frame):
+        if self._is_stopping:
+            return
+
+        _LOGGER.info(
+            f"[PreforkSupervisor] received {signal.Signals(signum).name}, "
+            f"stop worker processes"
+        )
+        self._is_stopping = True
+
+        for process in self._processes.values():
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+    def _stop_processes(self):
+        deadline = time.monotonic() + self._shutdown_grace
+
+        for process in self._processes.values():
+            process.join(max(deadline - time.monotonic(), 0))
+
+            if process.is_alive():
+                _LOGGER.warning(
+                    f"[PreforkSupervisor] kill worker: {process.name} ({process.pid})"
+                )
+                process.kill()
+                process.join()
+
+        _LOGGER.info("[PreforkSupervisor] all worker processes are stopped")
+
+
+def _run_child(target: Callable):
+    # Signal handlers of the supervisor are inherited on fork
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    target()
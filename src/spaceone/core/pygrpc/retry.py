@@ -0,0 +1,131 @@
+import random
+import threading
+import time
+
+__all__ = ["RetryPolicy", "RetryBudget", "CircuitBreaker"]
+
+CLOSED = "CLOSED"
+OPEN = "OPEN"
+HALF_OPEN = "HALF_OPEN"
+
+
+class RetryPolicy(object):
+    """Exponential backoff with full jitter, only for idempotent methods."""
+
+    def __init__(self, conf: dict = None):
+        conf = conf or {}
+        self.max_retries = conf.get("max_retries", 2)
+        self._initial_backoff = conf.get("initial_backoff", 0.1)
+        self._max_backoff = conf.get("max_backoff", 2.0)
+        self._backoff_multiplier = conf.get("backoff_multiplier", 2.0)
+        self._idempotent_verbs = set(conf.get("idempotent_verbs", []))
+
+    def is_idempotent(self, method: str) -> bool:
+        # e.g. /spaceone.api.identity.v2.Domain/get -> get, Domain.get
+        service, _, verb = method.rpartition("/")
+        short_service = service.rsplit(".", 1)[-1]
+        return (
+            verb in self._idempotent_verbs
+            or f"{short_service}.{verb}" in self._idempotent_verbs
+        )
+
+    def get_backoff(self, attempt: int) -> float:
+        backoff = self._initial_backoff * (self._backoff_multiplier**attempt)
+        return random.uniform(0, min(backoff, self._max_backoff))
+
+
+class RetryBudget(object):
+    """Token bucket which allows retries for a ratio of requests.
+
+    Each request deposits `ratio` tokens and each retry withdraws one token,
+    so retries can never exceed the ratio of requests plus `max_tokens`.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10):
+        self._ratio = ratio
+        self._max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self._tokens + self._ratio, self._max_tokens)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+
+            return False
+
+
+class CircuitBreaker(object):
+    """Fails fast while a backend is down.
+
+    The circuit opens after `failure_threshold` consecutive failures. After
+    `reset_timeout` seconds a single probe request is let through, which
+    closes the circuit on success or opens it again on failure. A probe
+    without result lets another probe through after `reset_timeout`.
+    """
+
+    def __init__(self, conf: dict = None):
+        conf = conf or {}
+        self._is_enabled = conf.get("enabled", True)
+        self._failure_threshold = conf.get("failure_threshold", 5)
+        self._reset_timeout = conf.get("reset_timeout", 10)
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow_request(self) -> bool:
+        if not self._is_enabled or self._state == CLOSED:
+            return True
+
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+
+            # Fail fast while open or while a probe request is in progress
+            if time.monotonic() - self._opened_at < self._reset_timeout:
+                return False
+
+            self._state = HALF_OPEN
+            self._opened_at = time.monotonic()
+            return True
+
+    def record_success(self) -> None:
+        if not self._is_enabled or (self._state == CLOSED and self._failures == 0):
+            return
+
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> bool:
+        """Returns True if the circuit has just opened."""
+
+        if not self._is_enabled:
+            return False
+
+        with self._lock:
+            self._failures += 1
+
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self._failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                return True
+
+            return False
@@ -1,37 +1,103 @@
+import asyncio
 import logging
+import signal
+import threading
+import time
 import grpc
 from concurrent import futures
-from typing import List, Union, Type
+from typing import Callable, List, Union, Type
 from grpc_reflection.v1alpha import reflection
 from spaceone.core import config
+from spaceone.core.logger import flush_logger
+from spaceone.core.opentelemetry import flush_tracer, flush_metric
+from spaceone.core.pygrpc.admission import AdmissionController
+from spaceone.core.pygrpc import compression
 from spaceone.core.pygrpc.api import BaseAPI
+from spaceone.core.pygrpc.extension.grpc_health import HealthManager
+from spaceone.core.pygrpc.prefork import PreforkSupervisor
 
 _LOGGER = logging.getLogger(__name__)
+_SERVER_OPTIONS = {
+    # GRPC_SERVER key : channel argument
+    "keepalive_time_ms": "grpc.keepalive_time_ms",
+    "keepalive_timeout_ms": "grpc.keepalive_timeout_ms",
+    "keepalive_permit_without_calls": "grpc.keepalive_permit_without_calls",
+    "min_recv_ping_interval_without_data_ms": "grpc.http2.min_recv_ping_interval_without_data_ms",
+    "max_pings_without_data": "grpc.http2.max_pings_without_data",
+    "max_connection_idle_ms": "grpc.max_connection_idle_ms",
+    "max_connection_age_ms": "grpc.max_connection_age_ms",
+    "max_connection_age_grace_ms": "grpc.max_connection_age_grace_ms",
+    "http2_lookahead_bytes": "grpc.http2.lookahead_bytes",
+    "http2_bdp_probe": "grpc.http2.bdp_probe",
+    "http2_max_frame_size": "grpc.http2.max_frame_size",
+}
 
 
-class _ServerInterceptor(grpc.ServerInterceptor):
-    _SKIP_METHODS = "/grpc.reflection.v1alpha.ServerReflection/ServerReflectionInfo"
+def _allow_serialized_response(handler):
+    # Responses relayed as serialized bytes (passthrough) are sent as they are
+    serializer = handler.response_serializer
+    if serializer is None:
+        return handler
+
+    def response_serializer(response):
+        if isinstance(response, bytes):
+            return response
 
-    def _check_skip_method(self, method):
-        is_skip = False
+        return serializer(response)
 
-        if method in self._SKIP_METHODS:
-            is_skip = True
+    return handler._replace(response_serializer=response_serializer)
 
-        return is_skip
+
+class _ServerInterceptor(grpc.ServerInterceptor):
+    def __init__(
+        self,
+        admission_controller: AdmissionController = None,
+        compression_threshold: int = None,
+    ):
+        self._admission_controller = admission_controller
+        self._compression_threshold = compression_threshold
 
     def intercept_service(self, continuation, handler_call_details):
-        # is_skip = self._check_skip_method(handler_call_details.method)
-        #
-        # if not is_skip:
-        #     pass
+        handler = continuation(handler_call_details)
+
+        if handler:
+            handler = _allow_serialized_response(handler)
+
+        if handler and self._compression_threshold:
+            handler = compression.wrap_handler(handler, self._compression_threshold)
+
+        if handler and self._admission_controller:
+            handler = self._admission_controller.wrap_handler(
+                handler_call_details.method, handler
+            )
 
-        response = continuation(handler_call_details)
+        return handler
 
-        # if not is_skip:
-        #     pass
 
-        return response
+class _AsyncServerInterceptor(grpc.aio.ServerInterceptor):
+    def __init__(
+        self,
+        admission_controller: AdmissionController = None,
+        compression_threshold: int = None,
+    ):
+        self._admission_controller = admission_controller
+        self._compression_threshold = compression_threshold
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+
+        if handler:
+            handler = _allow_serialized_response(handler)
+
+        if handler and self._compression_threshold:
+            handler = compression.wrap_handler(handler, self._compression_threshold)
+
+        if handler and self._admission_controller:
+            handler = self._admission_controller.wrap_handler(
+                handler_call_details.method, handler
+            )
+
+        return handler
 
 
 class GRPCServer(object):
@@ -40,30 +106,125 @@ class GRPCServer(object):
         self._service = conf["SERVICE"]
         self._port = conf["PORT"]
         self._max_workers = conf["MAX_WORKERS"]
+        self._is_async = conf.get("GRPC_ASYNC", False)
+        self._shutdown_grace = conf.get("GRPC_SHUTDOWN_GRACE", 30)
+        self._drain_period = conf.get("GRPC_DRAIN_PERIOD", 5)
+        self._is_stopping = False
         self._service_names = []
-
-        server_interceptor = _ServerInterceptor()
-        self._server = grpc.server(
-            futures.ThreadPoolExecutor(max_workers=conf["MAX_WORKERS"]),
-            interceptors=(server_interceptor,),
-        )
+        self._servicers = []
+        self._loop = None
+        self._admission_controller = None
+
+        server_conf = conf.get("GRPC_SERVER", {})
+        self._compression = compression.get_compression(server_conf.get("compression"))
+        self._compression_threshold = None
+        if self._compression:
+            self._compression_threshold = server_conf.get("compression_threshold")
+
+        self._options = _get_server_options(server_conf)
+
+        admission_conf = conf.get("GRPC_ADMISSION_CONTROL", {})
+        if admission_conf.get("enabled", False):
+            self._admission_controller = AdmissionController(
+                admission_conf, self._max_workers
+            )
+
+        if conf.get("GRPC_PREFORK", False):
+            # Worker processes share the same port
+            self._options.append(("grpc.so_reuseport", 1))
+
+        if self._is_async:
+            # grpc.aio server should be created in the running event loop
+            self._server = None
+        else:
+            server_interceptor = _ServerInterceptor(
+                self._admission_controller, self._compression_threshold
+            )
+            self._server = grpc.server(
+                futures.ThreadPoolExecutor(max_workers=conf["MAX_WORKERS"]),
+                interceptors=(server_interceptor,),
+                options=self._options,
+                compression=self._compression,
+            )
 
     @property
-    def server(self) -> grpc.server:
+    def server(self) -> Union[grpc.Server, grpc.aio.Server]:
         return self._server
 
     @property
     def service_names(self) -> List[str]:
         return self._service_names
 
+    @property
+    def is_async(self) -> bool:
+        return self._is_async
+
     def add_service(self, servicer_cls: Union[Type[BaseAPI], Type[object]]):
         servicer = servicer_cls()
+        self._servicers.append(servicer)
+
+        if self.server:
+            self._add_servicer_to_server(servicer)
+
+        self.service_names.append(servicer.service_name)
+
+    def _add_servicer_to_server(self, servicer):
         getattr(servicer.pb2_grpc_module, f"add_{servicer.name}Servicer_to_server")(
             servicer, self.server
         )
-        self.service_names.append(servicer.service_name)
 
     def run(self):
+        self._set_signal_handler()
+
+        if self.is_async:
+            asyncio.run(self._run_async())
+        else:
+            self._start()
+            self.server.wait_for_termination()
+
+        _flush()
+        _LOGGER.info(f"gRPC Server is stopped ({self._service})")
+
+    def stop(self):
+        """Drain traffic and stop the server gracefully."""
+
+        if self._is_stopping:
+            return
+
+        self._is_stopping = True
+
+        if self.is_async:
+            if self._loop:
+                asyncio.run_coroutine_threadsafe(self._async_graceful_stop(), self._loop)
+        elif self.server:
+            threading.Thread(
+                target=self._graceful_stop, name="GRPCServerDrain", daemon=True
+            ).start()
+
+    def _set_signal_handler(self):
+        try:
+            signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+        except ValueError:
+            _LOGGER.debug("[_set_signal_handler] not in the main thread, skip")
+
+    def _start_draining(self):
+        _LOGGER.info(
+            f"Stop gRPC Server ({self._service}): "
+            f"drain_period={self._drain_period}, grace={self._shutdown_grace}"
+        )
+        HealthManager().set_serving(False)
+
+    def _graceful_stop(self):
+        self._start_draining()
+        time.sleep(self._drain_period)
+        self.server.stop(self._shutdown_grace).wait()
+
+    async def _async_graceful_stop(self):
+        self._start_draining()
+        await asyncio.sleep(self._drain_period)
+        await self.server.stop(self._shutdown_grace)
+
+    def _start(self):
         service_names_str = "\n\t - ".join(self.service_names)
         _LOGGER.debug(f"Loaded Services: \n\t - {service_names_str}")
         reflection.enable_server_reflection(self.service_names, self.server)
@@ -71,10 +232,47 @@ class GRPCServer(object):
         self.server.add_insecure_port(f"[::]:{self._port}")
         _LOGGER.info(
             f"Start gRPC Server ({self._service}): "
-            f"port={self._port}, max_workers={self._max_workers}"
+            f"port={self._port}, max_workers={self._max_workers}, "
+            f"async={self.is_async}"
         )
-        self.server.start()
-        self.server.wait_for_termination()
+        return self.server.start()
+
+    async def _run_async(self):
+        # Sync servicer methods and asyncio.to_thread() run in a bounded executor
+        executor = futures.ThreadPoolExecutor(max_workers=self._max_workers)
+        self._loop = asyncio.get_running_loop()
+        self._loop.set_default_executor(executor)
+
+        server_interceptor = _AsyncServerInterceptor(
+            self._admission_controller, self._compression_threshold
+        )
+        self._server = grpc.aio.server(
+            migration_thread_pool=executor,
+            interceptors=(server_interceptor,),
+            options=self._options,
+            compression=self._compression,
+        )
+
+        for servicer in self._servicers:
+            self._add_servicer_to_server(servicer)
+
+        await self._start()
+        await self.server.wait_for_termination()
+
+
+def _get_server_options(server_conf: dict) -> list:
+    options = []
+
+    if max_message_length := server_conf.get("max_message_length"):
+        options.append(("grpc.max_send_message_length", max_message_length))
+        options.append(("grpc.max_receive_message_length", max_message_length))
+
+    for key, option_name in _SERVER_OPTIONS.items():
+        value = server_conf.get(key)
+        if value is not None:
+            options.append((option_name, int(value)))
+
+    return options
 
 
 def _get_grpc_app() -> GRPCServer:
@@ -125,7 +323,36 @@ def add_extension_services(app):
     return app
 
 
-def serve():
+def _run_server(initializer: Callable = None):
+    if initializer:
+        initializer()
+
     app = _get_grpc_app()
     app = add_extension_services(app)
+    return app
+
+
+def _run_prefork_worker(initializer: Callable = None):
+    app = _run_server(initializer)
     app.run()
+
+
+def _flush():
+    flush_tracer()
+    flush_metric()
+    flush_logger()
+
+
+def serve(initializer: Callable = None):
+    if config.get_global("GRPC_PREFORK", False):
+        # gRPC objects are created only in the worker processes after fork
+        supervisor = PreforkSupervisor(
+            target=lambda: _run_prefork_worker(initializer),
+            workers=config.get_global("GRPC_PREFORK_WORKERS"),
+            shutdown_grace=config.get_global("GRPC_DRAIN_PERIOD", 5)
+            + config.get_global("GRPC_SHUTDOWN_GRACE", 30),
+        )
+        supervisor.run()
+    else:
+        app = _run_server(initializer)
+        app.run()
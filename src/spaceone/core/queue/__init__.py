@@ -1,3 +1,4 @@
+import inspect
 import logging
 
 from spaceone.core import config
@@ -6,6 +7,7 @@ from spaceone.core.error import *
 __init__ = ['put', 'get']
 
 _QUEUE_CONNECTIONS = {}
+_SUPPORTS_TIMEOUT = {}
 LOGGER = logging.getLogger(__name__)
 
 
@@ -34,8 +36,31 @@ def connection(func):
 
 
 @connection
-def get(queue_cls):
-    return queue_cls.get()
+def get(queue_cls, timeout=None):
+    if timeout is None or not _supports_timeout(queue_cls):
+        return queue_cls.get()
+
+    return queue_cls.get(timeout=timeout)
+
+
+def _supports_timeout(queue_cls):
+    # Backends written against the old get(self) signature wait without timeout
+    backend = type(queue_cls)
+    if backend not in _SUPPORTS_TIMEOUT:
+        try:
+            parameters = inspect.signature(queue_cls.get).parameters
+        except (TypeError, ValueError):
+            parameters = {}
+
+        _SUPPORTS_TIMEOUT[backend] = 'timeout' in parameters or any(
+            p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+        )
+
+        if not _SUPPORTS_TIMEOUT[backend]:
+            LOGGER.warning(f'[queue] {backend.__name__}.get() does not support timeout, '
+                           f'wait until an item occurs.')
+
+    return _SUPPORTS_TIMEOUT[backend]
 
 
 @connection
@@ -52,10 +77,13 @@ class BaseQueue(object):
         """
         pass
 
-    def get(self):
+    def get(self, timeout=None):
         """
+        Args:
+            timeout(int): seconds to wait, None waits until an item occurs
+
         Returns:
-            queue_value(any)
+            queue_value(any) | None (timeout)
         """
         raise NotImplementedError('queue.get not implemented!')
 
@@ -77,12 +77,15 @@ class RedisQueue(BaseQueue):
             _LOGGER.error(f"Unknown error: {e}")
 
 
-    def get(self):
+    def get(self, timeout=None):
         """
-        blpop waits until item occurs
+        blpop waits until item occurs, or returns None after timeout
         """
         try:
-            item = self.conn.blpop(self.channel)
+            item = self.conn.blpop(self.channel, timeout=timeout or 0)
+            if item is None:
+                return None
+
             return item[1]
         except redis.exceptions.ConnectionError as e:
             _LOGGER.error("####### Redis Queue get failed #############")
@@ -1,5 +1,6 @@
 import json
 import logging
+import signal
 import time
 import copy
 from multiprocessing import Process
@@ -9,7 +10,7 @@ import schedule
 from jsonschema import validate
 from scheduler import Scheduler as CronSchedulerServer
 from spaceone.core import queue, config
-from spaceone.core.logger import set_logger
+from spaceone.core.logger import set_logger, flush_logger
 from spaceone.core.error import ERROR_CONFIGURATION
 from spaceone.core.scheduler.task_schema import SPACEONE_TASK_SCHEMA
 
@@ -22,6 +23,7 @@ class BaseScheduler(Process):
         self.config = None
 
         self.global_config = config.get_global()
+        self._is_stopping = False
         super().__init__()
 
     def push_task(self):
@@ -45,6 +47,13 @@ class BaseScheduler(Process):
     def run(self):
         NotImplementedError("scheduler.run is not implemented")
 
+    def stop(self):
+        self._is_stopping = True
+        flush_logger()
+
+    def _set_signal_handler(self):
+        signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+
     def create_task(self):
         NotImplementedError("scheduler.create_task is not implemented")
 
@@ -81,8 +90,10 @@ class IntervalScheduler(BaseScheduler):
         # Enable logging configuration
         set_logger()
 
+        self._set_signal_handler()
+
         schedule.every(self.config).seconds.do(self.push_task)
-        while True:
+        while not self._is_stopping:
             schedule.run_pending()
             time.sleep(1)
 
@@ -117,8 +128,10 @@ class HourlyScheduler(BaseScheduler):
         set_logger()
 
         # Call push_task in every hour
+        self._set_signal_handler()
+
         schedule.every(self.config).hours.at(self.minute).do(self.push_task)
-        while True:
+        while not self._is_stopping:
             schedule.run_pending()
             time.sleep(1)
 
@@ -131,6 +144,7 @@ class CronScheduler(BaseScheduler):
     def __init__(self, queue, rule):
         super().__init__(queue)
         self.config = self.parse_config(rule)
+        self._cron_scheduler = None
 
     def parse_config(self, expr):
         """exprd
@@ -149,6 +163,14 @@ class CronScheduler(BaseScheduler):
         if self.config is False:
             # May be error format
             return
-        scheduler = CronSchedulerServer(10)
-        scheduler.add(f"{uuid4()}", self.config, self.push_task)
-        scheduler.start()
+        self._set_signal_handler()
+
+        self._cron_scheduler = CronSchedulerServer(10)
+        self._cron_scheduler.add(f"{uuid4()}", self.config, self.push_task)
+        self._cron_scheduler.start()
+
+    def stop(self):
+        if self._cron_scheduler:
+            self._cron_scheduler.shutdown = True
+
+        super().stop()
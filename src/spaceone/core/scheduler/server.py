@@ -1,10 +1,14 @@
 import logging
+import signal
+import threading
+import time
 from spaceone.core import config
 from spaceone.core.error import ERROR_BASE
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_POOL = 8
+DEFAULT_SHUTDOWN_GRACE = 30
 
 
 class Server(object):
@@ -15,6 +19,10 @@ class Server(object):
         self.schedulers = {}
         self.workers = {}
 
+    @property
+    def processes(self):
+        return list(self.workers.values()) + list(self.schedulers.values())
+
     def start(self):
         ###################
         # Queues
@@ -85,6 +93,26 @@ class Server(object):
         for (k, v) in self.schedulers.items():
             v.start()
 
+    def stop(self):
+        # Workers finish the running task and schedulers stop scheduling
+        _LOGGER.info('[Server] stop all schedulers and workers')
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+
+    def wait_for_shutdown(self):
+        grace = self.config.get('SCHEDULER_SHUTDOWN_GRACE', DEFAULT_SHUTDOWN_GRACE)
+        deadline = time.monotonic() + grace
+
+        for process in self.processes:
+            process.join(max(deadline - time.monotonic(), 0))
+
+            if process.is_alive():
+                _LOGGER.warning(
+                    f'[Server] kill process: {process.name} ({process.pid})'
+                )
+                process.kill()
+
     def _create_process(self, backend, params):
         # create scheduler
         _LOGGER.debug(params)
@@ -108,3 +136,19 @@ def serve():
 
     server = Server(config.get_service(), conf)
     server.start()
+
+    stop_event = threading.Event()
+
+    def _handle_signal(signum, frame):
+        if not stop_event.is_set():
+            stop_event.set()
+            server.stop()
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    while any(process.is_alive() for process in server.processes):
+        if stop_event.wait(1):
+            break
+
+    server.wait_for_shutdown()
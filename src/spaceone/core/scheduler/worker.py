@@ -1,6 +1,7 @@
 import copy
 import json
 import random
+import signal
 import string
 import logging
 
@@ -8,11 +9,15 @@ from multiprocessing import Process
 
 from spaceone.core import queue, config
 from spaceone.core.locator import Locator
-from spaceone.core.logger import set_logger
+from spaceone.core.logger import set_logger, flush_logger
+from spaceone.core.opentelemetry import flush_tracer, flush_metric
 from spaceone.core.error import ERROR_TASK_LOCATOR, ERROR_TASK_METHOD
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds, the maximum delay of stopping an idle worker
+_QUEUE_WAIT_TIMEOUT = 1
+
 
 def randomString(stringLength=8):
     """Generate a random string of fixed length"""
@@ -94,6 +99,7 @@ class BaseWorker(Process):
         _LOGGER.debug(f"[BaseWorker] BaseWorker queue : {self.queue}")
 
         self.global_config = config.get_global()
+        self._is_stopping = False
         super().__init__()
 
     def run(self):
@@ -103,17 +109,36 @@ class BaseWorker(Process):
         # Enable logging configuration
         set_logger()
 
-        while True:
-            # Read from Queue
-            binary_task = queue.get(self.queue)
-            try:
-                json_task = json.loads(binary_task.decode())
-                task = SpaceoneTask(json_task)
-                # Run task
-                task.execute()
+        signal.signal(signal.SIGTERM, self._handle_signal)
 
-            except Exception as e:
-                _LOGGER.error(
-                    f"[{self._name_}] failed to decode task: {binary_task}, {e}"
-                )
-                continue
+        try:
+            while not self._is_stopping:
+                # Read from Queue, waking up periodically to check the stop signal
+                binary_task = queue.get(self.queue, timeout=_QUEUE_WAIT_TIMEOUT)
+                if binary_task is None:
+                    continue
+
+                try:
+                    json_task = json.loads(binary_task.decode())
+                    task = SpaceoneTask(json_task)
+                    # Run task
+                    task.execute()
+
+                except Exception as e:
+                    _LOGGER.error(
+                        f"[{self._name_}] failed to decode task: {binary_task}, {e}"
+                    )
+                    continue
+
+        finally:
+            _LOGGER.info(f"[{self._name_}] worker is stopped")
+            flush_tracer()
+            flush_metric()
+            flush_logger()
+
+    def _handle_signal(self, signum, frame):
+        _LOGGER.info(f"[{self._name_}] received SIGTERM, stop worker")
+
+        # Never interrupt the loop, a task may already be dequeued but not running.
+        # The worker stops after the running task or the next queue wait timeout.
+        self._is_stopping = True
@@ -1,7 +1,9 @@
-import copy
+import contextlib
 import functools
 import json
 import logging
+import random
+import threading
 import time
 from typing import Generator, Union, Literal, Any
 
@@ -50,6 +52,7 @@ _METADATA_KEYS = [
     "x_workspace_id",
     "traceparent",
     "peer",
+    "deadline",
 ]
 
 
@@ -96,6 +99,9 @@ class BaseService(CoreObject):
 
         cls._handler_state[cls.__name__][handler_type] = True
 
+        # Compiled pipelines have to pick up the new handler state
+        _PIPELINES.clear()
+
     @classmethod
     def get_handler_state(cls) -> dict:
         return cls._handler_state.get(
@@ -161,6 +167,81 @@ def _get_span_context(traceparent: str = None):
         return None
 
 
+class _Pipeline(object):
+    """Handler stages of a service method, compiled once.
+
+    Only the active handlers are kept, so a method without handlers runs
+    without any handler lookups or PreProcessing/PostProcessing spans.
+    """
+
+    def __init__(self, handler_state: dict, exclude: list):
+        def get_handlers(handler_type: str, get_handlers_func: callable) -> list:
+            if handler_state[handler_type] and handler_type not in exclude:
+                return list(get_handlers_func())
+            return []
+
+        self.event_handlers = get_handlers("event", get_event_handlers)
+        self.authentication_handlers = get_handlers(
+            "authentication", get_authentication_handlers
+        )
+        self.authorization_handlers = get_handlers(
+            "authorization", get_authorization_handlers
+        )
+        self.mutation_handlers = get_handlers("mutation", get_mutation_handlers)
+        self.reversed_mutation_handlers = self.mutation_handlers[::-1]
+
+        self.has_pre_processing = bool(
+            self.event_handlers
+            or self.authentication_handlers
+            or self.authorization_handlers
+            or self.mutation_handlers
+        )
+        self.has_post_processing = bool(self.event_handlers or self.mutation_handlers)
+        self.is_handler_span_enabled = config.get_global("OTEL", {}).get(
+            "handler_span_enabled", True
+        )
+        self.payload_sample_rate = config.get_global("LOG_PAYLOAD_SAMPLE_RATE", 1.0)
+
+    def is_payload_sampled(self) -> bool:
+        if self.payload_sample_rate >= 1:
+            return True
+
+        return random.random() < self.payload_sample_rate
+
+    @staticmethod
+    def stage_span(name: str, is_active: bool):
+        if is_active:
+            return _TRACER.start_as_current_span(name)
+
+        return contextlib.nullcontext()
+
+    def handler_span(self, handler: BaseHandler):
+        return self.stage_span(handler.__class__.__name__, self.is_handler_span_enabled)
+
+
+_PIPELINES = {}
+_PIPELINES_LOCK = threading.Lock()
+
+
+def _get_pipeline(
+    service_cls: type, func: callable, exclude: list, handler_state: dict
+) -> _Pipeline:
+    key = (service_cls, func, tuple(exclude))
+    if key not in _PIPELINES:
+        with _PIPELINES_LOCK:
+            if key not in _PIPELINES:
+                _PIPELINES[key] = _Pipeline(handler_state, exclude)
+
+    return _PIPELINES[key]
+
+
+def _is_info_log_enabled(metadata: dict) -> bool:
+    if disable_info_log := metadata.get("disable_info_log"):
+        return str(disable_info_log).lower() != "true"
+
+    return True
+
+
 def _pipeline(
     func: callable,
     self: BaseService,
@@ -170,108 +251,114 @@ def _pipeline(
     exclude: list,
     handler_state: dict,
 ) -> Union[Generator, dict, None]:
-    print_info_log = (
-        str(self.metadata.get("disable_info_log", "false")).lower() != "true"
-    )
-
-    authentication_handler_state = (
-        handler_state["authentication"] and "authentication" not in exclude
-    )
-    authorization_handler_state = (
-        handler_state["authorization"] and "authorization" not in exclude
-    )
-    mutation_handler_state = handler_state["mutation"] and "mutation" not in exclude
-    event_handler_state = handler_state["event"] and "event" not in exclude
+    pipeline = None
+    print_info_log = _is_info_log_enabled(self.metadata)
 
     try:
-        with _TRACER.start_as_current_span("PreProcessing"):
+        pipeline = _get_pipeline(self.__class__, func, exclude, handler_state)
+        log_payload = print_info_log and pipeline.is_payload_sampled()
+
+        with pipeline.stage_span("PreProcessing", pipeline.has_pre_processing):
             start_time = time.time()
 
             # 1. Event - Start
-            if event_handler_state:
-                for handler in get_event_handlers():
-                    with _TRACER.start_as_current_span(handler.__class__.__name__):
-                        handler.notify("STARTED", params)
+            for handler in pipeline.event_handlers:
+                with pipeline.handler_span(handler):
+                    handler.notify("STARTED", params)
 
             # 2. Authentication
-            if authentication_handler_state:
-                for handler in get_authentication_handlers():
-                    with _TRACER.start_as_current_span(handler.__class__.__name__):
-                        handler.verify(params)
+            for handler in pipeline.authentication_handlers:
+                with pipeline.handler_span(handler):
+                    handler.verify(params)
 
             # 3. Authorization
-            if authorization_handler_state:
-                for handler in get_authorization_handlers():
-                    with _TRACER.start_as_current_span(handler.__class__.__name__):
-                        handler.verify(params, permission, role_types)
+            for handler in pipeline.authorization_handlers:
+                with pipeline.handler_span(handler):
+                    handler.verify(params, permission, role_types)
 
             # 4. Print Request Info Log
             if print_info_log:
-                _LOGGER.info("(REQUEST) =>", extra={"parameter": copy.deepcopy(params)})
+                parameter = _get_log_parameter(params) if log_payload else None
+                _LOGGER.info("(REQUEST) =>", extra={"parameter": parameter})
 
             # 5. Request Mutation
-            if mutation_handler_state:
-                for handler in get_mutation_handlers():
-                    with _TRACER.start_as_current_span(handler.__class__.__name__):
-                        params = handler.request(params)
+            for handler in pipeline.mutation_handlers:
+                with pipeline.handler_span(handler):
+                    params = handler.request(params)
+
+        # Abandon the request if the caller has already given up
+        self.transaction.check_deadline()
 
         # 6. Service Body
         with _TRACER.start_as_current_span(
             f"Body", links=[trace.Link(self.current_span_context)]
         ):
             # 6. Event - In Progress
-            if event_handler_state:
-                for handler in get_event_handlers():
-                    with _TRACER.start_as_current_span(handler.__class__.__name__):
-                        handler.notify("IN_PROGRESS", params)
+            for handler in pipeline.event_handlers:
+                with pipeline.handler_span(handler):
+                    handler.notify("IN_PROGRESS", params)
 
             response_or_iterator = func(self, params)
             if isinstance(response_or_iterator, Generator):
                 # Skip PostProcessing
                 return response_or_iterator
 
-        with _TRACER.start_as_current_span("PostProcessing"):
+        with pipeline.stage_span("PostProcessing", pipeline.has_post_processing):
             # 7. Response Mutation
-            if mutation_handler_state:
-                for handler in get_mutation_handlers(reverse=True):
-                    with _TRACER.start_as_current_span(handler.__class__.__name__):
-                        response_or_iterator = handler.response(response_or_iterator)
+            for handler in pipeline.reversed_mutation_handlers:
+                with pipeline.handler_span(handler):
+                    response_or_iterator = handler.response(response_or_iterator)
 
             # 8. Event - Success
-            if event_handler_state:
-                for handler in get_event_handlers():
-                    with _TRACER.start_as_current_span(handler.__class__.__name__):
-                        handler.notify("SUCCESS", response_or_iterator)
+            for handler in pipeline.event_handlers:
+                with pipeline.handler_span(handler):
+                    handler.notify("SUCCESS", response_or_iterator)
 
             # 9. Print Response Info Log
             if print_info_log:
-
                 process_time = time.time() - start_time
-                response_size = _get_response_size(response_or_iterator)
-                _LOGGER.info(
-                    f"(RESPONSE) => SUCCESS (Time = {process_time:.2f}s, Size = {response_size} bytes)",
-                )
+                response_size = _get_response_size(response_or_iterator, log_payload)
+
+                if response_size is None:
+                    _LOGGER.info(f"(RESPONSE) => SUCCESS (Time = {process_time:.2f}s)")
+                else:
+                    _LOGGER.info(
+                        f"(RESPONSE) => SUCCESS (Time = {process_time:.2f}s, Size = {response_size} bytes)",
+                    )
 
         return response_or_iterator
 
     except ERROR_INVALID_ARGUMENT as e:
-        _error_handler("INVALID_ARGUMENT", e, event_handler_state)
+        _error_handler("INVALID_ARGUMENT", e, pipeline)
         raise e
 
     except ERROR_BASE as e:
-        _error_handler("UNKNOWN", e, event_handler_state)
+        _error_handler("UNKNOWN", e, pipeline)
         raise e
 
     except Exception as e:
         error = ERROR_UNKNOWN(message=e)
-        _error_handler("UNKNOWN", error, event_handler_state)
+        _error_handler("UNKNOWN", error, pipeline)
         raise error
 
     finally:
         delete_transaction()
 
 
-def _get_response_size(response_or_iterator: Any) -> int:
+def _get_log_parameter(params: Union[Generator, dict, None]) -> Union[dict, None]:
+    # Mutation handlers replace top-level keys after logging, a shallow copy is
+    # enough for sync logging. Async logging snapshots it before it is queued.
+    if isinstance(params, dict):
+        return dict(params)
+
+    return None
+
+
+def _get_response_size(
+    response_or_iterator: Any, is_full: bool = True
+) -> Union[int, None]:
+    """Returns the response size, or None if it is not cheap to get unless is_full."""
+
     try:
         if response_or_iterator is None:
             return 0
@@ -279,10 +366,15 @@ def _get_response_size(response_or_iterator: Any) -> int:
         if isinstance(response_or_iterator, tuple):
             response_or_iterator = response_or_iterator[0]
 
+        if isinstance(response_or_iterator, (bytes, bytearray, str)):
+            return len(response_or_iterator)
+        elif hasattr(response_or_iterator, "ByteSize"):
+            return response_or_iterator.ByteSize()
+        elif not is_full:
+            return None
+
         if isinstance(response_or_iterator, (dict, list)):
             response_size = len(json.dumps(response_or_iterator, ensure_ascii=False))
-        elif isinstance(response_or_iterator, (bytes, bytearray, str)):
-            response_size = len(response_or_iterator)
         elif hasattr(response_or_iterator, "to_json"):
             response_size = len(response_or_iterator.to_json())
         elif hasattr(response_or_iterator, "__dict__"):
@@ -298,16 +390,15 @@ def _get_response_size(response_or_iterator: Any) -> int:
 def _error_handler(
     error_type: _ERROR_TYPE,
     error: ERROR_BASE,
-    event_handler_state: bool,
+    pipeline: Union[_Pipeline, None],
 ) -> None:
     error.meta["skip_error_log"] = True
 
     # Event - Failure
-    if event_handler_state:
-        for handler in get_event_handlers():
-            handler.notify(
-                "FAILURE", {"error_code": error.error_code, "message": error.message}
-            )
+    for handler in pipeline.event_handlers if pipeline else []:
+        handler.notify(
+            "FAILURE", {"error_code": error.error_code, "message": error.message}
+        )
 
     _LOGGER.error(f"(Error) => {error.message} {error}", exc_info=True)
 
@@ -1,9 +1,14 @@
+import asyncio
+import contextvars
 import threading
+import time
 import traceback
 import logging
 from threading import local
+from typing import Union
 
 from spaceone.core import utils
+from spaceone.core.error import ERROR_REQUEST_TIMEOUT
 from opentelemetry import trace
 from opentelemetry.trace import format_trace_id
 from opentelemetry.trace.span import TraceFlags
@@ -13,12 +18,18 @@ __all__ = [
     "get_transaction",
     "create_transaction",
     "delete_transaction",
+    "bind_transaction",
+    "unbind_transaction",
+    "get_time_remaining",
     "Transaction",
 ]
 
 _LOGGER = logging.getLogger(__name__)
 LOCAL_STORAGE = local()
 
+# Transaction of the current request, isolated per thread and per asyncio task
+_CURRENT_TRANSACTION = contextvars.ContextVar("transaction", default=None)
+
 
 class Transaction(object):
     def __init__(
@@ -35,6 +46,8 @@ class Transaction(object):
         self._resource = resource
         self._verb = verb
         self._rollbacks = []
+        self._last_write_time = None
+        self._memo = {}
         self._init_meta(meta)
         self._set_trace_id(trace_id)
 
@@ -84,6 +97,13 @@ class Transaction(object):
                 _LOGGER.info(f"[ROLLBACK-ERROR] {self}: {e}")
                 _LOGGER.info(traceback.format_exc())
 
+    @property
+    def last_write_time(self) -> [float, None]:
+        return self._last_write_time
+
+    def set_last_write_time(self) -> None:
+        self._last_write_time = time.time()
+
     @property
     def meta(self) -> dict:
         return self._meta
@@ -94,14 +114,56 @@ class Transaction(object):
     def get_meta(self, key: str, default: any = None):
         return self._meta.get(key, default)
 
+    def get_memo(self, key: str, default: any = None):
+        return self._memo.get(key, default)
+
+    def set_memo(self, key: str, value: any) -> None:
+        self._memo[key] = value
+
+    def clear_memo(self, prefix: str = None) -> None:
+        if prefix is None:
+            self._memo.clear()
+        else:
+            for key in [key for key in self._memo if key.startswith(prefix)]:
+                del self._memo[key]
+
+    @property
+    def deadline(self) -> Union[float, None]:
+        return self._meta.get("deadline")
+
+    def get_time_remaining(self) -> Union[float, None]:
+        """Seconds left until the caller's deadline, or None if there is no deadline."""
+
+        if deadline := self.deadline:
+            return max(deadline - time.time(), 0)
+
+        return None
+
+    def check_deadline(self) -> None:
+        """Raise ERROR_REQUEST_TIMEOUT if the caller has already given up."""
+
+        if self.get_time_remaining() == 0:
+            raise ERROR_REQUEST_TIMEOUT()
+
 
 def get_transaction(is_create: bool = True) -> [Transaction, None]:
+    if transaction := _CURRENT_TRANSACTION.get():
+        return transaction
+
     current_span_context = trace.get_current_span().get_span_context()
     thread_id = str(threading.current_thread().ident)
 
     if current_span_context.trace_flags == TraceFlags.SAMPLED:
         trace_id_from_current_span = format_trace_id(current_span_context.trace_id)
         return getattr(LOCAL_STORAGE, trace_id_from_current_span, None)
+    elif _is_async_task():
+        # Tasks of an event loop share the thread, so its transaction is not used
+        if is_create:
+            transaction = Transaction()
+            _CURRENT_TRANSACTION.set(transaction)
+            return transaction
+
+        return None
     elif hasattr(LOCAL_STORAGE, thread_id):
         return getattr(LOCAL_STORAGE, thread_id, None)
     elif is_create:
@@ -125,10 +187,31 @@ def create_transaction(
     else:
         setattr(LOCAL_STORAGE, transaction.id, transaction)
 
+    _CURRENT_TRANSACTION.set(transaction)
     return transaction
 
 
+def bind_transaction(transaction: Transaction) -> None:
+    """Share the transaction with the current thread, e.g. a worker of a thread pool.
+
+    The binding is removed by unbind_transaction() in the same thread.
+    """
+
+    setattr(LOCAL_STORAGE, transaction.id, transaction)
+    setattr(LOCAL_STORAGE, str(threading.current_thread().ident), transaction)
+    _CURRENT_TRANSACTION.set(transaction)
+
+
 def delete_transaction() -> None:
+    if transaction := get_transaction(is_create=False):
+        transaction.clear_memo()
+
+    unbind_transaction()
+
+
+def unbind_transaction() -> None:
+    """Remove the transaction from the current thread without deleting its state."""
+
     if transaction := get_transaction(is_create=False):
         if hasattr(LOCAL_STORAGE, transaction.id):
             delattr(LOCAL_STORAGE, transaction.id)
@@ -136,3 +219,19 @@ def delete_transaction() -> None:
     thread_id = str(threading.current_thread().ident)
     if hasattr(LOCAL_STORAGE, thread_id):
         delattr(LOCAL_STORAGE, thread_id)
+
+    _CURRENT_TRANSACTION.set(None)
+
+
+def get_time_remaining() -> Union[float, None]:
+    if transaction := get_transaction(is_create=False):
+        return transaction.get_time_remaining()
+
+    return None
+
+
+def _is_async_task() -> bool:
+    try:
+        return asyncio.current_task() is not None
+    except RuntimeError:
+        return False
@@ -0,0 +1,80 @@
+import time
+import timeit
+
+from spaceone.core.auth.jwt.jwt_util import JWTUtil
+
+_NUMBER = 200
+_BACKENDS = ["jwcrypto", "cryptography"]
+
+
+def _make_payload(size: int) -> dict:
+    return {
+        "iss": "spaceone.identity",
+        "rol": "WORKSPACE_MEMBER",
+        "typ": "ACCESS_TOKEN",
+        "own": "USER",
+        "did": "domain-0436002f575f",
+        "wid": "workspace-1b2c3d4e5f60",
+        "aud": "user@example.com",
+        "exp": int(time.time()) + 3600,
+        "iat": int(time.time()),
+        "jti": "b1946ac92492d2347c6235b4d2611184",
+        "permissions": [f"service-{i}:Resource.*" for i in range(size)],
+        "projects": [f"project-{i:012x}" for i in range(size)],
+        "ver": "2.0",
+    }
+
+
+def _print_result(name: str, backend: str, elapsed: float):
+    print(
+        f"{name:<24} {backend:<14}"
+        f" {elapsed * 1000 / _NUMBER:8.3f} ms"
+        f" {_NUMBER / elapsed:10.0f} ops/s"
+    )
+
+
+def main():
+    private_jwk, public_jwk = JWTUtil.generate_jwk()
+
+    for size in [1, 50]:
+        payload = _make_payload(size)
+        token = JWTUtil.encode(payload, private_jwk)
+
+        for backend in _BACKENDS:
+            private_key = JWTUtil.load_jwk(private_jwk, backend)
+            public_key = JWTUtil.load_jwk(public_jwk, backend)
+
+            _print_result(
+                f"encode ({size})",
+                backend,
+                timeit.timeit(
+                    lambda: JWTUtil.encode(payload, private_key, backend=backend),
+                    number=_NUMBER,
+                ),
+            )
+            _print_result(
+                f"decode ({size})",
+                backend,
+                timeit.timeit(
+                    lambda: JWTUtil.decode(token, public_key, backend=backend),
+                    number=_NUMBER,
+                ),
+            )
+            _print_result(
+                f"decode + load_jwk ({size})",
+                backend,
+                timeit.timeit(
+                    lambda: JWTUtil.decode(token, public_jwk, backend=backend),
+                    number=_NUMBER,
+                ),
+            )
+
+        _print_result(
+            f"unverified_decode ({size})",
+            "-",
+            timeit.timeit(lambda: JWTUtil.unverified_decode(token), number=_NUMBER),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import timeit
+
+from google.protobuf.json_format import MessageToDict, ParseDict
+
+from spaceone.core.pygrpc.message_converter import message_to_dict, dict_to_message
+from test_message_converter import ResourceInfo
+
+_NUMBER = 200
+
+
+def _make_data(size: int) -> dict:
+    return {
+        "resource_id": "resource-123",
+        "size": "1099511627776",
+        "state": "ENABLED",
+        "names": [f"name-{i}" for i in range(size)],
+        "data": {
+            f"key-{i}": {"value": i, "tags": ["a", "b"], "nested": {"ok": True}}
+            for i in range(size)
+        },
+        "results": [{"index": i, "name": f"result-{i}"} for i in range(size)],
+        "created_at": "2023-01-01T00:00:00Z",
+    }
+
+
+def _print_result(name: str, json_format_time: float, converter_time: float):
+    print(
+        f"{name:<16} json_format: {json_format_time * 1000 / _NUMBER:8.3f} ms"
+        f"  converter: {converter_time * 1000 / _NUMBER:8.3f} ms"
+        f"  ({json_format_time / converter_time:.2f}x)"
+    )
+
+
+def main():
+    for size in [10, 100]:
+        data = _make_data(size)
+        message = ParseDict(data, ResourceInfo())
+
+        _print_result(
+            f"parse ({size})",
+            timeit.timeit(lambda: ParseDict(data, ResourceInfo()), number=_NUMBER),
+            timeit.timeit(lambda: dict_to_message(data, ResourceInfo), number=_NUMBER),
+        )
+        _print_result(
+            f"serialize ({size})",
+            timeit.timeit(
+                lambda: MessageToDict(message, preserving_proto_field_name=True),
+                number=_NUMBER,
+            ),
+            timeit.timeit(lambda: message_to_dict(message), number=_NUMBER),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,19 @@ class TestJWTAuthenticator(unittest.TestCase):
         decoded = self._jwt_auth.validate(encoded)
         self.assertDictEqual(payload, decoded)
 
+    def test_validate_with_cryptography_backend(self):
+        payload = {
+            'hello': 'world',
+            'did': 'domain-0436002f575f'
+        }
+        encoded = JWTUtil.encode(payload, self._prv_jwk)
+
+        jwt_auth = JWTAuthenticator(self._pub_jwk, backend='cryptography')
+        self.assertDictEqual(payload, jwt_auth.validate(encoded))
+
+        with self.assertRaises(ERROR_AUTHENTICATE_FAILURE):
+            jwt_auth.validate('12345.12345.12345')
+
     def test_invalid_token_content(self):
         encoded = '12345.12345.12345'
         with self.assertRaises(ERROR_AUTHENTICATE_FAILURE):
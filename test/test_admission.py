@@ -0,0 +1,152 @@
+import threading
+import time
+import unittest
+
+import grpc
+
+from spaceone.core.pygrpc.admission import AdmissionController, _Limiter
+
+
+class _Aborted(Exception):
+    pass
+
+
+class _Context(object):
+    def __init__(self, time_remaining=None):
+        self._time_remaining = time_remaining
+        self.code = None
+
+    def time_remaining(self):
+        return self._time_remaining
+
+    def abort(self, code, details):
+        self.code = code
+        raise _Aborted(details)
+
+
+class TestAdmissionController(unittest.TestCase):
+    def _call(self, controller, method, behavior, context=None):
+        handler = grpc.unary_unary_rpc_method_handler(behavior)
+        handler = controller.wrap_handler(method, handler)
+        return handler.unary_unary({}, context or _Context())
+
+    def test_critical_method_is_not_wrapped(self):
+        controller = AdmissionController({}, 1)
+        handler = grpc.unary_unary_rpc_method_handler(lambda request, context: 1)
+
+        self.assertIs(
+            controller.wrap_handler("/grpc.health.v1.Health/Check", handler), handler
+        )
+        self.assertEqual(controller.get_priority("/test.v1.Domain/get"), "normal")
+
+    def test_method_limit(self):
+        # Rejected at once, a queued request must not hold a worker thread
+        controller = AdmissionController(
+            {
+                "queue_timeout": 60,
+                "methods": {"Domain.analyze": {"max_concurrency": 1}},
+            },
+            10,
+        )
+        started = threading.Event()
+        finish = threading.Event()
+
+        def analyze(request, context):
+            started.set()
+            finish.wait(5)
+            return "analyzed"
+
+        thread = threading.Thread(
+            target=self._call, args=(controller, "/test.v1.Domain/analyze", analyze)
+        )
+        thread.start()
+        started.wait(5)
+
+        context = _Context()
+        with self.assertRaises(_Aborted):
+            self._call(controller, "/test.v1.Domain/analyze", analyze, context)
+
+        self.assertEqual(context.code, grpc.StatusCode.RESOURCE_EXHAUSTED)
+        self.assertEqual(
+            self._call(controller, "/test.v1.Domain/get", lambda r, c: "get"), "get"
+        )
+
+        finish.set()
+        thread.join()
+        self.assertEqual(
+            self._call(controller, "/test.v1.Domain/analyze", analyze), "analyzed"
+        )
+
+    def test_queue_timeout(self):
+        controller = AdmissionController({"queue_timeout": 0.01}, 10)
+        handler = grpc.unary_unary_rpc_method_handler(lambda r, c: "get")
+        handler = controller.wrap_handler("/test.v1.Domain/get", handler)
+
+        # Waited in the queue of the thread pool longer than the queue timeout
+        time.sleep(0.02)
+
+        context = _Context()
+        with self.assertRaises(_Aborted):
+            handler.unary_unary({}, context)
+
+        self.assertEqual(context.code, grpc.StatusCode.RESOURCE_EXHAUSTED)
+        self.assertEqual(controller._global_limiter.in_flight, 0)
+
+    def test_expired_deadline(self):
+        controller = AdmissionController({}, 10)
+
+        with self.assertRaises(_Aborted):
+            self._call(
+                controller, "/test.v1.Domain/get", lambda r, c: "get", _Context(0)
+            )
+
+    def test_low_priority_reserve(self):
+        controller = AdmissionController(
+            {
+                "queue_timeout": 0.01,
+                "low_priority_ratio": 0.5,
+                "methods": {"export": {"priority": "low"}},
+            },
+            2,
+        )
+        finish = threading.Event()
+        thread = threading.Thread(
+            target=self._call,
+            args=(controller, "/test.v1.Domain/get", lambda r, c: finish.wait(5)),
+        )
+        thread.start()
+
+        while controller._global_limiter.in_flight == 0:
+            pass
+
+        with self.assertRaises(_Aborted):
+            self._call(controller, "/test.v1.Domain/export", lambda r, c: "export")
+
+        self.assertEqual(
+            self._call(controller, "/test.v1.Domain/list", lambda r, c: "list"), "list"
+        )
+
+        finish.set()
+        thread.join()
+
+    def test_adaptive_limit(self):
+        limiter = _Limiter("test", 10, {"enabled": True, "max_limit": 20})
+
+        for _ in range(20):
+            limiter.try_acquire()
+            limiter.release(0.01)
+
+        increased_limit = limiter.limit
+        self.assertGreaterEqual(increased_limit, 10)
+
+        for _ in range(20):
+            limiter.try_acquire()
+            limiter._last_decreased_at = 0
+            limiter.release(1.0)
+
+        self.assertLess(limiter.limit, increased_limit)
+        self.assertGreaterEqual(limiter.limit, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
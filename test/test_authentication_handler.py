@@ -0,0 +1,61 @@
+import json
+import time
+import unittest
+from unittest import mock
+
+from spaceone.core.auth.jwt import JWTUtil
+from spaceone.core.handler.authentication_handler import (
+    SpaceONEAuthenticationHandler,
+    _VerifiedTokenCache,
+)
+
+
+class TestAuthenticationHandler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.prv_jwk, cls.pub_jwk = JWTUtil.generate_jwk()
+
+    def _make_handler(self, handler_config: dict) -> SpaceONEAuthenticationHandler:
+        with mock.patch("spaceone.core.handler.authentication_handler.SpaceConnector"):
+            handler = SpaceONEAuthenticationHandler(handler_config)
+
+        handler._get_public_key = mock.Mock(return_value=json.dumps(self.pub_jwk))
+        return handler
+
+    def _make_token(self, **claims) -> str:
+        payload = {"did": "domain-123", "exp": int(time.time()) + 600, **claims}
+        return JWTUtil.encode(payload, self.prv_jwk)
+
+    def test_authenticator_per_domain(self):
+        handler = self._make_handler({})
+
+        with mock.patch.object(JWTUtil, "load_jwk", wraps=JWTUtil.load_jwk) as load_jwk:
+            handler._authenticate(self._make_token(), "domain-123")
+            handler._authenticate(self._make_token(), "domain-123")
+
+        load_jwk.assert_called_once()
+
+    def test_verified_token_cache(self):
+        handler = self._make_handler({"verified_token_cache": {"enabled": True}})
+        token = self._make_token(aud="user")
+
+        with mock.patch.object(JWTUtil, "decode", wraps=JWTUtil.decode) as decode:
+            token_info = handler._authenticate(token, "domain-123")
+            token_info["permissions"] = ["identity:*"]
+
+            self.assertEqual(handler._authenticate(token, "domain-123")["aud"], "user")
+            self.assertNotIn(
+                "permissions", handler._authenticate(token, "domain-123")
+            )
+
+        decode.assert_called_once()
+
+    def test_token_cache_expire_time(self):
+        token_cache = _VerifiedTokenCache(ttl=300)
+
+        self.assertEqual(token_cache._get_expire_time("", {"exp": 1100}, 1000), 1100)
+        self.assertEqual(token_cache._get_expire_time("", {}, 1000), 1300)
+
+
+if __name__ == "__main__":
+    unittest.main()
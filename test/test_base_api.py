@@ -0,0 +1,181 @@
+import asyncio
+import time
+import types
+import unittest
+
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+from spaceone.core.pygrpc.api import _GRPC_METHOD_NAME, BaseAPI
+
+
+def _make_pb2_modules():
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="test_base_api.proto", package="test.base_api", syntax="proto3"
+    )
+    message_proto = file_proto.message_type.add(name="DomainInfo")
+    message_proto.field.add(
+        name="domain_id",
+        number=1,
+        type=descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+        label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+    )
+    service_proto = file_proto.service.add(name="Domain")
+    service_proto.method.add(
+        name="get",
+        input_type=".test.base_api.DomainInfo",
+        output_type=".test.base_api.DomainInfo",
+    )
+    service_proto.method.add(
+        name="list",
+        input_type=".test.base_api.DomainInfo",
+        output_type=".test.base_api.DomainInfo",
+        server_streaming=True,
+    )
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    file_desc = pool.FindFileByName(file_proto.name)
+
+    pb2 = types.ModuleType("test_base_api_pb2")
+    pb2.DESCRIPTOR = file_desc
+    pb2.DomainInfo = message_factory.MessageFactory(pool).GetPrototype(
+        file_desc.message_types_by_name["DomainInfo"]
+    )
+
+    pb2_grpc = types.ModuleType("test_base_api_pb2_grpc")
+    pb2_grpc.DomainServicer = type(
+        "DomainServicer",
+        (object,),
+        {"__module__": pb2_grpc.__name__, "get": None, "list": None},
+    )
+
+    return pb2, pb2_grpc
+
+
+_PB2, _PB2_GRPC = _make_pb2_modules()
+
+
+class Domain(BaseAPI, _PB2_GRPC.DomainServicer):
+    pb2 = _PB2
+    pb2_grpc = _PB2_GRPC
+
+    def get(self, request, context):
+        return self._make_response({"domain_id": "domain-123"})
+
+    def list(self, request, context):
+        for domain_id in ["domain-1", "domain-2"]:
+            yield self.dict_to_message({"domain_id": domain_id})
+
+    def _make_response(self, response):
+        return self.dict_to_message(response)
+
+
+def _make_async_domain():
+    class Domain(BaseAPI, _PB2_GRPC.DomainServicer):
+        pb2 = _PB2
+        pb2_grpc = _PB2_GRPC
+
+        async def get(self, request, context):
+            await asyncio.sleep(0)
+            return self._make_response({"domain_id": "domain-123"})
+
+        async def list(self, request, context):
+            for domain_id in ["domain-1", "domain-2"]:
+                await asyncio.sleep(0)
+                yield self.dict_to_message({"domain_id": domain_id})
+
+        def _make_response(self, response):
+            return self.dict_to_message(response)
+
+    return Domain
+
+
+AsyncDomain = _make_async_domain()
+
+
+class _AsyncContext(object):
+    def __init__(self):
+        self.status = None
+
+    async def abort(self, code, details):
+        self.status = (code, details)
+        raise Exception(details)
+
+
+class _Context(object):
+    def __init__(self, time_remaining):
+        self._time_remaining = time_remaining
+
+    def invocation_metadata(self):
+        return [("token", "token-123"), ("deadline", "spoofed")]
+
+    def peer(self):
+        return "ipv4:127.0.0.1:50000"
+
+    def time_remaining(self):
+        return self._time_remaining
+
+
+class TestBaseAPI(unittest.TestCase):
+    def setUp(self):
+        self.api = Domain()
+
+    def test_unary_method(self):
+        response = self.api.get(_PB2.DomainInfo(), None)
+        self.assertIsInstance(response, _PB2.DomainInfo)
+        self.assertEqual(response.domain_id, "domain-123")
+
+    def test_stream_method(self):
+        responses = list(self.api.list(_PB2.DomainInfo(), None))
+        self.assertEqual([r.domain_id for r in responses], ["domain-1", "domain-2"])
+
+    def test_stream_method_name_is_reset(self):
+        # Other work on the worker thread runs between and after the responses
+        for _ in self.api.list(_PB2.DomainInfo(), None):
+            self.assertIsNone(_GRPC_METHOD_NAME.get())
+
+        self.assertIsNone(_GRPC_METHOD_NAME.get())
+
+    def test_outside_grpc_call(self):
+        def get():
+            return self.api.dict_to_message({"domain_id": "domain-123"})
+
+        self.assertEqual(get().domain_id, "domain-123")
+
+    def test_deadline_metadata(self):
+        metadata = self.api._get_metadata(_Context(10))
+        self.assertEqual(metadata["token"], "token-123")
+        self.assertAlmostEqual(metadata["deadline"], time.time() + 10, delta=1)
+
+        # No deadline is set by the client
+        metadata = self.api._get_metadata(_Context(9.2e18))
+        self.assertNotIn("deadline", metadata)
+
+    def test_async_methods(self):
+        api = AsyncDomain()
+
+        async def call():
+            response = await api.get(_PB2.DomainInfo(), None)
+            responses = [r async for r in api.list(_PB2.DomainInfo(), None)]
+
+            method_name = _GRPC_METHOD_NAME.get()
+            return response, responses, method_name
+
+        response, responses, method_name = asyncio.run(call())
+        self.assertIsNone(method_name)
+        self.assertEqual(response.domain_id, "domain-123")
+        self.assertEqual([r.domain_id for r in responses], ["domain-1", "domain-2"])
+
+    def test_async_method_error(self):
+        api = AsyncDomain()
+        context = _AsyncContext()
+
+        api._make_response = lambda response: 1 / 0
+        with self.assertRaises(Exception):
+            asyncio.run(api.get(_PB2.DomainInfo(), context))
+
+        self.assertEqual(context.status[0].name, "INTERNAL")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import threading
+import time
+import unittest
+
+from spaceone.core.connector.batch_loader import BatchLoader
+
+
+class TestBatchLoader(unittest.TestCase):
+    def _load_concurrently(self, loader, keys, batch_fn, **kwargs):
+        results = {}
+        errors = {}
+
+        def load(index, key):
+            try:
+                results[index] = loader.load("Project.get", key, batch_fn, **kwargs)
+            except Exception as e:
+                errors[index] = e
+
+        threads = [
+            threading.Thread(target=load, args=(index, key))
+            for index, key in enumerate(keys)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results, errors
+
+    def test_coalesce_lookups(self):
+        batches = []
+
+        def batch_fn(keys):
+            batches.append(sorted(keys))
+            return {key: {"project_id": key} for key in keys if key != "project-x"}
+
+        loader = BatchLoader()
+        keys = ["project-1", "project-2", "project-1", "project-x"]
+        results, errors = self._load_concurrently(loader, keys, batch_fn, window=0.2)
+
+        self.assertEqual(batches, [["project-1", "project-2", "project-x"]])
+        self.assertEqual(results[0], {"project_id": "project-1"})
+        self.assertEqual(results[1], {"project_id": "project-2"})
+        self.assertEqual(results[2], {"project_id": "project-1"})
+        self.assertIsNot(results[0], results[2])
+        self.assertIsInstance(errors[3], KeyError)
+
+    def test_max_batch_size(self):
+        batches = []
+
+        def batch_fn(keys):
+            batches.append(len(keys))
+            return {key: key for key in keys}
+
+        loader = BatchLoader()
+        keys = [f"project-{index}" for index in range(6)]
+        results, errors = self._load_concurrently(
+            loader, keys, batch_fn, window=0.5, max_batch_size=3
+        )
+
+        self.assertEqual(errors, {})
+        self.assertEqual(sum(batches), 6)
+        self.assertTrue(all(size <= 3 for size in batches))
+        self.assertEqual([results[index] for index in range(6)], keys)
+
+    def test_full_batch_is_dispatched_at_once(self):
+        def batch_fn(keys):
+            return {key: key for key in keys}
+
+        loader = BatchLoader()
+        keys = [f"project-{index}" for index in range(3)]
+
+        started_at = time.monotonic()
+        results, errors = self._load_concurrently(
+            loader, keys, batch_fn, window=5, max_batch_size=3
+        )
+        self.assertLess(time.monotonic() - started_at, 1)
+        self.assertEqual(len(results), 3)
+
+        started_at = time.monotonic()
+        self.assertEqual(
+            loader.load("Project.get", "project-1", batch_fn, 5, max_batch_size=1),
+            "project-1",
+        )
+        self.assertLess(time.monotonic() - started_at, 1)
+
+    def test_batch_error(self):
+        def batch_fn(keys):
+            raise ValueError("list failed")
+
+        loader = BatchLoader()
+        results, errors = self._load_concurrently(
+            loader, ["project-1", "project-2"], batch_fn, window=0.1
+        )
+
+        self.assertEqual(results, {})
+        self.assertTrue(all(isinstance(e, ValueError) for e in errors.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
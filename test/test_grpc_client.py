@@ -0,0 +1,163 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from concurrent import futures
+
+import grpc
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
+from grpc_reflection.v1alpha import reflection
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core.pygrpc import compression, descriptor_cache
+from spaceone.core.pygrpc.client import _GRPC_CHANNEL, _get_channel_options, client
+
+
+class TestGRPCClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.set_default_conf()
+
+        cls.server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        health_pb2_grpc.add_HealthServicer_to_server(
+            health.HealthServicer(), cls.server
+        )
+        reflection.enable_server_reflection(
+            [health_pb2.DESCRIPTOR.services_by_name["Health"].full_name], cls.server
+        )
+        port = cls.server.add_insecure_port("127.0.0.1:0")
+        cls.server.start()
+        cls.endpoint = f"127.0.0.1:{port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop(None)
+
+    def setUp(self):
+        config.set_global(GRPC_CLIENT={"pool_size": 2, "lb_policy": "round_robin"})
+
+    def tearDown(self):
+        if conn := _GRPC_CHANNEL.pop(self.endpoint, None):
+            conn.close()
+
+        config.set_global(
+            GRPC_CLIENT={
+                "pool_size": 1,
+                "lb_policy": None,
+                "descriptor_cache_path": None,
+            }
+        )
+
+    def test_concurrent_first_calls(self):
+        clients = []
+
+        def connect():
+            clients.append(client(endpoint=self.endpoint))
+
+        threads = [threading.Thread(target=connect) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(clients), 8)
+        self.assertTrue(all(conn is clients[0] for conn in clients))
+        self.assertEqual(clients[0].pool_size, 2)
+
+    def test_round_robin_calls(self):
+        conn = client(endpoint=self.endpoint)
+
+        first = conn.Health.Check
+        second = conn.Health.Check
+        self.assertIsNot(first, second)
+
+        for _ in range(4):
+            response = conn.Health.Check({"service": ""})
+            self.assertEqual(response.status, health_pb2.HealthCheckResponse.SERVING)
+
+    def test_fetch_descriptor_set(self):
+        channel = grpc.insecure_channel(self.endpoint)
+        descriptor_set = descriptor_cache.fetch_descriptor_set(channel, 5)
+        channel.close()
+
+        services = descriptor_cache.get_services(descriptor_set)
+        self.assertIn("grpc.health.v1.Health", services)
+
+        desc_pool = descriptor_cache.make_descriptor_pool(descriptor_set)
+        service_desc = desc_pool.FindServiceByName("grpc.health.v1.Health")
+        self.assertEqual(service_desc.methods_by_name["Check"].name, "Check")
+
+    def test_descriptor_cache(self):
+        with tempfile.TemporaryDirectory() as cache_path:
+            config.set_global(GRPC_CLIENT={"descriptor_cache_path": cache_path})
+
+            client(endpoint=self.endpoint)
+            self.assertEqual(len(os.listdir(cache_path)), 1)
+            _GRPC_CHANNEL.pop(self.endpoint).close()
+
+            # Reflection is not required to create the client with the cache
+            with mock.patch.object(
+                descriptor_cache,
+                "fetch_descriptor_set",
+                side_effect=Exception("reflection is called"),
+            ):
+                conn = client(endpoint=self.endpoint)
+                response = conn.Health.Check({"service": ""})
+
+            self.assertEqual(response.status, health_pb2.HealthCheckResponse.SERVING)
+            self.assertIn("Check", conn.api_resources["Health"])
+
+    def test_channel_options(self):
+        options = _get_channel_options(
+            {"lb_policy": "round_robin", "keepalive_time_ms": 30000}, 1024, 2
+        )
+
+        self.assertIn(("grpc.lb_policy_name", "round_robin"), options)
+        self.assertIn(("grpc.keepalive_time_ms", 30000), options)
+        self.assertIn(("grpc.use_local_subchannel_pool", 1), options)
+
+    def test_channel_conf_overrides_max_message_length(self):
+        options = _get_channel_options({"max_message_length": 2048}, 1024)
+
+        self.assertIn(("grpc.max_receive_message_length", 2048), options)
+
+    def test_request_compression(self):
+        conn = client(
+            endpoint=self.endpoint,
+            channel_conf={"compression": "gzip", "compression_threshold": 10},
+        )
+
+        small_request = health_pb2.HealthCheckRequest(service="a")
+        large_request = health_pb2.HealthCheckRequest(service="a" * 10)
+        self.assertEqual(
+            conn.get_compression(small_request), grpc.Compression.NoCompression
+        )
+        self.assertEqual(conn.get_compression(large_request), grpc.Compression.Gzip)
+
+        response = conn.Health.Check({"service": ""})
+        self.assertEqual(response.status, health_pb2.HealthCheckResponse.SERVING)
+
+    def test_response_compression_threshold(self):
+        def check(request, context):
+            return health_pb2.HealthCheckResponse(status=1 if request.service else 0)
+
+        handler = compression.wrap_handler(
+            grpc.unary_unary_rpc_method_handler(check), threshold=2
+        )
+        context = mock.Mock()
+
+        handler.unary_unary(health_pb2.HealthCheckRequest(service="a"), context)
+        context.disable_next_message_compression.assert_not_called()
+
+        handler.unary_unary(health_pb2.HealthCheckRequest(), context)
+        context.disable_next_message_compression.assert_called_once()
+
+    def test_invalid_compression(self):
+        with self.assertRaises(ERROR_CONFIGURATION):
+            compression.get_compression("zstd")
+
+
+if __name__ == "__main__":
+    unittest.main()
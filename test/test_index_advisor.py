@@ -0,0 +1,104 @@
+import unittest
+
+from mongoengine import StringField, DateTimeField
+
+from spaceone.core.model.mongo_model import MongoModel, index_advisor
+
+
+class Project(MongoModel):
+    project_id = StringField(max_length=40, unique=True)
+    name = StringField(max_length=255)
+    state = StringField(max_length=20)
+    workspace_id = StringField(max_length=40)
+    domain_id = StringField(max_length=40)
+    created_at = DateTimeField(auto_now_add=True)
+
+    meta = {
+        "indexes": [
+            "name",
+            ["domain_id", "workspace_id"],
+        ]
+    }
+
+
+class TestIndexAdvisor(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestIndexAdvisor, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super(TestIndexAdvisor, cls).tearDownClass()
+
+    def setUp(self):
+        index_advisor.reset()
+
+    def tearDown(self):
+        index_advisor.reset()
+
+    def test_indexed_query(self):
+        for _ in range(3):
+            index_advisor.observe(
+                "Project", [("workspace_id", "eq"), ("domain_id", "eq")], [], []
+            )
+
+        index_advisor.observe("Project", [("name", "contain")], [], [("name", True)])
+
+        report = index_advisor.make_report([Project], index_advisor.get_observations())
+
+        self.assertEqual(4, report[0]["total_queries"])
+        self.assertEqual(0, report[0]["unindexed_queries"])
+        self.assertListEqual([], report[0]["recommended_indexes"])
+
+    def test_leading_equality_key_is_not_enough(self):
+        # Most queries have domain_id, it must not hide the other keys
+        for _ in range(3):
+            index_advisor.observe(
+                "Project", [("domain_id", "eq"), ("name", "contain")], [], []
+            )
+
+        index_advisor.observe(
+            "Project",
+            [("domain_id", "eq"), ("workspace_id", "eq")],
+            [],
+            [("name", False)],
+        )
+
+        report = index_advisor.make_report([Project], index_advisor.get_observations())
+
+        self.assertEqual(4, report[0]["unindexed_queries"])
+        self.assertListEqual(
+            ["domain_id", "name"], report[0]["recommended_indexes"][0]["fields"]
+        )
+        self.assertListEqual(
+            ["domain_id", "workspace_id", "name"],
+            report[0]["recommended_indexes"][1]["fields"],
+        )
+
+    def test_recommend_esr_index(self):
+        for _ in range(5):
+            index_advisor.observe(
+                "Project",
+                [("created_at", "datetime_gte"), ("state", "eq")],
+                [],
+                [("created_at", True)],
+            )
+
+        index_advisor.observe("Project", [("workspace_id", "eq")], [], [])
+
+        report = index_advisor.make_report([Project], index_advisor.get_observations())
+
+        self.assertEqual(6, report[0]["total_queries"])
+        self.assertEqual(6, report[0]["unindexed_queries"])
+        self.assertListEqual(
+            ["state", "-created_at"], report[0]["recommended_indexes"][0]["fields"]
+        )
+        self.assertEqual(5, report[0]["recommended_indexes"][0]["count"])
+        self.assertListEqual(
+            ["workspace_id"], report[0]["recommended_indexes"][1]["fields"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
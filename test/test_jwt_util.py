@@ -1,4 +1,9 @@
+import time
 import unittest
+
+from cryptography.exceptions import InvalidSignature
+
+from spaceone.core import config
 from spaceone.core.auth.jwt.jwt_util import JWTUtil
 
 
@@ -52,3 +57,53 @@ class TestJWTUtil(unittest.TestCase):
         print(f'decoded: {decoded}')
 
         self.assertDictEqual(self.payload, decoded)
+
+
+class TestCryptographyJWTUtil(TestJWTUtil):
+    """Runs the same tests with the cryptography backend."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        config.set_global_force(JWT_BACKEND='cryptography')
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        config.set_global_force(JWT_BACKEND='jwcrypto')
+
+    def test_compatible_with_jwcrypto(self):
+        self.prv_jwk, self.pub_jwk = JWTUtil.generate_jwk()
+        self.payload = {
+            'did': 'domain-123',
+            'rol': 'WORKSPACE_MEMBER',
+            'permissions': ['identity:*'],
+            'exp': int(time.time()) + 600
+        }
+
+        encoded = JWTUtil.encode(self.payload, self.prv_jwk, backend='jwcrypto')
+        self.assertDictEqual(self.payload, JWTUtil.decode(encoded, self.pub_jwk))
+
+        encoded = JWTUtil.encode(self.payload, self.prv_jwk)
+        self.assertDictEqual(
+            self.payload, JWTUtil.decode(encoded, self.pub_jwk, backend='jwcrypto')
+        )
+
+    def test_invalid_token(self):
+        self.prv_jwk, self.pub_jwk = JWTUtil.generate_jwk()
+        other_prv_jwk, _ = JWTUtil.generate_jwk()
+
+        expired = JWTUtil.encode({'exp': int(time.time()) - 3600}, self.prv_jwk)
+        with self.assertRaises(ValueError):
+            JWTUtil.decode(expired, self.pub_jwk)
+
+        forged = JWTUtil.encode({'hello': 'world'}, other_prv_jwk)
+        with self.assertRaises(InvalidSignature):
+            JWTUtil.decode(forged, self.pub_jwk)
+
+        encoded = JWTUtil.encode({'aud': 'user'}, self.prv_jwk)
+        with self.assertRaises(ValueError):
+            options = {'verify_aud': True, 'aud': 'app'}
+            JWTUtil.decode(encoded, self.pub_jwk, options=options)
+
+        options = {'verify_aud': True, 'aud': ['user']}
+        decoded = JWTUtil.decode(encoded, self.pub_jwk, options=options)
+        self.assertDictEqual({'aud': 'user'}, decoded)
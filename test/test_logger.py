@@ -0,0 +1,265 @@
+import io
+import json
+import logging
+import sys
+import unittest
+from unittest import mock
+
+from spaceone.core import config
+from spaceone.core.logger import (
+    _LISTENERS,
+    _QueueHandler,
+    _snapshot_parameter,
+    flush_logger,
+    set_logger,
+)
+from spaceone.core.logger.filters import MaskingFilter, RateLimitFilter, SamplingFilter
+from spaceone.core.logger.formatter import JsonFormatter
+
+
+def _make_record(
+    level: int = logging.INFO, msg: str = "test", **kwargs
+) -> logging.LogRecord:
+    record = logging.LogRecord("test", level, "test.py", 1, msg, None, None)
+    for key, value in kwargs.items():
+        setattr(record, key, value)
+
+    return record
+
+
+class TestMaskingFilter(unittest.TestCase):
+    def setUp(self):
+        self.filter = MaskingFilter({"User.create": ["password"]})
+
+    def test_masking(self):
+        params = {"user_id": "user", "password": "secret"}
+        record = _make_record(tnx_method="User.create", parameter=params)
+
+        self.filter.filter(record)
+
+        self.assertEqual(record.parameter, {"user_id": "user", "password": "********"})
+        self.assertEqual(params["password"], "secret")
+
+    def test_masking_without_matched_key(self):
+        params = {"user_id": "user"}
+        record = _make_record(tnx_method="User.create", parameter=params)
+
+        self.filter.filter(record)
+
+        self.assertIs(record.parameter, params)
+
+    def test_masking_without_rule(self):
+        params = {"password": "secret"}
+        record = _make_record(tnx_method="User.update", parameter=params)
+
+        self.filter.filter(record)
+
+        self.assertIs(record.parameter, params)
+
+
+class TestSamplingFilter(unittest.TestCase):
+    def test_sampling_per_tnx_method(self):
+        sampling_filter = SamplingFilter({"Project.get": 0.0})
+
+        self.assertFalse(sampling_filter.filter(_make_record(tnx_method="Project.get")))
+        self.assertTrue(sampling_filter.filter(_make_record(tnx_method="Project.list")))
+        self.assertTrue(
+            sampling_filter.filter(
+                _make_record(logging.ERROR, tnx_method="Project.get")
+            )
+        )
+
+    def test_sampling_per_trace(self):
+        sampling_filter = SamplingFilter(default_rate=0.5)
+        trace_ids = [f"{i:032x}" for i in range(100)]
+
+        results = [
+            sampling_filter.filter(_make_record(trace_id=trace_id))
+            for trace_id in trace_ids
+        ]
+        self.assertTrue(any(results))
+        self.assertFalse(all(results))
+
+        # Logs of the same request are sampled together
+        self.assertEqual(
+            results,
+            [
+                sampling_filter.filter(_make_record(trace_id=trace_id))
+                for trace_id in trace_ids
+            ],
+        )
+
+
+class TestRateLimitFilter(unittest.TestCase):
+    def test_rate_limit(self):
+        rate_limit_filter = RateLimitFilter(rate=1, burst=2)
+
+        with mock.patch("time.monotonic", return_value=100.0) as monotonic:
+            results = [
+                rate_limit_filter.filter(_make_record(logging.ERROR, "failed"))
+                for _ in range(3)
+            ]
+            self.assertEqual(results, [True, True, False])
+
+            # Other call sites and lower levels are not limited
+            self.assertTrue(
+                rate_limit_filter.filter(_make_record(logging.ERROR, lineno=2))
+            )
+            self.assertTrue(rate_limit_filter.filter(_make_record(msg="failed")))
+
+            monotonic.return_value = 101.0
+            self.assertTrue(
+                rate_limit_filter.filter(_make_record(logging.ERROR, "failed"))
+            )
+
+    def test_rate_limit_with_varying_messages(self):
+        rate_limit_filter = RateLimitFilter(rate=1, burst=2)
+
+        with mock.patch("time.monotonic", return_value=100.0):
+            results = [
+                rate_limit_filter.filter(
+                    _make_record(logging.ERROR, f"failed: project-{index}")
+                )
+                for index in range(3)
+            ]
+
+        self.assertEqual(results, [True, True, False])
+
+    def test_rate_limit_shared_by_handlers(self):
+        # dictConfig gives every handler listing "rate_limit" the same instance
+        rate_limit_filter = RateLimitFilter(rate=0.001, burst=4)
+        streams = [io.StringIO(), io.StringIO()]
+        _logger = logging.getLogger("test.rate_limit")
+        _logger.propagate = False
+        self.addCleanup(_logger.handlers.clear)
+
+        for stream in streams:
+            handler = logging.StreamHandler(stream)
+            handler.addFilter(rate_limit_filter)
+            _logger.addHandler(handler)
+
+        for _ in range(6):
+            _logger.error("failed")
+
+        self.assertEqual([stream.getvalue().count("failed") for stream in streams], [4, 4])
+
+    def test_rate_limit_disabled(self):
+        rate_limit_filter = RateLimitFilter()
+
+        for _ in range(20):
+            self.assertTrue(rate_limit_filter.filter(_make_record(logging.ERROR)))
+
+
+class TestJsonFormatter(unittest.TestCase):
+    def test_format(self):
+        record = _make_record(
+            msg="hello %s", tnx_method="Project.get", parameter={"name": "test"}
+        )
+        record.args = ("world",)
+
+        log = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(log["message"], "hello world")
+        self.assertEqual(log["tnx_method"], "Project.get")
+        self.assertEqual(log["parameter"], {"name": "test"})
+        self.assertEqual(log["error"]["traceback"], "")
+
+    def test_format_exception(self):
+        try:
+            raise ValueError("failed")
+        except ValueError:
+            record = logging.LogRecord(
+                "test", logging.ERROR, "test.py", 1, "error", None, sys.exc_info()
+            )
+
+        log = json.loads(JsonFormatter().format(record))
+
+        self.assertIn("ValueError: failed", log["error"]["traceback"])
+
+
+class TestAsyncLogging(unittest.TestCase):
+    def setUp(self):
+        config.set_default_conf()
+        config.set_global(LOG_ASYNC={"enabled": True})
+
+    def tearDown(self):
+        config.set_global(LOG={}, LOG_ASYNC={"enabled": False})
+        set_logger()
+
+    def test_async_logging(self):
+        set_logger()
+
+        (queue_handler,) = logging.getLogger("spaceone").handlers
+        self.assertIsInstance(queue_handler, _QueueHandler)
+
+        (listener,) = _LISTENERS
+        stream = io.StringIO()
+        listener.handlers[0].setStream(stream)
+
+        logging.getLogger("spaceone.test").info("hello %s", "world")
+        flush_logger()
+
+        self.assertIn("hello world", stream.getvalue())
+
+    def test_async_logging_parameter_snapshot(self):
+        set_logger()
+
+        (queue_handler,) = logging.getLogger("spaceone").handlers
+        params = {"query": {"filter": []}}
+        record = queue_handler.prepare(_make_record(parameter=dict(params)))
+
+        # The service body changes nested parameters after the request is logged
+        params["query"]["filter"].append({"k": "name", "v": "test", "o": "eq"})
+
+        self.assertEqual(record.parameter, {"query": {"filter": []}})
+
+    def test_async_logging_filters_before_snapshot(self):
+        config.set_global(
+            LOG={"filters": {"sampling": {"default_rate": 0.0}}},
+            LOG_ASYNC={"enabled": True},
+        )
+        set_logger()
+
+        (listener,) = _LISTENERS
+        stream = io.StringIO()
+        listener.handlers[0].setStream(stream)
+
+        with mock.patch(
+            "spaceone.core.logger._snapshot_parameter",
+            side_effect=_snapshot_parameter,
+        ) as snapshot:
+            logging.getLogger("spaceone.test").info(
+                "sampled out", extra={"parameter": {"name": "test"}}
+            )
+            logging.getLogger("spaceone.test").error(
+                "kept", extra={"parameter": {"name": "test"}}
+            )
+            flush_logger()
+
+        snapshot.assert_called_once()
+        self.assertNotIn("sampled out", stream.getvalue())
+        self.assertIn("kept", stream.getvalue())
+
+    def test_async_logging_reports_dropped_records(self):
+        config.set_global(LOG_ASYNC={"enabled": True, "queue_size": 1})
+        set_logger()
+
+        (queue_handler,) = logging.getLogger("spaceone").handlers
+        (listener,) = _LISTENERS
+        listener.stop()
+        _LISTENERS.clear()
+
+        _logger = logging.getLogger("spaceone.test")
+        _logger.info("first")
+        _logger.info("dropped")
+        self.assertEqual(queue_handler.dropped, 1)
+
+        queue_handler.queue.get_nowait()
+        _logger.info("second")
+
+        record = queue_handler.queue.get_nowait()
+        self.assertIn("1 log records are dropped", record.getMessage())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import unittest
+
+from google.protobuf import (
+    descriptor_pb2,
+    descriptor_pool,
+    message_factory,
+    struct_pb2,
+    timestamp_pb2,
+)
+from google.protobuf.json_format import MessageToDict, ParseDict, ParseError
+
+from spaceone.core.pygrpc.message_converter import message_to_dict, dict_to_message
+
+_FIELD = descriptor_pb2.FieldDescriptorProto
+
+
+def _make_message_class():
+    pool = descriptor_pool.DescriptorPool()
+    pool.AddSerializedFile(struct_pb2.DESCRIPTOR.serialized_pb)
+    pool.AddSerializedFile(timestamp_pb2.DESCRIPTOR.serialized_pb)
+
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="test_message_converter.proto",
+        package="test.converter",
+        syntax="proto3",
+        dependency=["google/protobuf/struct.proto", "google/protobuf/timestamp.proto"],
+    )
+    enum_proto = file_proto.enum_type.add(name="State")
+    enum_proto.value.add(name="NONE", number=0)
+    enum_proto.value.add(name="ENABLED", number=1)
+
+    message_proto = file_proto.message_type.add(name="ResourceInfo")
+    tags_entry = message_proto.nested_type.add(name="TagsEntry")
+    tags_entry.options.map_entry = True
+    tags_entry.field.add(
+        name="key", number=1, type=_FIELD.TYPE_STRING, label=_FIELD.LABEL_OPTIONAL
+    )
+    tags_entry.field.add(
+        name="value", number=2, type=_FIELD.TYPE_INT64, label=_FIELD.LABEL_OPTIONAL
+    )
+    message_proto.oneof_decl.add(name="target")
+
+    fields = [
+        ("resource_id", _FIELD.TYPE_STRING, _FIELD.LABEL_OPTIONAL, None),
+        ("size", _FIELD.TYPE_INT64, _FIELD.LABEL_OPTIONAL, None),
+        ("count", _FIELD.TYPE_INT32, _FIELD.LABEL_OPTIONAL, None),
+        ("ratio", _FIELD.TYPE_DOUBLE, _FIELD.LABEL_OPTIONAL, None),
+        ("is_managed", _FIELD.TYPE_BOOL, _FIELD.LABEL_OPTIONAL, None),
+        ("raw", _FIELD.TYPE_BYTES, _FIELD.LABEL_OPTIONAL, None),
+        ("state", _FIELD.TYPE_ENUM, _FIELD.LABEL_OPTIONAL, ".test.converter.State"),
+        ("names", _FIELD.TYPE_STRING, _FIELD.LABEL_REPEATED, None),
+        ("data", _FIELD.TYPE_MESSAGE, _FIELD.LABEL_OPTIONAL, ".google.protobuf.Struct"),
+        (
+            "results",
+            _FIELD.TYPE_MESSAGE,
+            _FIELD.LABEL_REPEATED,
+            ".google.protobuf.Struct",
+        ),
+        (
+            "created_at",
+            _FIELD.TYPE_MESSAGE,
+            _FIELD.LABEL_OPTIONAL,
+            ".google.protobuf.Timestamp",
+        ),
+        (
+            "tags",
+            _FIELD.TYPE_MESSAGE,
+            _FIELD.LABEL_REPEATED,
+            ".test.converter.ResourceInfo.TagsEntry",
+        ),
+        (
+            "children",
+            _FIELD.TYPE_MESSAGE,
+            _FIELD.LABEL_REPEATED,
+            ".test.converter.ResourceInfo",
+        ),
+        ("user_id", _FIELD.TYPE_STRING, _FIELD.LABEL_OPTIONAL, None),
+        ("project_id", _FIELD.TYPE_STRING, _FIELD.LABEL_OPTIONAL, None),
+    ]
+
+    for number, (name, field_type, label, type_name) in enumerate(fields, 1):
+        field = message_proto.field.add(
+            name=name, number=number, type=field_type, label=label
+        )
+        if type_name:
+            field.type_name = type_name
+        if name in ["user_id", "project_id"]:
+            field.oneof_index = 0
+
+    pool.Add(file_proto)
+    message_desc = pool.FindMessageTypeByName("test.converter.ResourceInfo")
+    return message_factory.MessageFactory(pool).GetPrototype(message_desc)
+
+
+ResourceInfo = _make_message_class()
+
+_DATA = {
+    "resource_id": "resource-123",
+    "size": "1099511627776",
+    "count": 3,
+    "ratio": 0.5,
+    "is_managed": True,
+    "raw": "c3BhY2VvbmU=",
+    "state": "ENABLED",
+    "names": ["a", "b"],
+    "data": {
+        "nested": {"list": [1, "two", None, True, {"k": [1.5]}]},
+        "empty": {},
+        "null": None,
+    },
+    "results": [{"name": "x"}, {}],
+    "created_at": "2023-01-01T00:00:00.123Z",
+    "tags": {"a": "1", "b": "2"},
+    "children": [{"resource_id": "child-1", "data": {"x": 1}}],
+    "user_id": "user-1",
+}
+
+
+class TestMessageConverter(unittest.TestCase):
+    def test_dict_to_message(self):
+        message = dict_to_message(_DATA, ResourceInfo)
+        self.assertEqual(message, ParseDict(_DATA, ResourceInfo()))
+
+    def test_message_to_dict(self):
+        message = ParseDict(_DATA, ResourceInfo())
+        self.assertEqual(
+            message_to_dict(message),
+            MessageToDict(message, preserving_proto_field_name=True),
+        )
+
+    def test_json_name_and_loose_values(self):
+        data = {"resourceId": "resource-123", "count": "3", "ratio": "NaN", "state": 1}
+        message = dict_to_message(data, ResourceInfo)
+        self.assertEqual(
+            message_to_dict(message),
+            MessageToDict(ParseDict(data, ResourceInfo()), preserving_proto_field_name=True),
+        )
+
+    def test_struct(self):
+        data = {"a": [1, {"b": None}], "c": "d"}
+        message = dict_to_message(data, struct_pb2.Struct)
+        self.assertEqual(message, ParseDict(data, struct_pb2.Struct()))
+        self.assertEqual(message_to_dict(message), MessageToDict(message))
+
+    def test_invalid_data(self):
+        with self.assertRaises(ParseError):
+            dict_to_message({"unknown": 1}, ResourceInfo)
+
+        with self.assertRaises(ParseError):
+            dict_to_message({"user_id": "u", "project_id": "p"}, ResourceInfo)
+
+        with self.assertRaises(ParseError):
+            dict_to_message({"names": "a"}, ResourceInfo)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+from unittest import mock
+
+import mongomock
+from mongoengine import DictField, ListField, StringField, connect, disconnect
+from pymongo import ReadPreference
+
+from spaceone.core.model.mongo_model import MongoModel
+from spaceone.core.transaction import get_transaction, delete_transaction
+
+
+class Note(MongoModel):
+    note_id = StringField(max_length=40, unique=True)
+    name = StringField(max_length=255)
+
+    meta = {"indexes": ["name"]}
+
+
+class Memo(MongoModel):
+    memo_id = StringField(max_length=40, unique=True)
+
+    meta = {"indexes": ["memo_id"]}
+
+
+class Server(MongoModel):
+    server_id = StringField(max_length=40, unique=True)
+    name = StringField(max_length=255)
+    state = StringField(max_length=20)
+    nics = ListField(DictField())
+
+
+class TestMongoModelIndexCreation(unittest.TestCase):
+    def test_parallel_index_creation_failure(self):
+        with mock.patch.object(Note, "_create_index") as note_create_index:
+            with mock.patch.object(Memo, "_create_index") as memo_create_index:
+                note_create_index.side_effect = RuntimeError("index build failed")
+
+                with self.assertLogs(
+                    "spaceone.core.model.mongo_model", "ERROR"
+                ) as logs:
+                    with self.assertRaises(RuntimeError):
+                        MongoModel._create_indexes([Note, Memo], {"mode": "parallel"})
+
+        memo_create_index.assert_called_once()
+        self.assertIn("Note", logs.output[0])
+
+    def test_background_index_creation_failure(self):
+        with mock.patch.object(Note, "_create_index") as note_create_index:
+            note_create_index.side_effect = RuntimeError("index build failed")
+
+            with self.assertLogs("spaceone.core.model.mongo_model", "ERROR") as logs:
+                MongoModel._create_indexes_in_parallel([Note], 1, background=True)
+
+        self.assertIn("index build failed", logs.output[0])
+
+
+class TestMongoModelReadYourWrites(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            uuidRepresentation="standard",
+        )
+        MongoModel._init_read_your_writes({"enabled": True})
+
+    @classmethod
+    def tearDownClass(cls):
+        MongoModel._init_read_your_writes({"enabled": False})
+        disconnect()
+
+    def setUp(self):
+        self.note_vo = Note(note_id="note-1", name="before").save()
+        get_transaction()
+
+    def tearDown(self):
+        delete_transaction()
+        Note.objects.delete()
+
+    def _get_read_preference(self):
+        return Note._get_target_objects(None)._read_preference
+
+    def test_read_without_write(self):
+        self.assertIsNone(self._get_read_preference())
+
+    def test_read_after_instance_update(self):
+        self.note_vo.update({"name": "after"})
+
+        self.assertEqual(self._get_read_preference(), ReadPreference.PRIMARY)
+        self.assertEqual(Note.get(note_id="note-1").name, "after")
+
+    def test_read_after_instance_set_data(self):
+        self.note_vo.set_data("name", "after")
+
+        self.assertEqual(self._get_read_preference(), ReadPreference.PRIMARY)
+
+
+class TestMongoModelPipelineQuery(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            uuidRepresentation="standard",
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        Server(
+            server_id="server-1",
+            name="web",
+            state="RUNNING",
+            nics=[{"ip": "10.0.0.1"}, {"ip": "10.0.0.2"}],
+        ).save()
+
+    def tearDown(self):
+        Server.objects.delete()
+
+    def test_unwind_filter_on_unprojected_field(self):
+        vos, _ = Server.query(
+            only=["name", "nics"],
+            unwind={
+                "path": "nics",
+                "filter": [{"k": "state", "v": "RUNNING", "o": "eq"}],
+            },
+        )
+
+        self.assertEqual(
+            [vo.nics for vo in vos], [[{"ip": "10.0.0.1"}], [{"ip": "10.0.0.2"}]]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from spaceone.core.model.mongo_model.projection import (
+    plan_only_keys,
+    remove_duplicate_only_keys,
+    make_pipeline_projection,
+)
+
+
+class TestProjection(unittest.TestCase):
+    def test_remove_duplicate_only_keys(self):
+        only = ["data", "data.size", "name", "tags.a.b", "tags.a", "name"]
+        self.assertEqual(
+            remove_duplicate_only_keys(only), ["data", "name", "tags.a"]
+        )
+
+    def test_plan_only_keys(self):
+        only = ["name", "data.size"]
+        self.assertEqual(
+            plan_only_keys(only, ["-created_at", "+name"]),
+            ("name", "data.size", "created_at"),
+        )
+        self.assertEqual(only, ["name", "data.size"])
+        self.assertEqual(plan_only_keys(["data", "data.size"]), ("data",))
+
+    def test_make_pipeline_projection(self):
+        projection = make_pipeline_projection(
+            ["name", "data.size"],
+            lookup=[{"from": "user", "localField": "user_id", "foreignField": "id"}],
+            unwind={"path": "data.items"},
+            sort=[{"key": "created_at", "desc": True}],
+        )
+        self.assertEqual(
+            [field["key"] for field in projection["project"]["fields"]],
+            ["name", "data", "user_id", "created_at"],
+        )
+
+    def test_make_pipeline_projection_with_unwind_filter(self):
+        projection = make_pipeline_projection(
+            ["name"],
+            unwind={
+                "path": "data.items",
+                "filter": [
+                    {"key": "data.items.state", "value": "ENABLED", "operator": "eq"},
+                    {"k": "workspace_id", "v": "ws-1", "o": "eq"},
+                ],
+            },
+        )
+        self.assertEqual(
+            [field["key"] for field in projection["project"]["fields"]],
+            ["name", "data", "workspace_id"],
+        )
+
+    def test_make_pipeline_projection_without_local_field(self):
+        lookup = [{"from": "user", "let": {"id": "$user_id"}, "pipeline": []}]
+        self.assertIsNone(make_pipeline_projection(["name"], lookup=lookup))
+        self.assertIsNone(make_pipeline_projection([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
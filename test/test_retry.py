@@ -0,0 +1,215 @@
+import unittest
+from unittest import mock
+
+import grpc
+
+from spaceone.core.error import (
+    ERROR_GRPC_CONNECTION,
+    ERROR_GRPC_TIMEOUT,
+    ERROR_INTERNAL_API,
+)
+from spaceone.core.pygrpc.client import _ClientCallDetails, _ClientInterceptor
+from spaceone.core.pygrpc.retry import (
+    OPEN,
+    CLOSED,
+    CircuitBreaker,
+    RetryBudget,
+    RetryPolicy,
+)
+
+_RETRY_CONF = {
+    "max_retries": 2,
+    "initial_backoff": 0,
+    "idempotent_verbs": ["get"],
+}
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return "error details"
+
+
+class _Response(object):
+    pass
+
+
+def _make_call_details(method):
+    return _ClientCallDetails(method, None, [], None, None)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_idempotent_methods(self):
+        policy = RetryPolicy({"idempotent_verbs": ["get", "Job.create"]})
+
+        self.assertTrue(policy.is_idempotent("/spaceone.api.identity.v2.Domain/get"))
+        self.assertTrue(policy.is_idempotent("/spaceone.api.inventory.v1.Job/create"))
+        self.assertFalse(policy.is_idempotent("/spaceone.api.identity.v2.Domain/create"))
+
+    def test_backoff(self):
+        policy = RetryPolicy({"initial_backoff": 0.1, "max_backoff": 0.3})
+
+        for attempt in range(5):
+            self.assertLessEqual(policy.get_backoff(attempt), 0.3)
+            self.assertGreaterEqual(policy.get_backoff(attempt), 0)
+
+    def test_retry_budget(self):
+        budget = RetryBudget(ratio=0.1, max_tokens=2)
+
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+        for _ in range(11):
+            budget.deposit()
+
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+    def test_circuit_breaker(self):
+        breaker = CircuitBreaker({"failure_threshold": 2, "reset_timeout": 10})
+
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.record_failure())
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow_request())
+
+        # Let a probe request through after reset_timeout
+        breaker._opened_at -= 10
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+
+class TestClientRetry(unittest.TestCase):
+    def _make_interceptor(self, **client_conf):
+        client_conf.setdefault("retry", _RETRY_CONF)
+        return _ClientInterceptor({}, "identity:50051", {}, 10, client_conf)
+
+    def test_retry_idempotent_method(self):
+        interceptor = self._make_interceptor()
+        responses = [_RpcError(grpc.StatusCode.UNAVAILABLE), _Response()]
+        continuation = mock.Mock(side_effect=lambda *args: responses.pop(0))
+
+        response = interceptor.intercept_unary_unary(
+            continuation, _make_call_details("/test.v1.Domain/get"), {}
+        )
+
+        self.assertIsInstance(response, _Response)
+        self.assertEqual(continuation.call_count, 2)
+
+    def test_no_retry_for_non_idempotent_method(self):
+        interceptor = self._make_interceptor()
+        continuation = mock.Mock(return_value=_RpcError(grpc.StatusCode.UNAVAILABLE))
+
+        with self.assertRaises(ERROR_GRPC_CONNECTION):
+            interceptor.intercept_unary_unary(
+                continuation, _make_call_details("/test.v1.Domain/create"), {}
+            )
+
+        self.assertEqual(continuation.call_count, 1)
+
+    def test_no_retry_for_application_error(self):
+        interceptor = self._make_interceptor()
+        continuation = mock.Mock(return_value=_RpcError(grpc.StatusCode.NOT_FOUND))
+
+        with self.assertRaises(ERROR_INTERNAL_API):
+            interceptor.intercept_unary_unary(
+                continuation, _make_call_details("/test.v1.Domain/get"), {}
+            )
+
+        self.assertEqual(continuation.call_count, 1)
+
+    def test_retry_budget_exhausted(self):
+        interceptor = self._make_interceptor(
+            retry={**_RETRY_CONF, "budget_max_tokens": 1},
+            circuit_breaker={"enabled": False},
+        )
+        continuation = mock.Mock(return_value=_RpcError(grpc.StatusCode.UNAVAILABLE))
+
+        for _ in range(2):
+            with self.assertRaises(ERROR_GRPC_CONNECTION):
+                interceptor.intercept_unary_unary(
+                    continuation, _make_call_details("/test.v1.Domain/get"), {}
+                )
+
+        # Only one retry is allowed by the budget
+        self.assertEqual(continuation.call_count, 3)
+
+    def test_circuit_breaker_fails_fast(self):
+        interceptor = self._make_interceptor(
+            circuit_breaker={"failure_threshold": 3, "reset_timeout": 10}
+        )
+        continuation = mock.Mock(return_value=_RpcError(grpc.StatusCode.UNAVAILABLE))
+
+        with self.assertRaises(ERROR_GRPC_CONNECTION):
+            interceptor.intercept_unary_unary(
+                continuation, _make_call_details("/test.v1.Domain/get"), {}
+            )
+
+        with self.assertRaises(ERROR_GRPC_CONNECTION):
+            interceptor.intercept_unary_unary(
+                continuation, _make_call_details("/test.v1.Domain/get"), {}
+            )
+
+        self.assertEqual(continuation.call_count, 3)
+
+    def test_circuit_breaker_ignores_timeout(self):
+        interceptor = self._make_interceptor(
+            circuit_breaker={"failure_threshold": 1, "reset_timeout": 10}
+        )
+        continuation = mock.Mock(
+            return_value=_RpcError(grpc.StatusCode.DEADLINE_EXCEEDED)
+        )
+
+        for _ in range(2):
+            with self.assertRaises(ERROR_GRPC_TIMEOUT):
+                interceptor.intercept_unary_unary(
+                    continuation, _make_call_details("/test.v1.Domain/create"), {}
+                )
+
+        self.assertEqual(interceptor._circuit_breaker.state, CLOSED)
+
+    def test_circuit_breaker_with_stream(self):
+        interceptor = self._make_interceptor(
+            circuit_breaker={"failure_threshold": 1, "reset_timeout": 10}
+        )
+
+        def unavailable_stream(*args):
+            raise _RpcError(grpc.StatusCode.UNAVAILABLE)
+            yield
+
+        responses = interceptor.intercept_unary_stream(
+            mock.Mock(side_effect=lambda *args: unavailable_stream()),
+            _make_call_details("/test.v1.Domain/stat"),
+            {},
+        )
+        with self.assertRaises(ERROR_GRPC_CONNECTION):
+            list(responses)
+
+        self.assertEqual(interceptor._circuit_breaker.state, OPEN)
+
+        # A probe stream which receives a response closes the circuit
+        interceptor._circuit_breaker._opened_at -= 10
+        responses = interceptor.intercept_unary_stream(
+            mock.Mock(return_value=iter([_Response(), _Response()])),
+            _make_call_details("/test.v1.Domain/stat"),
+            {},
+        )
+        next(responses)
+        responses.close()
+
+        self.assertEqual(interceptor._circuit_breaker.state, CLOSED)
+
+
+if __name__ == "__main__":
+    unittest.main()
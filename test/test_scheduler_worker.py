@@ -0,0 +1,74 @@
+import signal
+import unittest
+from unittest import mock
+
+from spaceone.core import queue
+from spaceone.core.queue import BaseQueue
+from spaceone.core.scheduler.worker import BaseWorker
+
+_TASK = b'{"name": "test_task", "stages": []}'
+
+
+class TestBaseWorker(unittest.TestCase):
+    def setUp(self):
+        self.worker = BaseWorker("test_queue")
+
+        patches = [
+            mock.patch("spaceone.core.scheduler.worker.set_logger"),
+            mock.patch("spaceone.core.scheduler.worker.flush_tracer"),
+            mock.patch("spaceone.core.scheduler.worker.flush_metric"),
+            mock.patch("spaceone.core.scheduler.worker.flush_logger"),
+            mock.patch("spaceone.core.scheduler.worker.signal.signal"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _run(self, get) -> mock.Mock:
+        with mock.patch("spaceone.core.scheduler.worker.queue.get") as queue_get:
+            with mock.patch(
+                "spaceone.core.scheduler.worker.SpaceoneTask.execute"
+            ) as execute:
+                queue_get.side_effect = get
+                self.worker.run()
+
+        return execute
+
+    def _stop_and_return(self, task):
+        def get(*args, **kwargs):
+            # SIGTERM arrives after a task is dequeued
+            self.worker._handle_signal(signal.SIGTERM, None)
+            return task
+
+        return get
+
+    def test_dequeued_task_runs_after_sigterm(self):
+        execute = self._run(self._stop_and_return(_TASK))
+
+        execute.assert_called_once()
+
+    def test_idle_worker_stops_after_sigterm(self):
+        execute = self._run(self._stop_and_return(None))
+
+        execute.assert_not_called()
+
+    def test_legacy_queue_backend(self):
+        worker = self.worker
+
+        class LegacyQueue(BaseQueue):
+            # Written against the old BaseQueue.get(self) signature
+            def get(self):
+                worker._handle_signal(signal.SIGTERM, None)
+                return _TASK
+
+        with mock.patch.dict(queue._QUEUE_CONNECTIONS, {"test_queue": LegacyQueue()}):
+            with mock.patch(
+                "spaceone.core.scheduler.worker.SpaceoneTask.execute"
+            ) as execute:
+                self.worker.run()
+
+        execute.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+from unittest import mock
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from spaceone.core import config
+from spaceone.core.handler import BaseMutationHandler, _HANDLER_INFO
+from spaceone.core.service import (
+    BaseService,
+    _PIPELINES,
+    mutation_handler,
+    transaction,
+)
+
+
+class _MutationHandler(BaseMutationHandler):
+    def request(self, params: dict) -> dict:
+        params["mutated"] = True
+        return params
+
+
+class _PlainService(BaseService):
+    resource = "Plain"
+
+    @transaction
+    def get(self, params: dict) -> dict:
+        return params
+
+
+@mutation_handler
+class _MutatedService(BaseService):
+    resource = "Mutated"
+
+    @transaction
+    def get(self, params: dict) -> dict:
+        return params
+
+    @transaction(exclude=["mutation"])
+    def list(self, params: dict) -> dict:
+        return params
+
+
+class TestServicePipeline(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.set_default_conf()
+
+    def setUp(self):
+        self._handler_info = dict(_HANDLER_INFO)
+        _HANDLER_INFO.update({"init": True, "mutation": [_MutationHandler({})]})
+        _PIPELINES.clear()
+
+        self.exporter = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self._tracer_patch = mock.patch(
+            "spaceone.core.service._TRACER", tracer_provider.get_tracer(__name__)
+        )
+        self._tracer_patch.start()
+
+    def tearDown(self):
+        self._tracer_patch.stop()
+        _HANDLER_INFO.update(self._handler_info)
+        _PIPELINES.clear()
+
+    def _get_span_names(self) -> list:
+        return [span.name for span in self.exporter.get_finished_spans()]
+
+    def test_pipeline_is_compiled_once(self):
+        service = _MutatedService()
+
+        with mock.patch("spaceone.core.service.get_mutation_handlers") as get_handlers:
+            get_handlers.return_value = [_MutationHandler({})]
+
+            self.assertEqual(service.get({}), {"mutated": True})
+            self.assertEqual(service.get({}), {"mutated": True})
+
+        get_handlers.assert_called_once()
+
+    def test_excluded_handler(self):
+        self.assertEqual(_MutatedService().list({}), {})
+
+    def test_pipeline_without_handlers(self):
+        self.assertEqual(_PlainService().get({"name": "test"}), {"name": "test"})
+
+        self.assertEqual(self._get_span_names(), ["Body", "Plain.get"])
+
+    def test_handler_span(self):
+        _MutatedService().get({})
+
+        self.assertIn("_MutationHandler", self._get_span_names())
+
+    def test_payload_log_sampling(self):
+        config.set_global(LOG_PAYLOAD_SAMPLE_RATE=0.0)
+
+        try:
+            with self.assertLogs("spaceone.core.service", "INFO") as logs:
+                _PlainService().get({"results": ["a" * 10]})
+        finally:
+            config.set_global(LOG_PAYLOAD_SAMPLE_RATE=1.0)
+
+        request_record, response_record = logs.records
+        self.assertIsNone(request_record.parameter)
+        self.assertNotIn("Size", response_record.getMessage())
+
+    def test_payload_log(self):
+        params = {"results": ["a" * 10]}
+
+        with self.assertLogs("spaceone.core.service", "INFO") as logs:
+            _PlainService().get(params)
+
+        request_record, response_record = logs.records
+        self.assertEqual(request_record.parameter, params)
+        self.assertIsNot(request_record.parameter, params)
+        self.assertIn("Size = 27 bytes", response_record.getMessage())
+
+    def test_handler_span_disabled(self):
+        config.set_global(OTEL={"handler_span_enabled": False})
+
+        try:
+            _MutatedService().get({})
+        finally:
+            config.set_global(OTEL={"handler_span_enabled": True})
+
+        span_names = self._get_span_names()
+        self.assertIn("PreProcessing", span_names)
+        self.assertNotIn("_MutationHandler", span_names)
+
+
+if __name__ == "__main__":
+    unittest.main()
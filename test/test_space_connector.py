@@ -0,0 +1,245 @@
+import asyncio
+import threading
+import unittest
+from concurrent import futures
+from unittest import mock
+
+import grpc
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
+from grpc_reflection.v1alpha import reflection
+
+from spaceone.core import config, pygrpc
+from spaceone.core.connector.space_connector import (
+    AsyncSpaceConnector,
+    SpaceConnector,
+)
+from spaceone.core.error import ERROR_BASE
+from spaceone.core.pygrpc.server import _ServerInterceptor
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+_SERVING = health_pb2.HealthCheckResponse.SERVING
+_NOT_SERVING = health_pb2.HealthCheckResponse.NOT_SERVING
+
+
+class _HealthServicer(health.HealthServicer):
+    check_count = 0
+
+    def Check(self, request, context):
+        _HealthServicer.check_count += 1
+        return super().Check(request, context)
+
+
+class TestSpaceConnector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.set_default_conf()
+
+        health_servicer = _HealthServicer()
+        health_servicer.set("identity", _SERVING)
+        health_servicer.set("inventory", _NOT_SERVING)
+
+        cls.server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        health_pb2_grpc.add_HealthServicer_to_server(health_servicer, cls.server)
+        reflection.enable_server_reflection(
+            [health_pb2.DESCRIPTOR.services_by_name["Health"].full_name], cls.server
+        )
+        port = cls.server.add_insecure_port("127.0.0.1:0")
+        cls.server.start()
+        cls.endpoint = f"grpc://127.0.0.1:{port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop(None)
+
+    def test_dispatch_many(self):
+        connector = SpaceConnector(endpoint=self.endpoint)
+
+        results = connector.dispatch_many(
+            [
+                ("Health.Check", {"service": "identity"}),
+                ("Health.Check", {"service": "inventory"}),
+                ("Health.Check", {"service": "identity"}),
+            ],
+            concurrency=2,
+        )
+
+        self.assertEqual(
+            [result["status"] for result in results],
+            ["SERVING", "NOT_SERVING", "SERVING"],
+        )
+
+    def test_dispatch_many_errors(self):
+        connector = SpaceConnector(endpoint=self.endpoint)
+        requests = [
+            ("Health.Check", {"service": "identity"}),
+            ("Health.Check", {"service": "unknown"}),
+        ]
+
+        with self.assertRaises(ERROR_BASE):
+            connector.dispatch_many(requests)
+
+        results = connector.dispatch_many(requests, return_exceptions=True)
+        self.assertEqual(results[0]["status"], "SERVING")
+        self.assertIsInstance(results[1], ERROR_BASE)
+
+    def test_transaction_memo(self):
+        memo_conf = {"enabled": True, "verbs": ["Check"]}
+        config.set_global_force(CONNECTORS={"SpaceConnector": {"memo": memo_conf}})
+        create_transaction(thread_id=str(threading.current_thread().ident))
+
+        try:
+            connector = SpaceConnector(endpoint=self.endpoint)
+            check_count = _HealthServicer.check_count
+
+            response = connector.dispatch("Health.Check", {"service": "identity"})
+            response["status"] = "CHANGED"
+            response = connector.dispatch("Health.Check", {"service": "identity"})
+            connector.dispatch("Health.Check", {"service": "inventory"})
+
+            self.assertEqual(response["status"], "SERVING")
+            self.assertEqual(_HealthServicer.check_count, check_count + 2)
+
+            delete_transaction()
+            create_transaction(thread_id=str(threading.current_thread().ident))
+            connector.dispatch("Health.Check", {"service": "identity"})
+            self.assertEqual(_HealthServicer.check_count, check_count + 3)
+        finally:
+            delete_transaction()
+            config.set_global_force(CONNECTORS={})
+
+    def test_transaction_memo_after_write(self):
+        memo_conf = {"enabled": True, "verbs": ["Check"]}
+        config.set_global_force(CONNECTORS={"SpaceConnector": {"memo": memo_conf}})
+        create_transaction(thread_id=str(threading.current_thread().ident))
+
+        try:
+            connector = SpaceConnector(endpoint=self.endpoint)
+            check_count = _HealthServicer.check_count
+
+            connector.dispatch("Health.Check", {"service": "identity"})
+
+            # Any verb which is not memoized is handled as a write
+            connector.dispatch("Health.Watch", {"service": "identity"}).close()
+
+            connector.dispatch("Health.Check", {"service": "identity"})
+            self.assertEqual(_HealthServicer.check_count, check_count + 2)
+        finally:
+            delete_transaction()
+            config.set_global_force(CONNECTORS={})
+
+    def test_batch_method_conf(self):
+        batch_conf = {"methods": {"Health.Check": {"key": "service"}}}
+        config.set_global_force(CONNECTORS={"SpaceConnector": {"batch": batch_conf}})
+
+        try:
+            connector = SpaceConnector(endpoint=self.endpoint)
+
+            self.assertEqual(
+                connector._get_batch_method_conf("Health.Check", {"service": "a"}),
+                {"key": "service"},
+            )
+
+            # The query of the caller would be replaced by the batch list query
+            self.assertIsNone(
+                connector._get_batch_method_conf(
+                    "Health.Check", {"service": "a", "query": {"only": ["name"]}}
+                )
+            )
+        finally:
+            config.set_global_force(CONNECTORS={})
+
+    def test_passthrough(self):
+        connector = SpaceConnector(endpoint=self.endpoint, return_type="bytes")
+
+        response = connector.dispatch("Health.Check", {"service": "identity"})
+        self.assertIsInstance(response, bytes)
+        self.assertEqual(
+            health_pb2.HealthCheckResponse.FromString(response).status, _SERVING
+        )
+
+    def test_passthrough_relay(self):
+        endpoint = self.endpoint
+
+        def watch(request, context):
+            connector = SpaceConnector(endpoint=endpoint, return_type="bytes")
+            response_iterator = connector.dispatch(
+                "Health.Watch", {"service": "identity"}
+            )
+            yield next(response_iterator)
+            response_iterator.close()
+
+        # Relayed bytes bypass the response serializer of the relay server
+        handler = grpc.unary_stream_rpc_method_handler(
+            watch,
+            request_deserializer=health_pb2.HealthCheckRequest.FromString,
+            response_serializer=health_pb2.HealthCheckResponse.SerializeToString,
+        )
+        relay_server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=2),
+            interceptors=(_ServerInterceptor(),),
+        )
+        relay_server.add_generic_rpc_handlers(
+            (grpc.method_handlers_generic_handler("test.Relay", {"Watch": handler}),)
+        )
+        port = relay_server.add_insecure_port("127.0.0.1:0")
+        relay_server.start()
+
+        try:
+            with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+                relay_watch = channel.unary_stream(
+                    "/test.Relay/Watch",
+                    request_serializer=health_pb2.HealthCheckRequest.SerializeToString,
+                    response_deserializer=health_pb2.HealthCheckResponse.FromString,
+                )
+                responses = list(relay_watch(health_pb2.HealthCheckRequest()))
+        finally:
+            relay_server.stop(None)
+
+        self.assertEqual([response.status for response in responses], [_SERVING])
+
+    def test_async_dispatch(self):
+        connector = AsyncSpaceConnector(endpoint=self.endpoint)
+
+        async def dispatch():
+            response = await connector.dispatch(
+                "Health.Check", {"service": "identity"}
+            )
+            results = await connector.dispatch_many(
+                [
+                    ("Health.Check", {"service": "inventory"}),
+                    ("Health.Check", {"service": "unknown"}),
+                ],
+                return_exceptions=True,
+            )
+            return response, results
+
+        response, results = asyncio.run(dispatch())
+
+        self.assertEqual(response["status"], "SERVING")
+        self.assertEqual(results[0]["status"], "NOT_SERVING")
+        self.assertIsInstance(results[1], ERROR_BASE)
+
+    def test_async_client_is_created_off_loop(self):
+        client_threads = []
+        create_client = pygrpc.client
+
+        def client(*args, **kwargs):
+            client_threads.append(threading.current_thread())
+            return create_client(*args, **kwargs)
+
+        async def dispatch():
+            connector = AsyncSpaceConnector(endpoint=self.endpoint)
+            self.assertEqual(client_threads, [])
+
+            return await connector.dispatch("Health.Check", {"service": "identity"})
+
+        with mock.patch.object(pygrpc, "client", side_effect=client):
+            response = asyncio.run(dispatch())
+
+        self.assertEqual(response["status"], "SERVING")
+        self.assertEqual(len(client_threads), 1)
+        self.assertIsNot(client_threads[0], threading.main_thread())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from spaceone.core.error import ERROR_REQUEST_TIMEOUT
+from spaceone.core.pygrpc.client import _ClientInterceptor
+from spaceone.core.transaction import (
+    create_transaction,
+    delete_transaction,
+    get_time_remaining,
+    get_transaction,
+)
+
+
+def _create_transaction(meta):
+    return create_transaction(
+        meta=meta, thread_id=str(threading.current_thread().ident)
+    )
+
+
+class TestDeadline(unittest.TestCase):
+    def tearDown(self):
+        delete_transaction()
+
+    def test_no_deadline(self):
+        _create_transaction(meta={"token": "token-123"})
+
+        self.assertIsNone(get_time_remaining())
+        self.assertEqual(_ClientInterceptor._get_timeout(180), 180)
+
+    def test_time_remaining(self):
+        _create_transaction(meta={"deadline": time.time() + 10})
+
+        self.assertAlmostEqual(get_time_remaining(), 10, delta=1)
+        self.assertLessEqual(_ClientInterceptor._get_timeout(180), 10)
+        self.assertEqual(_ClientInterceptor._get_timeout(5), 5)
+        self.assertLessEqual(_ClientInterceptor._get_timeout(None), 10)
+
+    def test_expired_deadline(self):
+        transaction = _create_transaction(meta={"deadline": time.time() - 1})
+
+        self.assertEqual(get_time_remaining(), 0)
+        with self.assertRaises(ERROR_REQUEST_TIMEOUT):
+            transaction.check_deadline()
+
+        with self.assertRaises(ERROR_REQUEST_TIMEOUT):
+            _ClientInterceptor._get_timeout(180)
+
+
+class TestAsyncTransaction(unittest.TestCase):
+    def test_transaction_per_task(self):
+        async def handle_request(token):
+            create_transaction(meta={"token": token})
+            try:
+                # Another request runs on the same thread while waiting
+                await asyncio.sleep(0.01)
+                return get_transaction().meta["token"]
+            finally:
+                delete_transaction()
+
+        async def handle_requests():
+            return await asyncio.gather(
+                handle_request("token-1"), handle_request("token-2")
+            )
+
+        self.assertEqual(asyncio.run(handle_requests()), ["token-1", "token-2"])
+
+    def test_created_transaction_is_not_shared_with_tasks(self):
+        async def get_token(token):
+            get_transaction().set_meta("token", token)
+            await asyncio.sleep(0.01)
+            return get_transaction().meta["token"]
+
+        async def handle_requests():
+            return await asyncio.gather(get_token("token-1"), get_token("token-2"))
+
+        self.assertEqual(asyncio.run(handle_requests()), ["token-1", "token-2"])
+        self.assertIsNone(get_transaction(is_create=False))
+
+
+if __name__ == "__main__":
+    unittest.main()